@@ -0,0 +1,3 @@
+"""
+Benchmarks for pyautomata, run with python -m benchmarks.run
+"""
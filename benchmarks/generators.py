@@ -0,0 +1,170 @@
+"""
+Seeded generators of synthetic automata and word workloads
+The same arguments always generate the same automata and words
+"""
+import random
+import string
+from typing import Dict, Iterable, List, Set, Tuple, Union
+
+Description = Dict[str, Union[str, Set[str]]]
+ProgramFunction = Dict[Tuple[str, str], str]
+
+
+def make_alphabet(n_symbols: int) -> List[str]:
+    """
+    Single letters when they are enough, s0, s1, ... otherwise
+    """
+    if n_symbols <= len(string.ascii_lowercase):
+        return list(string.ascii_lowercase[:n_symbols])
+    return [f"s{c}" for c in range(n_symbols)]
+
+
+def random_dfa(
+    n_states: int,
+    n_symbols: int = 2,
+    density: float = 0.9,
+    unreachable: float = 0.0,
+    useless: float = 0.0,
+    final: float = 0.3,
+    seed: int = 0,
+) -> Tuple[Description, ProgramFunction]:
+    """
+    Generates a random DFA, returned as (description, program function)
+    like AutomataParser.parse
+    density is the chance each (state, symbol) has a transition,
+    unreachable and useless are the fractions of states that can't be
+    reached from the initial state and that can't reach a final state
+    Every other state is reachable, through a random spanning tree
+    """
+    rng = random.Random(seed)
+    alphabet = make_alphabet(n_symbols)
+    n_unreachable = int(n_states * unreachable)
+    n_useless = int(n_states * useless)
+    n_core = max(1, n_states - n_unreachable - n_useless)
+    core = [f"q{i}" for i in range(n_core)]
+    useless_states = [f"d{i}" for i in range(n_useless)]
+    unreachable_states = [f"u{i}" for i in range(n_unreachable)]
+    program_function: ProgramFunction = {}
+    # the spanning tree makes every core state reachable
+    free_slots = [(core[0], c) for c in alphabet]
+    for state in core[1:]:
+        slot = free_slots.pop(rng.randrange(len(free_slots)))
+        program_function[slot] = state
+        free_slots.extend((state, c) for c in alphabet)
+    core_targets = core + useless_states
+    for state in core:
+        for c in alphabet:
+            if (state, c) not in program_function and rng.random() < density:
+                program_function[(state, c)] = rng.choice(core_targets)
+    # useless states only lead to useless states
+    for state in useless_states:
+        for c in alphabet:
+            if rng.random() < density:
+                program_function[(state, c)] = rng.choice(useless_states)
+    every_state = core + useless_states + unreachable_states
+    for state in unreachable_states:
+        for c in alphabet:
+            if rng.random() < density:
+                program_function[(state, c)] = rng.choice(every_state)
+    final_states = {s for s in core if rng.random() < final} or {core[-1]}
+    description: Description = {
+        "name": "RANDOM",
+        "states": set(every_state),
+        "alphabet": set(alphabet),
+        "initial_state": core[0],
+        "final_states": final_states,
+    }
+    return description, program_function
+
+
+def automata_text(
+    description: Description, program_function: ProgramFunction
+) -> Iterable[str]:
+    """
+    Yields the lines of the automata in the file format AutomataParser reads
+    """
+    states = ",".join(sorted(description["states"]))
+    alphabet = ",".join(sorted(description["alphabet"]))
+    final_states = ",".join(sorted(description["final_states"]))
+    yield (
+        f"{description['name']}=({{{states}}},{{{alphabet}}},Prog,"
+        f"{description['initial_state']},{{{final_states}}})\n"
+    )
+    yield "Prog\n"
+    for (state, c), result_state in program_function.items():
+        yield f"({state},{c})={result_state}\n"
+
+
+def write_automata(
+    file_name: str,
+    description: Description,
+    program_function: ProgramFunction,
+) -> None:
+    """
+    Writes the automata to a file in the format AutomataParser reads
+    """
+    with open(file_name, "w", encoding="utf-8") as f:
+        f.writelines(automata_text(description, program_function))
+
+
+def random_words(
+    alphabet: Iterable[str],
+    count: int,
+    min_length: int = 0,
+    max_length: int = 20,
+    seed: int = 0,
+) -> List[str]:
+    """
+    Generates words of uniformly random symbols and lengths
+    """
+    rng = random.Random(seed)
+    symbols = sorted(alphabet)
+    return [
+        "".join(
+            rng.choice(symbols)
+            for _ in range(rng.randint(min_length, max_length))
+        )
+        for _ in range(count)
+    ]
+
+
+def walk_words(
+    description: Description,
+    program_function: ProgramFunction,
+    count: int,
+    max_length: int = 20,
+    seed: int = 0,
+) -> List[str]:
+    """
+    Generates words by random walks from the initial state, stopping
+    at random or on an undefined transition, so a realistic share of
+    them is accepted
+    """
+    rng = random.Random(seed)
+    symbols = sorted(description["alphabet"])
+    words = []
+    for _ in range(count):
+        state = description["initial_state"]
+        word = []
+        for _ in range(rng.randint(0, max_length)):
+            c = rng.choice(symbols)
+            state = program_function.get((state, c))
+            if state is None:
+                break
+            word.append(c)
+        words.append("".join(word))
+    return words
+
+
+def write_word_pairs(file_name: str, words: List[str], seed: int = 0) -> int:
+    """
+    Writes the words, randomly paired, in the word pairs file format
+    Returns how many pairs were written
+    """
+    rng = random.Random(seed)
+    shuffled = list(words)
+    rng.shuffle(shuffled)
+    with open(file_name, "w", encoding="utf-8") as f:
+        for word1, word2 in zip(words, shuffled):
+            f.write(f"{word1},{word2}\n")
+    return len(words)
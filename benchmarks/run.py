@@ -0,0 +1,329 @@
+"""
+Runs the timed benchmark scenarios over generated workloads and
+writes the results as JSON, to be compared across commits
+Run from the repository root:
+python -m benchmarks.run --states 20000 --output before.json
+python -m benchmarks.run --states 20000 --compare before.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.generators import (
+    random_dfa,
+    random_words,
+    walk_words,
+    write_automata,
+    write_word_pairs,
+)
+from pyautomata import AutomataParser, MinimizedAutomata, WordFileParser
+from pyautomata.core.verification import verify_pairs
+
+# the table filling algorithms are quadratic, skipped above these
+TABLE_FILLING_MAX_STATES = 2000
+PACKED_TABLE_FILLING_MAX_STATES = 8000
+
+
+def best_time(
+    function: Callable[[], object],
+    repeat: int,
+    setup: Optional[Callable[[], None]] = None,
+) -> float:
+    """
+    Runs the function repeat times, returns the fastest run in seconds
+    setup runs before each run, untimed
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def current_commit() -> Optional[str]:
+    """
+    Returns the git commit being benchmarked, if there's one
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Suite:
+    """
+    The benchmark scenarios, all sharing one generated workload
+    """
+
+    def __init__(self, args: argparse.Namespace, directory: str) -> None:
+        self.args = args
+        self.results: List[Dict[str, object]] = []
+        self.description, self.program_function = random_dfa(
+            args.states,
+            args.symbols,
+            density=args.density,
+            unreachable=args.unreachable,
+            useless=args.useless,
+            seed=args.seed,
+        )
+        self.automata_file = os.path.join(directory, "automata.txt")
+        write_automata(
+            self.automata_file, self.description, self.program_function
+        )
+        self.minimized = self.fresh_automata()
+        self.minimized.minimize()
+        self.words = walk_words(
+            self.description,
+            self.program_function,
+            args.words,
+            max_length=args.max_length,
+            seed=args.seed,
+        )
+        # uniformly random symbols, most of them are rejected
+        self.random_words = random_words(
+            self.description["alphabet"],
+            args.words,
+            max_length=args.max_length,
+            seed=args.seed,
+        )
+        self.pairs_file = os.path.join(directory, "pairs.txt")
+        write_word_pairs(self.pairs_file, self.words, seed=args.seed)
+
+    def record(self, scenario: str, seconds: float, items: int, unit: str):
+        """
+        Stores a result and prints it
+        """
+        self.results.append(
+            {
+                "scenario": scenario,
+                "seconds": seconds,
+                "items": items,
+                "unit": unit,
+                "per_second": items / seconds if seconds else None,
+            }
+        )
+        print(
+            f"{scenario:<48} {seconds:>10.4f}s "
+            f"{items / seconds if seconds else 0:>16,.0f} {unit}/s",
+            file=sys.stderr,
+        )
+
+    def fresh_automata(self) -> MinimizedAutomata:
+        """
+        Returns a new, unminimized copy of the generated automata
+        """
+        description = {
+            key: set(value) if isinstance(value, set) else value
+            for key, value in self.description.items()
+        }
+        return MinimizedAutomata(dict(self.program_function), **description)
+
+    def parse(self):
+        """
+        AutomataParser.parse over the generated file
+        """
+        seconds = best_time(
+            lambda: AutomataParser(file_name=self.automata_file).parse(),
+            self.args.repeat,
+        )
+        transitions = len(self.program_function)
+        self.record("parse", seconds, transitions, "transitions")
+
+    def minimization(self):
+        """
+        Each minimization step, in the order minimize runs them
+        """
+        algorithms = ["hopcroft"]
+        if self.args.states <= TABLE_FILLING_MAX_STATES:
+            algorithms.append("table_filling")
+        if self.args.states <= PACKED_TABLE_FILLING_MAX_STATES:
+            algorithms.append("packed_table_filling")
+        for algorithm in algorithms:
+            timings: Dict[str, float] = {}
+            for _ in range(self.args.repeat):
+                aut = self.fresh_automata()
+                steps = [
+                    ("unreacheable_states", aut.unreacheable_states),
+                    ("remove_unreacheable", None),
+                    ("unify_states", lambda: aut.unify_states(algorithm)),
+                    ("useless_states", aut.useless_states),
+                    ("remove_useless", None),
+                ]
+                found = set()
+                for name, step in steps:
+                    start = time.perf_counter()
+                    if step is None:
+                        aut.remove_states(found)
+                    else:
+                        found = step() or set()
+                    elapsed = time.perf_counter() - start
+                    timings[name] = min(timings.get(name, elapsed), elapsed)
+            for name, seconds in timings.items():
+                self.record(
+                    f"minimize.{algorithm}.{name}",
+                    seconds,
+                    len(self.program_function),
+                    "transitions",
+                )
+
+    def table_filling(self):
+        """
+        Both table filling algorithms over the same automata, of
+        --table-filling-states states whatever --states is
+        """
+        n_states = self.args.table_filling_states
+        description, program_function = random_dfa(
+            n_states,
+            self.args.symbols,
+            density=self.args.density,
+            seed=self.args.seed,
+        )
+        aut = MinimizedAutomata(program_function, **description)
+        for algorithm in ("table_filling", "packed_table_filling"):
+            function = getattr(aut, f"{algorithm}_algorithm")
+            self.record(
+                f"table_filling.{algorithm}",
+                best_time(function, self.args.repeat),
+                n_states * (n_states - 1) // 2,
+                "pairs",
+            )
+
+    def membership(self):
+        """
+        Checking the generated words one by one and in batch,
+        check_word is timed over the walked words and the random ones
+        """
+        aut = self.fresh_automata()
+        symbols = sum(len(word) for word in self.words)
+        repeat = self.args.repeat
+        workloads = [("", self.words), (".random", self.random_words)]
+        for suffix, words in workloads:
+            self.record(
+                f"check_word.dict{suffix}",
+                best_time(lambda: [aut.check_word(w) for w in words], repeat),
+                sum(len(word) for word in words),
+                "symbols",
+            )
+        aut.compile()
+        for suffix, words in workloads:
+            self.record(
+                f"check_word.compiled{suffix}",
+                best_time(lambda: [aut.check_word(w) for w in words], repeat),
+                sum(len(word) for word in words),
+                "symbols",
+            )
+        self.record(
+            "accepts.compiled",
+            best_time(lambda: [aut.accepts(w) for w in self.words], repeat),
+            symbols,
+            "symbols",
+        )
+        self.record(
+            "check_words",
+            best_time(lambda: aut.check_words(self.words), repeat),
+            symbols,
+            "symbols",
+        )
+
+    def pairs(self):
+        """
+        Streaming the pairs file and verifying every pair
+        """
+        aut = self.minimized
+
+        def verify():
+            wfp = WordFileParser(file_name=self.pairs_file)
+            verify_pairs(aut, wfp.iter_parse(), workers=self.args.workers)
+
+        self.record(
+            f"verify_pairs.workers_{self.args.workers}",
+            best_time(verify, self.args.repeat),
+            len(self.words),
+            "pairs",
+        )
+
+
+SCENARIOS = ["parse", "minimization", "table_filling", "membership", "pairs"]
+
+
+def compare(results: List[Dict[str, object]], file_name: str) -> None:
+    """
+    Prints the speedup of each scenario against older results
+    """
+    with open(file_name, encoding="utf-8") as f:
+        before = {r["scenario"]: r for r in json.load(f)["results"]}
+    for result in results:
+        old = before.get(result["scenario"])
+        if old is None:
+            continue
+        print(
+            f"{result['scenario']:<48} "
+            f"{old['seconds'] / result['seconds']:>6.2f}x",
+            file=sys.stderr,
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Parses the arguments, runs the chosen scenarios, writes the results
+    """
+    arg_parser = argparse.ArgumentParser(
+        description="Benchmarks for pyautomata"
+    )
+    arg_parser.add_argument("--states", type=int, default=5000)
+    arg_parser.add_argument("--symbols", type=int, default=2)
+    arg_parser.add_argument("--density", type=float, default=0.9)
+    arg_parser.add_argument("--table-filling-states", type=int, default=2000)
+    arg_parser.add_argument("--unreachable", type=float, default=0.1)
+    arg_parser.add_argument("--useless", type=float, default=0.1)
+    arg_parser.add_argument("--words", type=int, default=20000)
+    arg_parser.add_argument("--max-length", type=int, default=30)
+    arg_parser.add_argument("--workers", type=int, default=1)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument(
+        "--only", nargs="+", choices=SCENARIOS, default=SCENARIOS
+    )
+    arg_parser.add_argument("--output", help="write the JSON results here")
+    arg_parser.add_argument("--compare", help="JSON results to compare to")
+    args = arg_parser.parse_args(argv)
+    with tempfile.TemporaryDirectory() as directory:
+        suite = Suite(args, directory)
+        for scenario in args.only:
+            getattr(suite, scenario)()
+    report = {
+        "commit": current_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            key: value
+            for key, value in vars(args).items()
+            if key not in ("output", "compare", "only")
+        },
+        "results": suite.results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    if args.compare:
+        compare(suite.results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
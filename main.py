@@ -6,6 +6,7 @@ after installing the dependencies
 import PySimpleGUI as sg
 
 from pyautomata import AutomataGUI
+from pyautomata.gui import jobs
 
 
 def main():
@@ -14,15 +15,35 @@ def main():
     """
     gui = AutomataGUI()
     while True:
-        event, values = gui.read()
+        # the pair result window stays open while the pairs are checked
+        window, event, values = sg.read_all_windows()
+        if window is not gui.window:
+            gui.pair_result_event(window, event)
+            continue
         if event in (sg.WIN_CLOSED, "Close"):
+            gui.close()
             break
-        if event == "-AUTOMATA-SUBMIT-":
+        if event == "-AUTOMATA-SUBMIT-" and not gui.busy:
             gui.create_automata(values["-AUTOMATA-FILE-"])
-        elif event == "-WORD-FILE-SUBMIT-" and gui.automata:
+        elif event == "-WORD-FILE-SUBMIT-" and gui.automata and not gui.busy:
             gui.test_word_pairs(values["-WORD-FILE-"])
         elif event == "-WORD-BUT-" and gui.automata:
             gui.test_word(values["-WORD-INPUT-"])
+        elif event == "-CANCEL-":
+            gui.cancel_job()
+        # posted by the worker thread of the running job
+        elif event == jobs.PROGRESS_EVENT:
+            gui.update_progress(values[event])
+        elif event == jobs.AUTOMATA_DONE_EVENT:
+            gui.automata_created(values[event])
+        elif event == jobs.PAIRS_FOUND_EVENT:
+            gui.pairs_found(values[event])
+        elif event == jobs.PAIRS_DONE_EVENT:
+            gui.pairs_checked(values[event])
+        elif event == jobs.JOB_FAILED_EVENT:
+            gui.job_failed(values[event])
+        elif event == jobs.JOB_CANCELLED_EVENT:
+            gui.job_cancelled()
 
 
 if __name__ == "__main__":
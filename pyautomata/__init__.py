@@ -1,4 +1,20 @@
 from pyautomata.core.parser import AutomataParser, WordFileParser
 from pyautomata.core.automata import Automata
+from pyautomata.core.compiled import CompiledAutomata, load_compiled
 from pyautomata.core.minimization import MinimizedAutomata
-from pyautomata.gui.automata_gui import AutomataGUI
+from pyautomata.core.cache import MinimizationCache
+from pyautomata.core.product import ProductAutomata
+from pyautomata.core.automata_set import AutomataSet
+from pyautomata.core.equivalence import equivalent
+from pyautomata.core.instrumentation import Instrumentation, MetricsCollector
+
+
+def __getattr__(name):
+    # the GUI needs PySimpleGUI and Tkinter, so it's only
+    # imported when asked for, the core works without them
+    if name == "AutomataGUI":
+        # pylint: disable=import-outside-toplevel
+        from pyautomata.gui.automata_gui import AutomataGUI
+
+        return AutomataGUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,8 @@
+"""
+Runs the command line interface, see pyautomata.cli
+"""
+import sys
+
+from pyautomata.cli import main  # pylint: disable=import-error
+
+sys.exit(main())
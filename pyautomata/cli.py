@@ -0,0 +1,321 @@
+"""
+The command line interface, run with python -m pyautomata
+It minimizes automata files, checks words and verifies word pair
+files without the GUI, streaming the results to stdout
+and the throughput stats to stderr.
+"""
+import argparse
+import sys
+import time
+from collections import deque
+from typing import Deque, Iterator, List, Optional, TextIO, Tuple, Union
+
+from pyautomata.core.automata import Automata  # pylint: disable=import-error
+from pyautomata.core.cache import (  # pylint: disable=import-error
+    MinimizationCache,
+)
+from pyautomata.core.compiled import (  # pylint: disable=import-error
+    FILE_MAGIC,
+    CompiledAutomata,
+    load_compiled,
+)
+from pyautomata.core.instrumentation import (  # pylint: disable=import-error
+    MetricsCollector,
+)
+from pyautomata.core.minimization import (  # pylint: disable=import-error
+    NAMING_POLICIES,
+    MinimizedAutomata,
+)
+from pyautomata.core.parser import (  # pylint: disable=import-error
+    AutomataParser,
+    WordFileParser,
+)
+from pyautomata.core.verification import (  # pylint: disable=import-error
+    CHUNK_SIZE,
+    iter_check_words,
+    iter_verify_pairs,
+)
+
+
+class Stats:
+    """
+    Times a command and prints what it went through to stderr
+    """
+
+    def __init__(self, quiet: bool) -> None:
+        self.quiet = quiet
+        self.start = time.perf_counter()
+
+    def report(self, message: str, items: Optional[int] = None) -> None:
+        """
+        Prints the message with the time since the start,
+        and the items per second when items are given
+        """
+        if self.quiet:
+            return
+        seconds = time.perf_counter() - self.start
+        line = f"{message} in {seconds:.3f}s"
+        if items is not None and seconds > 0:
+            line += f" ({items / seconds:,.0f}/s)"
+        print(line, file=sys.stderr)
+
+
+def load_automata(file_name: str) -> Union[Automata, CompiledAutomata]:
+    """
+    Loads an automata file, either in the text format AutomataParser
+    reads or in the binary format written by Automata.save_compiled
+    """
+    with open(file_name, "rb") as f:
+        magic = f.read(len(FILE_MAGIC))
+    if magic == FILE_MAGIC:
+        return load_compiled(file_name)
+    description, program_function = AutomataParser(
+        file_name=file_name
+    ).parse()
+    return Automata(program_function, **description)
+
+
+def read_words(source: TextIO) -> Iterator[str]:
+    """
+    Yields the words of the source, one per line
+    """
+    for line in source:
+        yield line.rstrip("\r\n")
+
+
+def _report_invalid(line_number: int) -> None:
+    """
+    Tells on stderr that the line was skipped
+    """
+    print(
+        f"line {line_number}: word contains non-alphabet characters, "
+        "skipped",
+        file=sys.stderr,
+    )
+
+
+def _open_input(file_name: str) -> TextIO:
+    """
+    Opens the file, or returns stdin (left open after use) for -
+    """
+    if file_name == "-":
+        return open(  # pylint: disable=consider-using-with
+            sys.stdin.fileno(), encoding="utf-8", closefd=False
+        )
+    return open(  # pylint: disable=consider-using-with
+        file_name, encoding="utf-8"
+    )
+
+
+def minimize(args: argparse.Namespace) -> int:
+    """
+    Minimizes the automata file, writing it to the output
+    in the same format, optionally also as a binary file
+    """
+    stats = Stats(args.quiet)
+    metrics = MetricsCollector()
+    description, program_function = AutomataParser(
+        file_name=args.automata
+    ).parse()
+    stats.report(f"parsed {len(program_function)} transitions")
+    if args.cache:
+        # on a hit nothing is minimized, so no phases are reported
+        automata = MinimizationCache().minimize(
+            description,
+            program_function,
+            args.algorithm,
+            instrumentation=metrics,
+            naming=args.naming,
+        )
+    else:
+        automata = MinimizedAutomata(
+            program_function,
+            instrumentation=metrics,
+            naming=args.naming,
+            **description,
+        )
+        automata.minimize(args.algorithm)
+    if args.output == "-":
+        sys.stdout.writelines(automata.text_lines())
+        sys.stdout.flush()
+    else:
+        automata.save(args.output)
+    if args.compiled:
+        automata.save_compiled(args.compiled)
+    if not args.quiet:
+        for name, phase in metrics.snapshot()["phases"].items():
+            print(
+                f"  {name}: {phase['calls']} calls, "
+                f"{phase['seconds']:.3f}s",
+                file=sys.stderr,
+            )
+    stats.report(
+        f"minimized to {len(automata.states)} states, "
+        f"{len(automata.program_function)} transitions",
+        len(program_function),
+    )
+    return 0
+
+
+def check(args: argparse.Namespace) -> int:
+    """
+    Checks one word per line, writing each word
+    and whether it's accepted, tab separated
+    """
+    stats = Stats(args.quiet)
+    metrics = MetricsCollector()
+    automata = load_automata(args.automata)
+    output = sys.stdout
+    checked = accepted = 0
+    with _open_input(args.words) as source:
+        for line_number, (word, is_accepted) in enumerate(
+            iter_check_words(
+                automata,
+                read_words(source),
+                args.workers,
+                args.chunk_size,
+                metrics,
+            ),
+            1,
+        ):
+            if is_accepted is None:
+                _report_invalid(line_number)
+                continue
+            checked += 1
+            if is_accepted:
+                accepted += 1
+                output.write(f"{word}\taccepted\n")
+            elif not args.accepted_only:
+                output.write(f"{word}\trejected\n")
+    output.flush()
+    stats.report(
+        f"checked {checked} words, {accepted} accepted, "
+        f"{metrics.symbols} symbols",
+        checked,
+    )
+    return 0
+
+
+def pairs(args: argparse.Namespace) -> int:
+    """
+    Verifies a word pair file, writing the pairs that have
+    both words accepted in the same format
+    """
+    stats = Stats(args.quiet)
+    metrics = MetricsCollector()
+    automata = load_automata(args.automata)
+    output = sys.stdout
+    checked = accepted = 0
+    wfp = WordFileParser(file_name=args.pairs)
+    # the line of each pair in flight, results come in the same order
+    line_numbers: Deque[int] = deque()
+
+    def numbered_pairs() -> Iterator[Tuple[str, str]]:
+        for line_number, pair in wfp.iter_parse_lines():
+            line_numbers.append(line_number)
+            yield pair
+
+    for (word1, word2), is_accepted in iter_verify_pairs(
+        automata, numbered_pairs(), args.workers, args.chunk_size, metrics
+    ):
+        line_number = line_numbers.popleft()
+        if is_accepted is None:
+            _report_invalid(line_number)
+            continue
+        checked += 1
+        if is_accepted:
+            accepted += 1
+            output.write(f"{word1},{word2}\n")
+    output.flush()
+    stats.report(
+        f"verified {checked} pairs, {accepted} accepted, "
+        f"{metrics.words} words of {metrics.symbols} symbols checked",
+        checked,
+    )
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the argument parser with every subcommand
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m pyautomata",
+        description="Minimizes automata and checks words against them",
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="don't print stats"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    minimize_parser = subparsers.add_parser(
+        "minimize", help="minimize an automata file"
+    )
+    minimize_parser.add_argument("automata")
+    minimize_parser.add_argument(
+        "-o", "--output", default="-", help="where to write it, - for stdout"
+    )
+    minimize_parser.add_argument(
+        "--compiled", help="also save it in the binary format here"
+    )
+    minimize_parser.add_argument(
+        "--algorithm",
+        default="hopcroft",
+        choices=["hopcroft", "table_filling", "packed_table_filling"],
+    )
+    minimize_parser.add_argument(
+        "--naming",
+        default="concatenate",
+        choices=NAMING_POLICIES,
+        help="how merged states are named",
+    )
+    minimize_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="use the on-disk minimization cache",
+    )
+    minimize_parser.set_defaults(function=minimize)
+
+    for name, function, help_text in (
+        ("check", check, "check words, one per line"),
+        ("pairs", pairs, "verify a word pair file"),
+    ):
+        subparser = subparsers.add_parser(name, help=help_text)
+        subparser.add_argument(
+            "automata", help="automata file, text or binary"
+        )
+        if name == "check":
+            subparser.add_argument(
+                "words", nargs="?", default="-", help="- for stdin"
+            )
+            subparser.add_argument(
+                "--accepted-only",
+                action="store_true",
+                help="only write the accepted words",
+            )
+        else:
+            subparser.add_argument("pairs")
+        subparser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="worker processes, 0 for one per CPU",
+        )
+        subparser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+        subparser.set_defaults(function=function)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the command, returns the exit status
+    """
+    args = build_parser().parse_args(argv)
+    if getattr(args, "workers", None) == 0:
+        args.workers = None
+    try:
+        return args.function(args)
+    # a malformed automata file fails parsing with an IndexError
+    except (OSError, ValueError, IndexError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
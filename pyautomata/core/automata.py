@@ -2,8 +2,32 @@
 The class that controls the whole Automata.
 The Minimized version is on the minimizaiton module.
 """
-from typing import List, Dict, Tuple, Union, Set
-import re
+from typing import Iterator, List, Dict, Optional, Sequence, Tuple, Union, Set
+from typing import TYPE_CHECKING
+
+from pyautomata.core.compiled import (  # pylint: disable=import-error
+    CompiledAutomata,
+    NON_FINAL_MESSAGE,
+    UNDEFINED_MESSAGE,
+)
+from pyautomata.core.instrumentation import (  # pylint: disable=import-error
+    Instrumentation,
+)
+from pyautomata.core.product import (  # pylint: disable=import-error
+    ProductAutomata,
+)
+from pyautomata.core.runner import (  # pylint: disable=import-error
+    AutomataRunner,
+)
+from pyautomata.core.tokenizer import Tokenizer  # pylint: disable=import-error
+
+if TYPE_CHECKING:
+    import numpy
+
+# changing any of these makes a compiled table stale
+_DEFINITION_FIELDS = frozenset(
+    ["states", "alphabet", "initial_state", "final_states", "program_function"]
+)
 
 
 class Automata:
@@ -17,6 +41,8 @@ class Automata:
         """
         To initialize an Automata, pass the program function dictionary
         and the unpacked dictionary of info
+        Optionally, an instrumentation object receives how many words
+        and symbols check_word and accepts went through
         """
         self.name: str = kwargs["name"]
         self.states: Set[str] = kwargs["states"]
@@ -24,17 +50,59 @@ class Automata:
         self.initial_state: str = kwargs["initial_state"]
         self.final_states: Set[str] = kwargs["final_states"]
         self.program_function: Dict[Tuple[str, str], str] = program_function
+        self.instrumentation: Optional[Instrumentation] = kwargs.get(
+            "instrumentation"
+        )
+
+    def __setattr__(self, name: str, value) -> None:
+        # reassigning part of the definition drops the compiled table
+        if name in _DEFINITION_FIELDS:
+            self.__dict__["_compiled"] = None
+        if name == "alphabet":
+            self.__dict__["_tokenizer"] = None
+        super().__setattr__(name, value)
+
+    @property
+    def compiled(self) -> Optional[CompiledAutomata]:
+        """
+        Returns the compiled version of the Automata,
+        None if it wasn't compiled (or changed since)
+        """
+        return self.__dict__.get("_compiled")
+
+    def compile(self) -> CompiledAutomata:
+        """
+        Interns states and symbols to integers and builds the flat
+        transition table that check_word uses from then on
+        Reassigning states, alphabet, initial_state, final_states or
+        program_function discards it, in-place changes to them
+        aren't tracked, so call compile again after those
+        """
+        compiled = CompiledAutomata.from_automata(self)
+        self.__dict__["_compiled"] = compiled
+        return compiled
+
+    @property
+    def tokenizer(self) -> Tokenizer:
+        """
+        Returns the Tokenizer for the alphabet, built on first use
+        Reassigning the alphabet discards it, in-place changes to
+        the alphabet aren't tracked
+        """
+        tokenizer = self.__dict__.get("_tokenizer")
+        if tokenizer is None:
+            tokenizer = Tokenizer(self.alphabet)
+            self.__dict__["_tokenizer"] = tokenizer
+        return tokenizer
 
     def break_word(self, word: str) -> List[str]:
         """
         Breaks a word into it's alphabet elements
+        When an element is the prefix of another, the longest is taken
         Will raise ValueError if there's an element
         that isn't part of the alphabet
         """
-        re_pattern = "|".join(self.alphabet)
-        if re.sub(re_pattern, "", word):
-            raise ValueError("Word contains non-alphabet characters")
-        return re.findall(re_pattern, word)
+        return self.tokenizer.tokenize(word)
 
     def check_word(self, word: str) -> Tuple[bool, Union[str, List[str]]]:
         """
@@ -43,22 +111,154 @@ class Automata:
         the tuple representing the path it took to reach the final state
         In case of False, the second element is the reason why it was rejected
         """
+        compiled = self.compiled
+        if compiled is not None and self.instrumentation is None:
+            return compiled.check_word(word)
+        elements = self.break_word(word)
+        if self.instrumentation is not None:
+            self.instrumentation.words_checked(1, len(elements))
+        if compiled is not None:
+            return compiled.check_elements(elements)
+        program_function = self.program_function
         curr_state = self.initial_state
-        path = [curr_state]
-        for elem in self.break_word(word):
-            path.append(elem)
-            try:
-                curr_state = self.program_function[(curr_state, elem)]
-            except KeyError:
-                return_string = "Program ended with undefined state at state"
+        for elem in elements:
+            next_state = program_function.get((curr_state, elem))
+            if next_state is None:
                 return (
                     False,
-                    f"{return_string} {curr_state} with element {elem}.",
+                    UNDEFINED_MESSAGE.format(state=curr_state, elem=elem),
                 )
-            path.append(curr_state)
+            curr_state = next_state
         if curr_state not in self.final_states:
-            return (False, f"Program ended on non-final state {curr_state}.")
-        return (True, path)
+            return (False, NON_FINAL_MESSAGE.format(state=curr_state))
+        # the path is only built for accepted words
+        return (True, self.trace_elements(elements))
+
+    def accepts(self, word: str) -> bool:
+        """
+        Checks if a word is part of the language, without
+        building the path or the reason, just the decision
+        Compiled, no object is allocated per symbol
+        Will raise ValueError if there's an element
+        that isn't part of the alphabet
+        """
+        compiled = self.compiled
+        if compiled is not None and self.instrumentation is None:
+            return compiled.accepts(word)
+        elements = self.break_word(word)
+        if self.instrumentation is not None:
+            self.instrumentation.words_checked(1, len(elements))
+        if compiled is not None:
+            return compiled.accepts_elements(elements)
+        program_function = self.program_function
+        curr_state = self.initial_state
+        for elem in elements:
+            curr_state = program_function.get((curr_state, elem))
+            if curr_state is None:
+                return False
+        return curr_state in self.final_states
+
+    def trace(self, word: str) -> List[str]:
+        """
+        Builds the path the word takes, interleaving states and
+        elements, it stops at the last state reached if a
+        transition is undefined
+        Will raise ValueError if there's an element
+        that isn't part of the alphabet
+        """
+        compiled = self.compiled
+        if compiled is not None:
+            return compiled.trace(word)
+        return self.trace_elements(self.break_word(word))
+
+    def trace_elements(self, elements: List[str]) -> List[str]:
+        """
+        The same as trace, for an already broken word
+        """
+        curr_state = self.initial_state
+        path = [curr_state]
+        for elem in elements:
+            next_state = self.program_function.get((curr_state, elem))
+            if next_state is None:
+                break
+            curr_state = next_state
+            path.append(elem)
+            path.append(curr_state)
+        return path
+
+    def check_words(self, words: Sequence[str]) -> "numpy.ndarray":
+        """
+        Checks many words at once, vectorized with NumPy
+        Returns a boolean array telling which words are part of the language
+        Compiles the Automata first if it isn't compiled
+        Will raise ValueError if any word has non-alphabet characters
+        """
+        compiled = self.compiled or self.compile()
+        return compiled.check_words(words, self.instrumentation)
+
+    def text_lines(self) -> Iterator[str]:
+        """
+        Yields the lines of the Automata in the file format
+        AutomataParser reads, with sets and transitions sorted
+        """
+        states = ",".join(sorted(self.states))
+        alphabet = ",".join(sorted(self.alphabet))
+        final_states = ",".join(sorted(self.final_states))
+        yield (
+            f"{self.name}=({{{states}}},{{{alphabet}}},Prog,"
+            f"{self.initial_state},{{{final_states}}})\n"
+        )
+        yield "Prog\n"
+        for (i_state, c), f_state in sorted(self.program_function.items()):
+            yield f"({i_state},{c})={f_state}\n"
+
+    def save(self, file_name: str) -> None:
+        """
+        Saves the Automata in the file format AutomataParser reads
+        """
+        with open(file_name, "w", encoding="utf-8") as f:
+            f.writelines(self.text_lines())
+
+    def save_compiled(self, file_name: str) -> None:
+        """
+        Saves the compiled Automata in the binary format,
+        to be loaded with load_compiled
+        Compiles the Automata first if it isn't compiled
+        """
+        (self.compiled or self.compile()).save(file_name)
+
+    def intersection(self, other: "Automata") -> ProductAutomata:
+        """
+        The lazy product accepting what both Automata accept
+        """
+        return ProductAutomata([self, other], "intersection")
+
+    def union(self, other: "Automata") -> ProductAutomata:
+        """
+        The lazy product accepting what either Automata accepts
+        """
+        return ProductAutomata([self, other], "union")
+
+    def difference(self, other: "Automata") -> ProductAutomata:
+        """
+        The lazy product accepting what this Automata
+        accepts and the other doesn't
+        """
+        return ProductAutomata([self, other], "difference")
+
+    def complement(self) -> ProductAutomata:
+        """
+        The lazy Automata accepting every word over the
+        alphabet that this one doesn't accept
+        """
+        return ProductAutomata([self], "complement")
+
+    def runner(self) -> AutomataRunner:
+        """
+        Creates a runner, to check input fed in chunks
+        Compiles the Automata first if it isn't compiled
+        """
+        return AutomataRunner(self.compiled or self.compile())
 
     def __str__(self) -> str:
         return_string = f"{self.name}=("
@@ -0,0 +1,118 @@
+"""
+The Automata Set module contains the AutomataSet class.
+It checks a word against many automata at once: the word is broken
+only once, and every member advances together over one transition
+table stacking all of theirs.
+"""
+from typing import List, Sequence, TYPE_CHECKING
+
+from pyautomata.core.compiled import (  # pylint: disable=import-error
+    CompiledAutomata,
+)
+from pyautomata.core.tokenizer import Tokenizer  # pylint: disable=import-error
+
+if TYPE_CHECKING:
+    import numpy
+
+
+class AutomataSet:
+    """
+    The class that runs a word through many Automata in a single pass
+    The members are compiled when the set is made, later
+    changes to them aren't seen by it
+    The alphabet is the union of the members alphabets, a symbol
+    that a member doesn't have is an undefined transition for it
+    """
+
+    def __init__(self, automata: Sequence) -> None:
+        """
+        To initialize an AutomataSet, pass the Automata
+        (or CompiledAutomata) it's made of, in the order
+        the results are given
+        """
+        # numpy is only needed by the batched APIs
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        self.automata = list(automata)
+        compiled: List[CompiledAutomata] = [
+            a if isinstance(a, CompiledAutomata) else a.compiled or a.compile()
+            for a in self.automata
+        ]
+        self.alphabet = sorted(
+            set().union(*(c.symbols for c in compiled)).difference({""})
+        )
+        self.tokenizer = Tokenizer(self.alphabet)
+        self.symbol_index = {s: i for i, s in enumerate(self.alphabet)}
+        # the states of every member one after the other, then a
+        # single dead state that every undefined transition leads to
+        offsets = np.cumsum([0] + [len(c.states) for c in compiled])
+        self.dead = int(offsets[-1])
+        table = np.full(
+            (self.dead + 1, len(self.alphabet)), self.dead, np.intc
+        )
+        final_mask = np.zeros(self.dead + 1, dtype=bool)
+        for member, offset in zip(compiled, offsets):
+            dense, member_final = member.dense_table()
+            n_states = len(member.states)
+            # the member's own dead state is its last row
+            dense = np.where(dense == n_states, self.dead, dense + offset)
+            for symbol, s in enumerate(self.alphabet):
+                member_symbol = member.symbol_index.get(s)
+                if member_symbol is not None:
+                    table[offset : offset + n_states, symbol] = dense[
+                        :n_states, member_symbol
+                    ]
+            final_mask[offset : offset + n_states] = member_final[:n_states]
+        self.table = table
+        self.final_mask = final_mask
+        self.initial_states = np.array(
+            [c.initial_state + offset for c, offset in zip(compiled, offsets)],
+            dtype=np.intc,
+        )
+
+    def __len__(self) -> int:
+        """
+        Returns how many Automata the set has
+        """
+        return len(self.automata)
+
+    def accepts(self, word: str) -> "numpy.ndarray":
+        """
+        Returns a boolean array telling which members accept the word,
+        breaking it only once for all of them
+        Will raise ValueError if there's an element
+        that isn't part of the alphabet
+        """
+        if self.tokenizer.single_character:
+            return self.accepts_elements(word)
+        return self.accepts_elements(self.tokenizer.tokenize(word))
+
+    def accepts_elements(self, elements: Sequence[str]) -> "numpy.ndarray":
+        """
+        The same as accepts, for an already broken word
+        (a string is taken as single character elements)
+        """
+        try:
+            symbols = [self.symbol_index[elem] for elem in elements]
+        except KeyError as ke:
+            raise ValueError("Word contains non-alphabet characters") from ke
+        table = self.table
+        states = self.initial_states
+        for symbol in symbols:
+            states = table[states, symbol]
+            # nothing is accepted once every member is dead
+            if (states == self.dead).all():
+                break
+        return self.final_mask[states]
+
+    def accepting(self, word: str) -> List:
+        """
+        Returns the members that accept the word, in the set's order
+        Will raise ValueError if there's an element
+        that isn't part of the alphabet
+        """
+        return [
+            automata
+            for automata, accepted in zip(self.automata, self.accepts(word))
+            if accepted
+        ]
@@ -0,0 +1,237 @@
+"""
+The Cache module contains the MinimizationCache class.
+It keeps minimized automata on disk, keyed by a hash of the
+automata they came from, so unchanged automata aren't minimized again.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from pyautomata.core.instrumentation import (  # pylint: disable=import-error
+    Instrumentation,
+)
+from pyautomata.core.minimization import (  # pylint: disable=import-error
+    MinimizedAutomata,
+)
+
+# bumped whenever minimization changes its results,
+# so older entries stop matching
+CACHE_VERSION = 1
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def default_cache_directory() -> str:
+    """
+    Returns the directory the cache uses by default,
+    pyautomata inside the user's cache directory
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "pyautomata")
+
+
+class MinimizationCache:
+    """
+    The class that caches MinimizedAutomata.minimize() on disk
+    Each entry is one JSON file, when the entries go over max_bytes
+    the least recently used ones are removed
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """
+        To initialize a MinimizationCache, optionally pass the directory
+        (created on the first store) and the size bound in bytes
+        """
+        self.directory = directory or default_cache_directory()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(
+        description: Dict[str, Union[str, Set[str]]],
+        program_function: Dict[Tuple[str, str], str],
+        algorithm: str = "hopcroft",
+        naming: str = "concatenate",
+    ) -> str:
+        """
+        Hashes the parsed automata (and how it's minimized and named),
+        the order of sets and of the program function doesn't matter
+        """
+        canonical = {
+            "version": CACHE_VERSION,
+            "algorithm": algorithm,
+            "naming": naming,
+            "name": description["name"],
+            "states": sorted(description["states"]),
+            "alphabet": sorted(description["alphabet"]),
+            "initial_state": description["initial_state"],
+            "final_states": sorted(description["final_states"]),
+            "program_function": sorted(
+                [state, c, result_state]
+                for (state, c), result_state in program_function.items()
+            ),
+        }
+        encoded = json.dumps(canonical, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def minimize(
+        self,
+        description: Dict[str, Union[str, Set[str]]],
+        program_function: Dict[Tuple[str, str], str],
+        algorithm: str = "hopcroft",
+        instrumentation: Optional[Instrumentation] = None,
+        naming: str = "concatenate",
+    ) -> MinimizedAutomata:
+        """
+        Returns the minimized automata, from the cache if it's there,
+        otherwise minimizing it and storing the result
+        The instrumentation, if any, only sees the minimization
+        of a miss, it isn't kept on the returned automata
+        """
+        key = self.key(description, program_function, algorithm, naming)
+        automata = self.load(key)
+        if automata is not None:
+            self.hits += 1
+            return automata
+        self.misses += 1
+        automata = MinimizedAutomata(
+            program_function,
+            instrumentation=instrumentation,
+            naming=naming,
+            **description,
+        )
+        automata.minimize(algorithm)
+        automata.instrumentation = None
+        try:
+            self.store(key, automata)
+        except OSError:
+            # a cache that can't be written only costs the next call
+            pass
+        return automata
+
+    def load(self, key: str) -> Optional[MinimizedAutomata]:
+        """
+        Loads the entry with that key, None if there's no valid entry
+        Marks the entry as recently used
+        """
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            os.utime(path)
+            program_function = {
+                (state, c): result_state
+                for state, c, result_state in data["program_function"]
+            }
+            automata = MinimizedAutomata(
+                program_function,
+                name=data["name"],
+                states=set(data["states"]),
+                alphabet=set(data["alphabet"]),
+                initial_state=data["initial_state"],
+                final_states=set(data["final_states"]),
+                naming=data.get("naming", "concatenate"),
+            )
+            # pylint: disable=protected-access
+            automata._classes = {
+                name: frozenset(members)
+                for name, members in data.get("members", {}).items()
+            }
+            return automata
+        except (OSError, ValueError, KeyError, TypeError):
+            # missing, or unreadable, either way it's a miss
+            return None
+
+    def store(self, key: str, automata: MinimizedAutomata) -> None:
+        """
+        Stores the automata under the key, then evicts the least
+        recently used entries if the cache went over its size
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        data = {
+            "name": automata.name,
+            "naming": automata.naming,
+            "members": automata.merged_states(),
+            "states": sorted(automata.states),
+            "alphabet": sorted(automata.alphabet),
+            "initial_state": automata.initial_state,
+            "final_states": sorted(automata.final_states),
+            "program_function": sorted(
+                [state, c, result_state]
+                for (state, c), result_state in (
+                    automata.program_function.items()
+                )
+            ),
+        }
+        # written to a temporary file first, so readers
+        # never see half of an entry
+        fd, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(temporary, self._path(key))
+        self.evict()
+
+    def entries(self) -> List[Tuple[int, int, str]]:
+        """
+        Returns (last use, size, path) of every entry
+        """
+        try:
+            scanned = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return []
+        return [
+            (entry.stat().st_mtime_ns, entry.stat().st_size, entry.path)
+            for entry in scanned
+            if entry.name.endswith(".json")
+        ]
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used entries
+        until the cache fits in max_bytes
+        """
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        """
+        Removes every entry
+        """
+        for _, _, path in self.entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the hits and misses of this cache object,
+        plus the number of entries and bytes on disk
+        """
+        entries = self.entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+        }
@@ -0,0 +1,515 @@
+"""
+The Compiled module contains the CompiledAutomata class.
+A compiled automata interns states and symbols to small integers
+and keeps the program function in a flat transition table,
+so checking a word doesn't hash a tuple of strings for every symbol.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING
+
+from pyautomata.core.instrumentation import (  # pylint: disable=import-error
+    Instrumentation,
+)
+from pyautomata.core.tokenizer import Tokenizer  # pylint: disable=import-error
+
+if TYPE_CHECKING:
+    import numpy
+
+# the value the table holds for an undefined transition
+UNDEFINED = -1
+
+# the most symbols check_words lays out in one padded matrix
+BATCH_CELLS = 1 << 24
+
+UNDEFINED_MESSAGE = (
+    "Program ended with undefined state at state {state} with element {elem}."
+)
+NON_FINAL_MESSAGE = "Program ended on non-final state {state}."
+
+# the binary format: magic, version, flags, number of states, number of
+# symbols, initial state, name length, then the offsets of the state
+# string table, the symbol string table, the final state bitmap and the
+# transition table, the name follows the header
+# the offsets of the string tables and the transition table are in the
+# byte order of the machine that wrote them, told by the flags
+FILE_MAGIC = b"PYAUTDFA"
+FILE_VERSION = 1
+FILE_HEADER = struct.Struct("<8sHHIIIIQQQQ")
+# set in the flags when the table was written in big-endian order
+BIG_ENDIAN_FLAG = 1
+
+
+class StringTable(Sequence):
+    """
+    A sequence of strings read from a buffer, only decoded
+    when accessed, made of the count + 1 offsets (uint64)
+    followed by all the strings, utf-8 encoded, back to back
+    """
+
+    def __init__(
+        self, buffer: memoryview, count: int, swapped: bool = False
+    ) -> None:
+        """
+        To initialize a StringTable, pass the buffer and how many
+        strings it has, swapped tells the offsets are in
+        the other byte order
+        """
+        self._count = count
+        offsets_size = (count + 1) * 8
+        self._offsets = buffer[:offsets_size].cast("Q")
+        if swapped:
+            self._offsets = array("Q", self._offsets)
+            self._offsets.byteswap()
+        self._strings = buffer[offsets_size:]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("StringTable index out of range")
+        start, end = self._offsets[i], self._offsets[i + 1]
+        return str(self._strings[start:end], "utf-8")
+
+    @staticmethod
+    def encode(strings: Sequence[str]) -> bytes:
+        """
+        Encodes the strings in the StringTable layout
+        """
+        encoded = [s.encode("utf-8") for s in strings]
+        offsets = array("Q", [0])
+        for e in encoded:
+            offsets.append(offsets[-1] + len(e))
+        return offsets.tobytes() + b"".join(encoded)
+
+
+class CompiledAutomata:
+    """
+    The class that represents an Automata compiled to
+    an integer-indexed transition table
+    """
+
+    def __init__(
+        self,
+        name: str,
+        states: Sequence[str],
+        symbols: Sequence[str],
+        initial_state: int,
+        final_states: Union[bytes, bytearray, memoryview],
+        table: Union[array, memoryview],
+    ) -> None:
+        """
+        To initialize a CompiledAutomata, pass the state and symbol
+        names (their position is their index), the initial state index,
+        the bitmap of final states and the flat transition table, where
+        table[state * len(symbols) + symbol] is the next state or UNDEFINED
+        """
+        self.name = name
+        self.states = states
+        self.symbols = symbols
+        self.symbol_index: Dict[str, int] = {
+            s: i for i, s in enumerate(symbols)
+        }
+        self.tokenizer = Tokenizer(symbols)
+        self.initial_state = initial_state
+        self.final_states = final_states
+        self.table = table
+        self._dense = None
+
+    @classmethod
+    def from_automata(cls, automata) -> "CompiledAutomata":
+        """
+        Compiles an Automata, states and symbols are
+        numbered in sorted order
+        """
+        program_function = automata.program_function
+        state_names = set(automata.states)
+        state_names.add(automata.initial_state)
+        for (state, _), result_state in program_function.items():
+            state_names.add(state)
+            state_names.add(result_state)
+        states = sorted(state_names)
+        symbols = sorted(automata.alphabet)
+        state_index = {s: i for i, s in enumerate(states)}
+        symbol_index = {s: i for i, s in enumerate(symbols)}
+        n_symbols = len(symbols)
+        table = array("i", [UNDEFINED]) * (len(states) * n_symbols)
+        for (state, c), result_state in program_function.items():
+            # transitions with non-alphabet symbols can never be taken
+            if c not in symbol_index:
+                continue
+            table[state_index[state] * n_symbols + symbol_index[c]] = (
+                state_index[result_state]
+            )
+        final_states = bytearray((len(states) + 7) // 8)
+        for state in automata.final_states:
+            if state in state_index:
+                i = state_index[state]
+                final_states[i >> 3] |= 1 << (i & 7)
+        return cls(
+            automata.name,
+            states,
+            symbols,
+            state_index[automata.initial_state],
+            final_states,
+            table,
+        )
+
+    def save(self, file_name: str) -> None:
+        """
+        Writes the compiled automata in the binary format,
+        which load reads back without parsing
+        """
+        name = self.name.encode("utf-8")
+        states = StringTable.encode(self.states)
+        symbols = StringTable.encode(self.symbols)
+        final_states = bytes(self.final_states)
+        table = memoryview(self.table).cast("B")
+        states_offset = FILE_HEADER.size + len(name)
+        symbols_offset = states_offset + len(states)
+        finals_offset = symbols_offset + len(symbols)
+        # aligned, so the table can be used in place once mapped
+        table_offset = (finals_offset + len(final_states) + 7) // 8 * 8
+        flags = BIG_ENDIAN_FLAG if sys.byteorder == "big" else 0
+        with open(file_name, "wb") as f:
+            f.write(
+                FILE_HEADER.pack(
+                    FILE_MAGIC,
+                    FILE_VERSION,
+                    flags,
+                    len(self.states),
+                    len(self.symbols),
+                    self.initial_state,
+                    len(name),
+                    states_offset,
+                    symbols_offset,
+                    finals_offset,
+                    table_offset,
+                )
+            )
+            f.write(name)
+            f.write(states)
+            f.write(symbols)
+            f.write(final_states)
+            f.write(bytes(table_offset - finals_offset - len(final_states)))
+            f.write(table)
+
+    @classmethod
+    def load(cls, file_name: str) -> "CompiledAutomata":
+        """
+        Loads a compiled automata written by save
+        The file is memory-mapped and the transition table, the final
+        states and the state names are read straight from it
+        Will raise ValueError if the file isn't in the binary format
+        """
+        with open(file_name, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as ve:
+                raise ValueError("Not a compiled automata file") from ve
+        buffer = memoryview(mapped)
+        if len(buffer) < FILE_HEADER.size:
+            raise ValueError("Not a compiled automata file")
+        (
+            magic,
+            version,
+            flags,
+            n_states,
+            n_symbols,
+            initial_state,
+            name_length,
+            states_offset,
+            symbols_offset,
+            finals_offset,
+            table_offset,
+        ) = FILE_HEADER.unpack_from(buffer)
+        if magic != FILE_MAGIC:
+            raise ValueError("Not a compiled automata file")
+        if version != FILE_VERSION:
+            raise ValueError(
+                f"Unsupported compiled automata version {version}"
+            )
+        # written on a machine of the other byte order, needs copies
+        swapped = bool(flags & BIG_ENDIAN_FLAG) != (sys.byteorder == "big")
+        name_end = FILE_HEADER.size + name_length
+        name = str(buffer[FILE_HEADER.size : name_end], "utf-8")
+        states = StringTable(
+            buffer[states_offset:symbols_offset], n_states, swapped
+        )
+        symbols = list(
+            StringTable(
+                buffer[symbols_offset:finals_offset], n_symbols, swapped
+            )
+        )
+        finals_end = finals_offset + (n_states + 7) // 8
+        final_states = buffer[finals_offset:finals_end]
+        table_end = table_offset + n_states * n_symbols * 4
+        table = buffer[table_offset:table_end].cast("i")
+        if swapped:
+            table = array("i", table)
+            table.byteswap()
+        return cls(name, states, symbols, initial_state, final_states, table)
+
+    def is_final(self, state: int) -> bool:
+        """
+        Tells if the state index is a final state
+        """
+        return bool(self.final_states[state >> 3] >> (state & 7) & 1)
+
+    def encode(self, elements: Sequence[str]) -> List[int]:
+        """
+        Translates alphabet elements to their symbol indexes
+        Will raise ValueError if an element isn't part of the alphabet
+        """
+        symbol_index = self.symbol_index
+        try:
+            return [symbol_index[elem] for elem in elements]
+        except KeyError as ke:
+            raise ValueError("Word contains non-alphabet characters") from ke
+
+    def accepts(self, word: str) -> bool:
+        """
+        Tells if the word is part of the language, without the path
+        With a single character alphabet nothing is allocated per symbol
+        Will raise ValueError if there's an element
+        that isn't part of the alphabet
+        """
+        if self.tokenizer.single_character:
+            return self.accepts_elements(word)
+        return self.accepts_elements(self.tokenizer.tokenize(word))
+
+    def accepts_elements(self, elements: Sequence[str]) -> bool:
+        """
+        The same as accepts, for an already broken word
+        (a string is taken as single character elements)
+        """
+        table = self.table
+        n_symbols = len(self.symbols)
+        symbol_index = self.symbol_index
+        state = self.initial_state
+        try:
+            for elem in elements:
+                state = table[state * n_symbols + symbol_index[elem]]
+                if state < 0:
+                    # the rest must still be part of the alphabet
+                    if not self.tokenizer.symbols.issuperset(elements):
+                        raise KeyError(elements)
+                    return False
+        except KeyError as ke:
+            raise ValueError("Word contains non-alphabet characters") from ke
+        return self.is_final(state)
+
+    def trace(self, word: str) -> List[str]:
+        """
+        The same as Automata.trace, over the transition table
+        """
+        return self.path_elements(self.tokenizer.tokenize(word))
+
+    def break_word(self, word: str) -> List[str]:
+        """
+        Breaks a word into it's alphabet elements
+        Will raise ValueError if there's an element
+        that isn't part of the alphabet
+        """
+        return self.tokenizer.tokenize(word)
+
+    def check_word(self, word: str) -> Tuple[bool, Union[str, List[str]]]:
+        """
+        The same as Automata.check_word, over the transition table
+        With a single character alphabet the word isn't tokenized
+        """
+        if self.tokenizer.single_character:
+            return self.check_elements(word)
+        return self.check_elements(self.tokenizer.tokenize(word))
+
+    def check_elements(
+        self, elements: Sequence[str]
+    ) -> Tuple[bool, Union[str, List[str]]]:
+        """
+        The same as Automata.check_word, for an already broken word
+        (a string is taken as single character elements)
+        Each element is looked up and followed in the same loop,
+        the path is only built for accepted words
+        """
+        table = self.table
+        n_symbols = len(self.symbols)
+        symbol_index = self.symbol_index
+        state = self.initial_state
+        try:
+            for elem in elements:
+                next_state = table[state * n_symbols + symbol_index[elem]]
+                if next_state < 0:
+                    # the rest must still be part of the alphabet
+                    if not self.tokenizer.symbols.issuperset(elements):
+                        raise KeyError(elements)
+                    return (
+                        False,
+                        UNDEFINED_MESSAGE.format(
+                            state=self.states[state], elem=elem
+                        ),
+                    )
+                state = next_state
+        except KeyError as ke:
+            raise ValueError("Word contains non-alphabet characters") from ke
+        if not self.is_final(state):
+            return (
+                False,
+                NON_FINAL_MESSAGE.format(state=self.states[state]),
+            )
+        return (True, self.path_elements(elements))
+
+    def path_elements(self, elements: Sequence[str]) -> List[str]:
+        """
+        Replays the alphabet elements, building the path of state
+        and element names the word takes, up to an undefined transition
+        """
+        table = self.table
+        n_symbols = len(self.symbols)
+        symbol_index = self.symbol_index
+        states = self.states
+        state = self.initial_state
+        path = [states[state]]
+        for elem in elements:
+            state = table[state * n_symbols + symbol_index[elem]]
+            if state < 0:
+                break
+            path.append(elem)
+            path.append(states[state])
+        return path
+
+    def dense_table(self) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+        """
+        Returns the transition table as a (states + 1) x symbols NumPy
+        matrix, where the extra last row is a dead state that undefined
+        transitions lead to, and the final state mask for those rows
+        """
+        if self._dense is None:
+            # numpy is only needed by the batched API
+            import numpy as np  # pylint: disable=import-outside-toplevel
+
+            n_states = len(self.states)
+            n_symbols = len(self.symbols)
+            dense = np.full((n_states + 1, n_symbols), n_states, np.intc)
+            table = np.frombuffer(self.table, dtype=np.intc)
+            dense[:n_states] = np.where(
+                table < 0, n_states, table
+            ).reshape(n_states, n_symbols)
+            final_mask = np.zeros(n_states + 1, dtype=bool)
+            final_mask[:n_states] = np.unpackbits(
+                np.frombuffer(self.final_states, dtype=np.uint8),
+                bitorder="little",
+            )[:n_states].astype(bool)
+            self._dense = (dense, final_mask)
+        return self._dense
+
+    def encode_words(
+        self, words: Sequence[str]
+    ) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+        """
+        Encodes all the words at once
+        Returns the number of symbols of each word and the
+        symbol indexes of every word concatenated
+        Will raise ValueError if there's an element
+        that isn't part of the alphabet
+        """
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        if self.tokenizer.single_character:
+            # one symbol per character, so the whole batch
+            # is translated by code point without a Python loop
+            lengths = np.fromiter(map(len, words), np.int64, len(words))
+            code_points = np.frombuffer(
+                "".join(words).encode("utf-32-le"), dtype=np.uint32
+            )
+            symbol_points = np.array(
+                [ord(s) for s in self.symbols], dtype=np.uint32
+            )
+            order = np.argsort(symbol_points)
+            sorted_points = symbol_points[order]
+            positions = np.searchsorted(sorted_points, code_points)
+            positions[positions == len(sorted_points)] = 0
+            if len(code_points) and (
+                len(sorted_points) == 0
+                or not np.array_equal(sorted_points[positions], code_points)
+            ):
+                raise ValueError("Word contains non-alphabet characters")
+            return lengths, order[positions].astype(np.intc)
+        symbols = array("i")
+        lengths = np.empty(len(words), dtype=np.int64)
+        for i, word in enumerate(words):
+            encoded = self.encode(self.tokenizer.tokenize(word))
+            lengths[i] = len(encoded)
+            symbols.extend(encoded)
+        return lengths, np.frombuffer(symbols, dtype=np.intc)
+
+    def check_words(
+        self,
+        words: Sequence[str],
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> "numpy.ndarray":
+        """
+        Checks many words at once, returns a boolean array
+        telling which words are part of the language
+        The words are laid out in a padded matrix, sorted by length,
+        and all advance together, one column at a time
+        The instrumentation, if any, gets the symbol count
+        of the encoded words
+        """
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        dense, final_mask = self.dense_table()
+        dead = len(self.states)
+        lengths, symbols = self.encode_words(words)
+        if instrumentation is not None:
+            instrumentation.words_checked(len(words), len(symbols))
+        offsets = np.cumsum(lengths) - lengths
+        order = np.argsort(lengths, kind="stable")
+        sorted_lengths = lengths[order]
+        accepted = np.zeros(len(lengths), dtype=bool)
+        start = 0
+        while start < len(order):
+            end = min(start + BATCH_CELLS, len(order))
+            width = int(sorted_lengths[end - 1])
+            # keeps the padded matrix bounded even with very long words
+            if (end - start) * width > BATCH_CELLS:
+                end = start + max(1, BATCH_CELLS // width)
+                width = int(sorted_lengths[end - 1])
+            batch = order[start:end]
+            batch_lengths = sorted_lengths[start:end]
+            rows = np.repeat(np.arange(len(batch)), batch_lengths)
+            cols = np.arange(len(rows)) - np.repeat(
+                np.cumsum(batch_lengths) - batch_lengths, batch_lengths
+            )
+            matrix = np.zeros((len(batch), width), dtype=np.intc)
+            matrix[rows, cols] = symbols[
+                np.repeat(offsets[batch], batch_lengths) + cols
+            ]
+            state = np.full(len(batch), self.initial_state, dtype=np.intc)
+            for col in range(width):
+                # the rows are sorted by length, so the words
+                # still running are always a suffix of the batch
+                first = np.searchsorted(batch_lengths, col, side="right")
+                running = state[first:]
+                running[:] = dense[running, matrix[first:, col]]
+                if (running == dead).all():
+                    state[first:] = dead
+                    break
+            accepted[batch] = final_mask[state]
+            start = end
+        return accepted
+
+
+def load_compiled(file_name: str) -> CompiledAutomata:
+    """
+    Loads an Automata saved with Automata.save_compiled,
+    it runs directly over the memory-mapped file
+    Will raise ValueError if the file isn't in the binary format
+    """
+    return CompiledAutomata.load(file_name)
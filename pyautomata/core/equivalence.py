@@ -0,0 +1,135 @@
+"""
+The Equivalence module tells if two automata accept the same language.
+It uses the Hopcroft–Karp algorithm, merging pairs of states with
+a union-find structure, so it runs in almost linear time without
+minimizing either automata.
+"""
+from array import array
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pyautomata.core.compiled import (  # pylint: disable=import-error
+    UNDEFINED,
+    CompiledAutomata,
+)
+
+
+def _total_tables(
+    compiled: CompiledAutomata, symbols: Sequence[str]
+) -> Tuple[List[array], bytes]:
+    """
+    Returns, for each of the symbols, the array with the next state of
+    every state, and the finality of every state
+    An extra last state is the Undefined sink, where undefined
+    transitions (and symbols the automata doesn't have) go
+    """
+    n_states = len(compiled.states)
+    n_symbols = len(compiled.symbols)
+    table = compiled.table
+    delta = []
+    for s in symbols:
+        next_states = array("i", [n_states]) * (n_states + 1)
+        symbol = compiled.symbol_index.get(s)
+        if symbol is not None:
+            for state in range(n_states):
+                result = table[state * n_symbols + symbol]
+                if result != UNDEFINED:
+                    next_states[state] = result
+        delta.append(next_states)
+    final = bytes(compiled.is_final(state) for state in range(n_states))
+    return delta, final + b"\x00"
+
+
+def _find(parent: array, state: int) -> int:
+    """
+    Finds the representative of the state, halving the path on the way
+    """
+    while parent[state] != state:
+        parent[state] = parent[parent[state]]
+        state = parent[state]
+    return state
+
+
+def equivalent(
+    automata1, automata2
+) -> Tuple[bool, Optional[List[str]]]:
+    """
+    Tells if both automata accept the same language,
+    missing transitions going to the Undefined sink
+    Returns (True, None) or (False, a shortest word that only one
+    of them accepts), the word being the list of its elements,
+    joining them could break into other elements when tokenized again
+    The automata are compiled if they aren't, a CompiledAutomata
+    can also be given
+    """
+    compiled1, compiled2 = (
+        a if isinstance(a, CompiledAutomata) else a.compiled or a.compile()
+        for a in (automata1, automata2)
+    )
+    symbols = sorted(
+        set(compiled1.symbols).union(compiled2.symbols).difference({""})
+    )
+    delta1, final1 = _total_tables(compiled1, symbols)
+    delta2, final2 = _total_tables(compiled2, symbols)
+    # states of the second automata come after the first ones
+    offset = len(final1)
+    parent = array("i", range(offset + len(final2)))
+    size = array("i", [1]) * len(parent)
+    start = (compiled1.initial_state, compiled2.initial_state)
+    parent[start[1] + offset] = start[0]
+    size[start[0]] += 1
+    pending = deque([start])
+    while pending:
+        state1, state2 = pending.popleft()
+        if final1[state1] != final2[state2]:
+            return False, _shortest_counterexample(
+                symbols, start, (delta1, final1), (delta2, final2)
+            )
+        for next1, next2 in zip(delta1, delta2):
+            root1 = _find(parent, next1[state1])
+            root2 = _find(parent, next2[state2] + offset)
+            if root1 == root2:
+                continue
+            # union by size, keeps the trees shallow
+            if size[root1] < size[root2]:
+                root1, root2 = root2, root1
+            parent[root2] = root1
+            size[root1] += size[root2]
+            pending.append((next1[state1], next2[state2]))
+    return True, None
+
+
+def _shortest_counterexample(
+    symbols: Sequence[str],
+    start: Tuple[int, int],
+    tables1: Tuple[List[array], bytes],
+    tables2: Tuple[List[array], bytes],
+) -> List[str]:
+    """
+    Searches the pairs of states breadth-first for the closest
+    pair that disagrees, returning the word that reaches it
+    Only called once the automata are known to differ, the union-find
+    pruning finds that they differ but not the shortest word
+    """
+    delta1, final1 = tables1
+    delta2, final2 = tables2
+    previous: Dict[Tuple[int, int], Optional[Tuple[Tuple[int, int], int]]]
+    previous = {start: None}
+    pending = deque([start])
+    while pending:
+        pair = pending.popleft()
+        if final1[pair[0]] != final2[pair[1]]:
+            elements: List[str] = []
+            step = previous[pair]
+            while step is not None:
+                pair, symbol = step
+                elements.append(symbols[symbol])
+                step = previous[pair]
+            elements.reverse()
+            return elements
+        for symbol, (next1, next2) in enumerate(zip(delta1, delta2)):
+            next_pair = (next1[pair[0]], next2[pair[1]])
+            if next_pair not in previous:
+                previous[next_pair] = (pair, symbol)
+                pending.append(next_pair)
+    raise AssertionError("the automata were found to differ")
@@ -0,0 +1,85 @@
+"""
+The Instrumentation module contains the hooks that minimization
+and word checking report to, and MetricsCollector, which adds them up.
+Nothing is measured unless an instrumentation object is given.
+"""
+from typing import Dict, Tuple
+
+
+class Instrumentation:
+    """
+    The base class of the instrumentation hooks
+    Every hook does nothing, subclasses override the ones they need
+    """
+
+    def phase(
+        self,
+        name: str,
+        seconds: float,
+        before: Tuple[int, int],
+        after: Tuple[int, int],
+    ) -> None:
+        """
+        Called after each minimization step with its wall time and
+        the (states, transitions) counts before and after it
+        """
+
+    def words_checked(self, words: int, symbols: int) -> None:
+        """
+        Called when words are checked, with how many
+        words and how many symbols they had
+        """
+
+
+class MetricsCollector(Instrumentation):
+    """
+    Instrumentation that adds up everything it receives,
+    to be read with snapshot and exported
+    """
+
+    def __init__(self) -> None:
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.words = 0
+        self.symbols = 0
+
+    def phase(
+        self,
+        name: str,
+        seconds: float,
+        before: Tuple[int, int],
+        after: Tuple[int, int],
+    ) -> None:
+        """
+        Adds the call to the totals of the phase, the counts
+        are the ones of the last call
+        """
+        totals = self.phases.setdefault(name, {"calls": 0, "seconds": 0.0})
+        totals["calls"] += 1
+        totals["seconds"] += seconds
+        totals["states_before"], totals["transitions_before"] = before
+        totals["states_after"], totals["transitions_after"] = after
+
+    def words_checked(self, words: int, symbols: int) -> None:
+        """
+        Adds to the word and symbol counters
+        """
+        self.words += words
+        self.symbols += symbols
+
+    def snapshot(self) -> Dict[str, object]:
+        """
+        Returns a copy of everything collected so far
+        """
+        return {
+            "phases": {name: dict(t) for name, t in self.phases.items()},
+            "words": self.words,
+            "symbols": self.symbols,
+        }
+
+    def reset(self) -> None:
+        """
+        Zeroes everything collected
+        """
+        self.phases = {}
+        self.words = 0
+        self.symbols = 0
@@ -7,24 +7,65 @@ of non-distinguishable states.
 # This whole module uses the method version of set operations
 # instead of the actual operators, end result is the same,
 # this was made to facilitate understanding.
-import copy
-from typing import Dict, FrozenSet, Set, Tuple
-from itertools import combinations
+import time
+from array import array
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
-from pyautomata import Automata  # pylint: disable=import-error
+from pyautomata.core.automata import (  # pylint: disable=import-error
+    _DEFINITION_FIELDS,
+    Automata,
+)
+
+T = TypeVar("T")
+
+NAMING_POLICIES = ("concatenate", "short")
+
+# past this share of the states changing, an edit minimizes
+# the whole automata again, that's faster than matching them
+INCREMENTAL_SHARE = 0.25
+
+# (is final, next state of each symbol, None when undefined)
+Signature = Tuple[bool, Tuple[Optional[str], ...]]
 
 
 class TablePair:
     """
     The class that represents one element of the table for the
     Table Filling Algorithm
+    Kept for compatibility, table_filling_algorithm no longer makes
+    them, it works over interned states and a flat table
+    With slots, and the dependecies set only made when first used
     """
 
+    __slots__ = ("state1", "state2", "distinguishable", "_dependicies")
+
     def __init__(self, state1: str, state2: str) -> None:
         self.state1 = state1
         self.state2 = state2
         self.distinguishable = False
-        self.dependicies: Set[TablePair] = set()
+        self._dependicies: Optional[Set[TablePair]] = None
+
+    @property
+    def dependicies(self) -> Set["TablePair"]:
+        """
+        Returns the pairs that depend on this one
+        """
+        if self._dependicies is None:
+            self._dependicies = set()
+        return self._dependicies
+
+    @dependicies.setter
+    def dependicies(self, dependicies: Set["TablePair"]) -> None:
+        self._dependicies = dependicies
 
     def __iter__(self):
         return iter(sorted([self.state1, self.state2]))
@@ -36,6 +77,59 @@ class TablePair:
         return self.state1 == "Undefined" or self.state2 == "Undefined"
 
 
+class IncrementalIndex:
+    """
+    What incremental edits need to know about a minimized automata:
+    the transitions into each state, and the state with each signature
+    In a minimal automata no two states have the same signature,
+    otherwise they would be equivalent
+    """
+
+    __slots__ = ("symbols", "reverse", "signatures", "signature_of", "ids")
+
+    def __init__(self, automata: "MinimizedAutomata") -> None:
+        self.symbols = sorted(automata.alphabet)
+        self.reverse: Dict[str, Set[Tuple[str, str]]] = {}
+        for (state, c), result_state in automata.program_function.items():
+            self.reverse.setdefault(result_state, set()).add((state, c))
+        # the empty language, where undefined transitions go
+        self.signatures: Dict[Signature, str] = {
+            (False, (None,) * len(self.symbols)): "Undefined"
+        }
+        self.signature_of: Dict[str, Signature] = {}
+        for state in automata.states:
+            self.add(automata, state)
+        # the next short name, after the ones already taken
+        self.ids = 1 + max(
+            (
+                int(state[1:])
+                for state in automata.states
+                if state[:1] == "m" and state[1:].isdigit()
+            ),
+            default=-1,
+        )
+
+    def add(self, automata: "MinimizedAutomata", state: str) -> None:
+        """
+        Indexes the current signature of the state
+        """
+        program_function = automata.program_function
+        signature = (
+            state in automata.final_states,
+            tuple(program_function.get((state, c)) for c in self.symbols),
+        )
+        self.signatures[signature] = state
+        self.signature_of[state] = signature
+
+    def discard(self, state: str) -> None:
+        """
+        Drops the signature of the state, if it's indexed
+        """
+        signature = self.signature_of.pop(state, None)
+        if signature is not None and self.signatures.get(signature) == state:
+            del self.signatures[signature]
+
+
 class MinimizedAutomata(Automata):
     """
     Class that does the DFA minimization.
@@ -47,10 +141,37 @@ class MinimizedAutomata(Automata):
         program_function: Dict[Tuple[str, str], str],
         *,
         debug=False,
+        naming: str = "concatenate",
         **kwargs
     ) -> None:
+        """
+        naming chooses how unified states are named,
+        "concatenate" joins the sorted names of the merged states,
+        "short" numbers the classes m0, m1, ... so names stay short
+        however many states are merged, see merged_states
+        Will raise ValueError for any other naming
+        """
+        if naming not in NAMING_POLICIES:
+            raise ValueError(
+                f"Unknown naming {naming}, "
+                f"expected one of {', '.join(NAMING_POLICIES)}"
+            )
         super().__init__(program_function, **kwargs)
         self._debug = debug
+        self.naming = naming
+        # the states each unified state was made of
+        self._classes: Dict[str, FrozenSet[str]] = {}
+        # set by minimize, what incremental edits rely on
+        self._minimal = False
+        self._incremental: Optional[IncrementalIndex] = None
+
+    def __setattr__(self, name: str, value) -> None:
+        # reassigning part of the definition means it may not
+        # be minimal anymore, edits minimize it again from scratch
+        if name in _DEFINITION_FIELDS:
+            self.__dict__["_minimal"] = False
+            self.__dict__["_incremental"] = None
+        super().__setattr__(name, value)
 
     def remove_states(self, states: Set[str]) -> None:
         """
@@ -58,25 +179,529 @@ class MinimizedAutomata(Automata):
         the automata
         """
         # pylint: disable=attribute-defined-outside-init
-        new_program_function = copy.deepcopy(self.program_function)
-        for (i_state, c), f_state in self.program_function.items():
-            if i_state in states or f_state in states:
-                new_program_function.pop((i_state, c))
-        self.program_function = new_program_function
+        program_function = self.program_function
+        removed = [
+            (i_state, c)
+            for (i_state, c), f_state in program_function.items()
+            if i_state in states or f_state in states
+        ]
+        for key in removed:
+            del program_function[key]
+        # reassigned (not copied) so a compiled table is discarded
+        self.program_function = program_function
         self.final_states.difference_update(states)
         self.states.difference_update(states)
+        for state in states:
+            self._classes.pop(state, None)
 
-    def minimize(self):
+    def minimize(self, algorithm: str = "hopcroft"):
         """
         Does the minimization by doing all the steps
+        algorithm chooses how the equivalency classes are found,
+        "hopcroft", "table_filling" or "packed_table_filling"
         """
         if self._debug:
             print(self)
-        self.remove_states(self.unreacheable_states())
-        self.unify_states()
-        self.remove_states(self.useless_states())
+        run_phase = self._run_phase
+        # each removal has its own name, so their counts are both kept
+        run_phase(
+            "remove_unreacheable",
+            self.remove_states,
+            run_phase("unreacheable_states", self.unreacheable_states),
+        )
+        run_phase("unify_states", self.unify_states, algorithm)
+        run_phase(
+            "remove_useless",
+            self.remove_states,
+            run_phase("useless_states", self.useless_states),
+        )
         if self._debug:
             print(self)
+        self._minimal = True
+
+    def _run_phase(self, name: str, function: Callable[..., T], *args) -> T:
+        """
+        Runs one step of the minimization, reporting it
+        to the instrumentation if there's one
+        """
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            return function(*args)
+        before = (len(self.states), len(self.program_function))
+        start = time.perf_counter()
+        result = function(*args)
+        seconds = time.perf_counter() - start
+        after = (len(self.states), len(self.program_function))
+        instrumentation.phase(name, seconds, before, after)
+        return result
+
+    def add_transition(self, state: str, c: str, result_state: str) -> None:
+        """
+        Adds (or replaces) the transition, keeping the automata minimal
+        Will raise ValueError if a state or the element
+        isn't part of the automata
+        """
+        self._check_edit(state, c)
+        self._check_edit(result_state, c)
+        self._edit(state, c, result_state)
+
+    def remove_transition(self, state: str, c: str) -> None:
+        """
+        Removes the transition, keeping the automata minimal
+        Will raise ValueError if there's no such transition
+        """
+        if (state, c) not in self.program_function:
+            raise ValueError(f"There's no transition ({state},{c})")
+        self._edit(state, c, None)
+
+    def set_final(self, state: str, final: bool = True) -> None:
+        """
+        Makes the state final (or not), keeping the automata minimal
+        Will raise ValueError if the state isn't part of the automata
+        """
+        self._check_edit(state, None)
+        if (state in self.final_states) == final:
+            return
+        index = self._incremental_index()
+        if final:
+            self.final_states.add(state)
+        else:
+            self.final_states.discard(state)
+        if index is None:
+            self.minimize()
+        else:
+            self._reminimize(index, {state}, set())
+
+    def _check_edit(self, state: str, c: Optional[str]) -> None:
+        """
+        Raises ValueError if the state, or the element,
+        isn't part of the automata
+        """
+        if state not in self.states:
+            raise ValueError(f"Unknown state {state}")
+        if c is not None and c not in self.alphabet:
+            raise ValueError(f"Unknown element {c}")
+
+    def _incremental_index(self) -> Optional[IncrementalIndex]:
+        """
+        Returns the index incremental edits use, built on the
+        first edit, None if the automata isn't known to be minimal
+        """
+        if not self._minimal:
+            return None
+        if self._incremental is None:
+            self._incremental = IncrementalIndex(self)
+        return self._incremental
+
+    def _edit(self, state: str, c: str, result_state: Optional[str]) -> None:
+        """
+        Changes the transition (removing it for None), then updates
+        the automata incrementally, or minimizes it again if it wasn't
+        minimal to begin with
+        """
+        index = self._incremental_index()
+        program_function = self.program_function
+        old = program_function.get((state, c))
+        if old == result_state:
+            return
+        if result_state is None:
+            del program_function[(state, c)]
+        else:
+            program_function[(state, c)] = result_state
+        if index is None:
+            self.minimize()
+            return
+        lost = set()
+        if old is not None:
+            index.reverse[old].discard((state, c))
+            lost.add(old)
+        if result_state is not None:
+            index.reverse.setdefault(result_state, set()).add((state, c))
+        self._reminimize(index, {state}, lost)
+
+    def _ancestors(
+        self, index: IncrementalIndex, states: Set[str]
+    ) -> Set[str]:
+        """
+        The states with a path to any of the states, themselves included
+        Only their languages can change when the states change
+        """
+        ancestors = set(states)
+        to_visit = list(states)
+        while to_visit:
+            for state, _ in index.reverse.get(to_visit.pop(), ()):
+                if state not in ancestors:
+                    ancestors.add(state)
+                    to_visit.append(state)
+        return ancestors
+
+    def _match_affected(
+        self, index: IncrementalIndex, affected: Set[str]
+    ) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Finds, for each affected state, the unaffected state (or
+        Undefined, for the empty language) it's now equivalent to,
+        None if there's none
+        Returns None when a cycle of affected states gives no hint
+        of what it could be equivalent to
+        Unaffected states are all distinguishable, and only lead to
+        unaffected states, so a state whose next states are known
+        is matched by its signature. States waiting on each other
+        in a cycle are matched by trying the states that could fit
+        """
+        program_function = self.program_function
+        final_states = self.final_states
+        symbols = index.symbols
+        match: Dict[str, Optional[str]] = {}
+        waiting = {
+            state: sum(
+                program_function.get((state, c)) in affected for c in symbols
+            )
+            for state in affected
+        }
+        ready = [state for state, count in waiting.items() if not count]
+
+        def resolved(state: str) -> None:
+            for previous, _ in index.reverse.get(state, ()):
+                if previous in waiting and previous not in match:
+                    waiting[previous] -= 1
+                    if not waiting[previous]:
+                        ready.append(previous)
+
+        def value(state: Optional[str]) -> Optional[str]:
+            # what a next state is known to be equivalent to
+            if state is None:
+                return "Undefined"
+            if state in affected:
+                return match.get(state)
+            return state
+
+        pending = set(affected)
+        while pending:
+            while ready:
+                state = ready.pop()
+                if state in match:
+                    continue
+                next_states = [
+                    value(program_function.get((state, c))) for c in symbols
+                ]
+                if None in next_states:
+                    # a next state matches nothing, so neither does this one
+                    match[state] = None
+                else:
+                    match[state] = index.signatures.get(
+                        (
+                            state in final_states,
+                            tuple(
+                                None if s == "Undefined" else s
+                                for s in next_states
+                            ),
+                        )
+                    )
+                pending.discard(state)
+                resolved(state)
+            if not pending:
+                break
+            state = pending.pop()
+            candidates = self._match_candidates(index, affected, match, state)
+            if candidates is None:
+                return None
+            pairs = None
+            for candidate in candidates:
+                pairs = self._bisimilar(affected, match, state, candidate)
+                if pairs is not None:
+                    break
+            for matched, candidate in (pairs or {state: None}).items():
+                match[matched] = candidate
+                pending.discard(matched)
+                resolved(matched)
+        return match
+
+    def _match_candidates(
+        self,
+        index: IncrementalIndex,
+        affected: Set[str],
+        match: Dict[str, Optional[str]],
+        state: str,
+    ) -> Optional[List[str]]:
+        """
+        The unaffected states (and Undefined) the state could be
+        equivalent to, the ones with a transition into what a next
+        state of it was matched to, None if none of them is known
+        """
+        final = state in self.final_states
+        candidates = [] if final else ["Undefined"]
+        for c in index.symbols:
+            result_state = self.program_function.get((state, c))
+            if result_state is None:
+                continue
+            if result_state in affected:
+                if result_state not in match:
+                    continue
+                result_state = match[result_state]
+                if result_state is None:
+                    return []
+                if result_state == "Undefined":
+                    continue
+            return candidates + [
+                previous
+                for previous, symbol in index.reverse.get(result_state, ())
+                if symbol == c
+                and previous not in affected
+                and (previous in self.final_states) == final
+            ]
+        if any(
+            (state, c) in self.program_function for c in index.symbols
+        ):
+            return None
+        return candidates
+
+    def _bisimilar(
+        self,
+        affected: Set[str],
+        match: Dict[str, Optional[str]],
+        state: str,
+        candidate: str,
+    ) -> Optional[Dict[str, str]]:
+        """
+        Tells if the affected state is equivalent to the unaffected
+        candidate, following both together
+        Returns the affected states reached, each with the
+        unaffected state it's equivalent to, or None if they differ
+        """
+        program_function = self.program_function
+        final_states = self.final_states
+        pairs: Dict[str, str] = {}
+        to_visit = [(state, candidate)]
+        while to_visit:
+            current, other = to_visit.pop()
+            if current not in affected or current in match:
+                known = match.get(current, current)
+                if known != other:
+                    return None
+                continue
+            if current in pairs:
+                if pairs[current] != other:
+                    return None
+                continue
+            if (current in final_states) != (other in final_states):
+                return None
+            pairs[current] = other
+            for c in self.alphabet:
+                to_visit.append(
+                    (
+                        program_function.get((current, c), "Undefined"),
+                        program_function.get((other, c), "Undefined"),
+                    )
+                )
+        return pairs
+
+    def _refine_affected(
+        self,
+        index: IncrementalIndex,
+        survivors: List[str],
+        replacement: Dict[str, str],
+    ) -> List[List[str]]:
+        """
+        Splits the affected states that matched nothing into
+        their equivalency classes, refining by finality and then
+        by the class of each next state until nothing splits
+        """
+        program_function = self.program_function
+        block = {state: int(state in self.final_states) for state in survivors}
+        count = len(set(block.values()))
+        while True:
+            signatures: Dict[tuple, int] = {}
+            new_block = {}
+            for state in survivors:
+                next_blocks = []
+                for c in index.symbols:
+                    result_state = program_function.get((state, c))
+                    result_state = replacement.get(result_state, result_state)
+                    if result_state == "Undefined":
+                        result_state = None
+                    next_blocks.append(block.get(result_state, result_state))
+                new_block[state] = signatures.setdefault(
+                    (block[state], tuple(next_blocks)), len(signatures)
+                )
+            block = new_block
+            if len(signatures) == count:
+                break
+            count = len(signatures)
+        classes: Dict[int, List[str]] = {}
+        for state in survivors:
+            classes.setdefault(block[state], []).append(state)
+        return list(classes.values())
+
+    def _reminimize(
+        self, index: IncrementalIndex, edited: Set[str], lost: Set[str]
+    ) -> None:
+        """
+        Makes the automata minimal again after the edited states
+        changed, lost being the states that lost a transition into them
+        Only the ancestors of the edited states are looked at, plus
+        what's reachable from the states that lost a transition,
+        when they are too many it's all minimized again instead
+        """
+        # pylint: disable=too-many-locals
+        program_function = self.program_function
+        affected = self._ancestors(index, edited)
+        if len(affected) > INCREMENTAL_SHARE * len(self.states):
+            self.minimize()
+            return
+        for state in affected:
+            index.discard(state)
+        match = self._match_affected(index, affected)
+        if match is None:
+            self.minimize()
+            return
+        replacement = {
+            state: other for state, other in match.items() if other is not None
+        }
+        survivors = [state for state in affected if state not in replacement]
+        classes = self._refine_affected(index, survivors, replacement)
+        # the new name of every affected state
+        rename = dict(replacement)
+        for ec in classes:
+            if len(ec) == 1:
+                name = ec[0]
+            elif self.naming == "short":
+                name = f"m{index.ids}"
+                index.ids += 1
+            else:
+                name = self.make_state_name(frozenset(ec))
+            for state in ec:
+                rename[state] = name
+        # every transition from an affected state is made again,
+        # those are the only transitions into affected states
+        old_transitions = {}
+        for state in affected:
+            for c in index.symbols:
+                result_state = program_function.pop((state, c), None)
+                if result_state is not None:
+                    old_transitions[(state, c)] = result_state
+                    index.reverse[result_state].discard((state, c))
+                    if result_state not in affected:
+                        lost.add(result_state)
+        for state in affected:
+            index.reverse.pop(state, None)
+        new_final_states = {
+            rename[ec[0]] for ec in classes if ec[0] in self.final_states
+        }
+        self.states.difference_update(affected)
+        self.final_states.difference_update(affected)
+        for ec in classes:
+            name = rename[ec[0]]
+            self.states.add(name)
+            index.reverse.setdefault(name, set())
+        self.final_states.update(new_final_states)
+        for ec in classes:
+            name = rename[ec[0]]
+            for c in index.symbols:
+                result_state = old_transitions.get((ec[0], c))
+                result_state = rename.get(result_state, result_state)
+                if result_state is not None and result_state != "Undefined":
+                    program_function[(name, c)] = result_state
+                    index.reverse[result_state].add((name, c))
+        # merged_states keeps telling what each state was made of
+        members: Dict[str, List[FrozenSet[str]]] = {}
+        for state in affected:
+            members.setdefault(rename[state], []).append(
+                self._classes.pop(state, frozenset([state]))
+            )
+        members.pop("Undefined", None)
+        matched = set(replacement.values())
+        for name, parts in members.items():
+            if name in matched:
+                # an unaffected state was already made of its own members
+                parts.append(self._classes.get(name, frozenset([name])))
+            self._classes[name] = frozenset().union(*parts)
+        if self.initial_state in rename:
+            # an empty language keeps the old name, like minimize does
+            if rename[self.initial_state] != "Undefined":
+                self.initial_state = rename[self.initial_state]
+        for ec in classes:
+            index.add(self, rename[ec[0]])
+        lost.difference_update(affected)
+        lost.update(rename[ec[0]] for ec in classes)
+        self._remove_unreachable(index, lost)
+        # reassigned so a compiled table is discarded,
+        # what it drops is still up to date
+        self.program_function = program_function
+        self._minimal = True
+        self._incremental = index
+
+    def _reachable(self, index: IncrementalIndex, state: str) -> bool:
+        """
+        Tells if the state can be reached from the initial
+        state, searching backwards from it
+        """
+        seen = {state}
+        to_visit = [state]
+        while to_visit:
+            current = to_visit.pop()
+            if current == self.initial_state:
+                return True
+            for previous, _ in index.reverse.get(current, ()):
+                if previous not in seen:
+                    seen.add(previous)
+                    to_visit.append(previous)
+        return False
+
+    def _remove_unreachable(
+        self, index: IncrementalIndex, candidates: Set[str]
+    ) -> None:
+        """
+        Removes the states that can't be reached anymore, only the
+        candidates (and what's reachable from them) may be the case
+        """
+        unreachable = {
+            state
+            for state in candidates
+            if state in self.states and not self._reachable(index, state)
+        }
+        if not unreachable:
+            return
+        # everything only reachable through them goes too,
+        # states outside of what they reach are still reachable
+        reached = set(unreachable)
+        to_visit = list(unreachable)
+        while to_visit:
+            state = to_visit.pop()
+            for c in index.symbols:
+                result_state = self.program_function.get((state, c))
+                if result_state is not None and result_state not in reached:
+                    reached.add(result_state)
+                    to_visit.append(result_state)
+        alive = [
+            state
+            for state in reached
+            if state == self.initial_state
+            or any(
+                previous not in reached
+                for previous, _ in index.reverse.get(state, ())
+            )
+        ]
+        alive_set = set(alive)
+        while alive:
+            state = alive.pop()
+            for c in index.symbols:
+                result_state = self.program_function.get((state, c))
+                if result_state in reached and result_state not in alive_set:
+                    alive_set.add(result_state)
+                    alive.append(result_state)
+        removed = reached.difference(alive_set)
+        for state in removed:
+            for c in index.symbols:
+                result_state = self.program_function.pop((state, c), None)
+                if result_state is not None and result_state not in removed:
+                    index.reverse[result_state].discard((state, c))
+        for state in removed:
+            index.reverse.pop(state, None)
+            index.discard(state)
+            self.states.discard(state)
+            self.final_states.discard(state)
+            self._classes.pop(state, None)
 
     def unreacheable_states(self) -> Set[str]:
         """
@@ -115,20 +740,77 @@ class MinimizedAutomata(Automata):
         new_list.sort()
         return "".join(new_list)
 
-    def unify_states(self) -> None:
+    def state_names(
+        self, classes: Set[FrozenSet[str]]
+    ) -> Dict[FrozenSet[str], str]:
+        """
+        Names each equivalency class following the naming policy
+        Short names are given in the order of the smallest
+        state of each class, so they don't depend on set order,
+        the class with Undefined (never a useful state) keeps that name
+        """
+        if self.naming == "concatenate":
+            return {ec: self.make_state_name(ec) for ec in classes}
+        names = {ec: "Undefined" for ec in classes if "Undefined" in ec}
+        ordered = sorted(classes.difference(names), key=min)
+        names.update((ec, f"m{i}") for i, ec in enumerate(ordered))
+        return names
+
+    def merged_states(self) -> Dict[str, List[str]]:
         """
-        Using the equivalency classes of the hopcroft
+        Maps each unified state to the sorted states
+        it was made of, built when asked for
+        Empty before unify_states
+        """
+        return {
+            name: sorted(ec.difference({"Undefined"}))
+            for name, ec in self._classes.items()
+        }
+
+    def equivalency_classes(
+        self, algorithm: str = "hopcroft"
+    ) -> Set[FrozenSet[str]]:
+        """
+        Finds the equivalency classes of the states (and Undefined)
+        with the chosen algorithm, "hopcroft", "table_filling"
+        or "packed_table_filling"
+        Will raise ValueError for any other algorithm
+        """
+        algorithms = {
+            "hopcroft": self.hopcroft_algorithm,
+            "table_filling": self.table_filling_algorithm,
+            "packed_table_filling": self.packed_table_filling_algorithm,
+        }
+        if algorithm not in algorithms:
+            raise ValueError(
+                f"Unknown algorithm {algorithm}, "
+                f"expected one of {', '.join(algorithms)}"
+            )
+        return algorithms[algorithm]()
+
+    def unify_states(self, algorithm: str = "hopcroft") -> None:
+        """
+        Using the equivalency classes of the chosen
         algorithm, unifies non-distinguishable states
         """
         # pylint: disable=attribute-defined-outside-init
-        equivalency_classes = self.table_filling_algorithm()
+        self.program_function = self.total_function()
+        equivalency_classes = self.equivalency_classes(algorithm)
         equivalency_dict = {}
         new_states: Set[str] = set()
         new_final_states = set()
-        for ec in equivalency_classes:
-            # we make the new name, and add it to the new_states
-            name = self.make_state_name(ec)
+        initial_state = self.initial_state
+        # states unified before are expanded, so the
+        # members are always the states of the original automata
+        previous, self._classes = self._classes, {}
+        for ec, name in self.state_names(equivalency_classes).items():
+            # we add the new name to the new_states
             new_states.add(name)
+            self._classes[name] = (
+                frozenset().union(*(previous.get(e, (e,)) for e in ec))
+                if previous
+                else ec
+            )
             for elem in ec:
                 # to each element in the eq class
                 # we add it to a dict with the right name
@@ -137,7 +819,7 @@ class MinimizedAutomata(Automata):
                     # we also add it to the new list of final_states
                     # a set to make my life easier
                     new_final_states.add(name)
-                if elem == self.initial_state:
+                if elem == initial_state:
                     # if that element is an initial state, so the new
                     # initial state changes name
                     self.initial_state = name
@@ -150,66 +832,151 @@ class MinimizedAutomata(Automata):
         self.states = new_states
         self.program_function = new_program_function
 
-    # ultimately not used in the program
-    # But I decided to leave it here
-    def hopcroft_alogrithm(self) -> Set[FrozenSet[str]]:
+    def interned_total_function(self) -> Tuple[List[str], List[array]]:
         """
-        The Hopcroft Algorithm, following the pseudocode
-        found in:
+        Numbers the states, with Undefined as the last one
+        Returns the state names and, for each symbol of the
+        sorted alphabet, the array with the next state of every state
+        Undefined transitions go to Undefined
+        """
+        names = sorted(self.states.difference({"Undefined"}))
+        names.append("Undefined")
+        undefined = len(names) - 1
+        index = {name: i for i, name in enumerate(names)}
+        delta = []
+        for c in sorted(self.alphabet):
+            next_states = array("i", [undefined]) * len(names)
+            for i, state in enumerate(names):
+                result_state = self.program_function.get((state, c))
+                if result_state is not None:
+                    next_states[i] = index[result_state]
+            delta.append(next_states)
+        return names, delta
+
+    @staticmethod
+    def inverse_transitions(
+        next_states: array, n_states: int
+    ) -> Tuple[array, array]:
+        """
+        Inverts the transitions of one symbol
+        Returns (offsets, sources), the states that lead to state i
+        are sources[offsets[i]:offsets[i + 1]]
+        """
+        offsets = array("i", [0]) * (n_states + 1)
+        for target in next_states:
+            offsets[target + 1] += 1
+        for i in range(n_states):
+            offsets[i + 1] += offsets[i]
+        fill = offsets[:-1]
+        sources = array("i", [0]) * len(next_states)
+        for state, target in enumerate(next_states):
+            sources[fill[target]] = state
+            fill[target] += 1
+        return offsets, sources
+
+    def hopcroft_algorithm(self) -> Set[FrozenSet[str]]:
+        """
+        The Hopcroft Algorithm, O(n·k·log n), over the total function
         https://en.wikipedia.org/wiki/DFA_minimization#Hopcroft's_algorithm
-        Adapted to Python (new variables, frozen sets)
-        """
-        # the sets need to be frozen, because python
-        # needs set elements to be hashable, and mutable
-        # types can't be hashed for it
-        final_states_set = frozenset(self.final_states)
-        non_final_states_set = frozenset(self.states) - frozenset(
-            self.final_states
-        )
-        p: Set[FrozenSet[str]] = set([final_states_set, non_final_states_set])
-        # new_p is used because p needs to change, but
-        # python can't have a collection being changed mid-iteration
-        new_p = copy.deepcopy(p)
-        w: Set[FrozenSet[str]] = set([final_states_set, non_final_states_set])
-        while w:
-            a = w.pop()
-            # the original pseudocode just said "choose an a"
-            # so, just popped one
-            for c in self.alphabet:
-                # this set comphrehesion basically means
-                # let x = every state that a transiction with 'c'
-                # that leads to a state in 'a'
-                x = {
-                    state
-                    for (
-                        state,
-                        character,
-                    ), result_state in self.program_function.items()
-                    if result_state in a and character == c
-                }
-                # p needs to be new_p
-                # due to shallow copy, this is the only way
-                p = copy.deepcopy(new_p)
-                for y in p:
-                    # the comparation with empty set isn't pythonic
-                    # but it seemed more on par with the pseudocode
-                    if x & y == set() or y - x == set():
+        Blocks are contiguous ranges of one array of states, and the states
+        that lead into a splitter are moved to the front of their block,
+        so splitting a block is only moving its boundary
+        """
+        names, delta = self.interned_total_function()
+        n_states = len(names)
+        n_symbols = len(delta)
+        inverse = [self.inverse_transitions(d, n_states) for d in delta]
+        final_states = self.final_states
+        finals = [i for i, name in enumerate(names) if name in final_states]
+        non_finals = [
+            i for i, name in enumerate(names) if name not in final_states
+        ]
+        # elements holds the states ordered by block, location is
+        # the position of each state in it
+        elements = array("i", finals + non_finals)
+        location = array("i", [0]) * n_states
+        for position, state in enumerate(elements):
+            location[state] = position
+        block_of = array("i", [0]) * n_states
+        first: List[int] = []
+        end: List[int] = []
+        for block in (finals, non_finals):
+            if not block:
+                continue
+            start = end[-1] if end else 0
+            for state in block:
+                block_of[state] = len(first)
+            first.append(start)
+            end.append(start + len(block))
+        marked = [0] * len(first)
+        worklist: List[Tuple[int, int]] = []
+        if len(first) == 2:
+            smaller = 0 if len(finals) <= len(non_finals) else 1
+            for c in range(n_symbols):
+                worklist.append((smaller, c))
+        while worklist:
+            splitter, c = worklist.pop()
+            offsets, sources = inverse[c]
+            touched = []
+            # copied, marking moves states around inside the blocks
+            for target in elements[first[splitter] : end[splitter]]:
+                for j in range(offsets[target], offsets[target + 1]):
+                    state = sources[j]
+                    block = block_of[state]
+                    boundary = first[block] + marked[block]
+                    position = location[state]
+                    if position < boundary:
                         continue
-                    new_p.remove(y)
-                    # we used y ∩ x instead of x ∩ y because
-                    # of how python handles sets x frozensets operations
-                    new_p.add(y & x)
-                    new_p.add(y - x)
-                    if y in w:
-                        w.remove(y)
-                        w.add(y & x)
-                        w.add(y - x)
-                    else:
-                        if len(x & y) <= len(y - x):
-                            w.add(y & x)
-                        else:
-                            w.add(y - x)
-        return p
+                    # swaps the state to the end of the marked prefix
+                    other = elements[boundary]
+                    elements[boundary] = state
+                    location[state] = boundary
+                    elements[position] = other
+                    location[other] = position
+                    if not marked[block]:
+                        touched.append(block)
+                    marked[block] += 1
+            for block in touched:
+                size = end[block] - first[block]
+                boundary = first[block] + marked[block]
+                marked[block] = 0
+                if boundary == end[block]:
+                    continue
+                # the new block is always the smaller half
+                new_block = len(first)
+                if boundary - first[block] <= size // 2:
+                    first.append(first[block])
+                    end.append(boundary)
+                    first[block] = boundary
+                else:
+                    first.append(boundary)
+                    end.append(end[block])
+                    end[block] = boundary
+                for position in range(first[new_block], end[new_block]):
+                    block_of[elements[position]] = new_block
+                marked.append(0)
+                # if (block, c) was waiting, the old index now stands
+                # for one half and the new block must wait too,
+                # otherwise the smaller half is enough: either way,
+                # only the new block has to be added
+                for symbol in range(n_symbols):
+                    worklist.append((new_block, symbol))
+        return {
+            frozenset(names[elements[position]] for position in range(b, e))
+            for b, e in zip(first, end)
+        }
+
+    def hopcroft_alogrithm(self) -> Set[FrozenSet[str]]:
+        """
+        Kept for compatibility, the classes of hopcroft_algorithm
+        without the Undefined state
+        """
+        classes = set()
+        for ec in self.hopcroft_algorithm():
+            ec = ec.difference({"Undefined"})
+            if ec:
+                classes.add(ec)
+        return classes
 
     def total_function(self) -> Dict[Tuple[str, str], str]:
         """
@@ -228,33 +995,50 @@ class MinimizedAutomata(Automata):
             total_fun[("Undefined", c)] = "Undefined"
         return total_fun
 
-    def mark_as_distinguishable(self, pair: TablePair) -> None:
+    @staticmethod
+    def mark_as_distinguishable(pair: TablePair) -> None:
         """
-        Marks a table pair as distinguishable, and recursively
-        marks any pair in it's dependecies
-        Hopefully Python's shallow copy method will help me
+        Marks a table pair as distinguishable, and every pair
+        that depends on it, following the dependecies with a
+        worklist instead of recursion, so long chains can't
+        hit the recursion limit
+        Kept for compatibility, with TablePair,
+        mark_index_as_distinguishable is the one in use
         """
         pair.distinguishable = True
-        for dep in pair.dependicies:
-            if not dep.distinguishable:
-                self.mark_as_distinguishable(dep)
-        pair.dependicies = set()
+        worklist = [pair]
+        while worklist:
+            current = worklist.pop()
+            for dep in current._dependicies or ():
+                if not dep.distinguishable:
+                    dep.distinguishable = True
+                    worklist.append(dep)
+            current._dependicies = None
+
+    def reverse_transitions(self) -> Dict[str, List[str]]:
+        """
+        Creates the reverse index of the program function,
+        mapping each state to the states with a transition into it
+        """
+        reverse: Dict[str, List[str]] = {}
+        for (state, _), result_state in self.program_function.items():
+            reverse.setdefault(result_state, []).append(state)
+        return reverse
 
     def useless_states(self) -> Set[str]:
         """
         Find the useless tates of an automata
+        The useful ones are found with a single backwards
+        search from the final states, over the reverse index
         """
+        reverse = self.reverse_transitions()
         useful_states = set(self.final_states)
-        changed = True
-        while changed:
-            changed = False
-            for (state, _), result_state in self.program_function.items():
-                if (
-                    result_state in useful_states
-                    and state not in useful_states
-                ):
+        to_visit = list(useful_states)
+        while to_visit:
+            for state in reverse.get(to_visit.pop(), ()):
+                if state not in useful_states:
                     useful_states.add(state)
-                    changed = True
+                    to_visit.append(state)
         return set(self.states) - useful_states
 
     @staticmethod
@@ -262,26 +1046,22 @@ class MinimizedAutomata(Automata):
         table: Dict[FrozenSet[str], TablePair]
     ) -> Set[FrozenSet[str]]:
         """
-        With the table created by the algorithm,
-        creates a set of sets with the equivalency classes.
+        With a table of TablePair, creates a set of
+        sets with the equivalency classes.
         Akin to the result of the hopcroft algorithm, though
         arguably, slower
+        Kept for compatibility, with TablePair
         """
-        undistuinguishables = set()
-        to_return_set = set()
+        # equivalence is transitive, so a state's class is
+        # the state plus every state it is undistinguishable from
+        undistuinguishables: Dict[str, Set[str]] = {}
         for pair in table.values():
+            undistuinguishables.setdefault(pair.state1, {pair.state1})
+            undistuinguishables.setdefault(pair.state2, {pair.state2})
             if not pair.distinguishable:
-                undistuinguishables.add(pair.state1)
-                undistuinguishables.add(pair.state2)
-        for pair in table.values():
-            if pair.distinguishable:
-                if pair.state1 not in undistuinguishables:
-                    to_return_set.add(frozenset([pair.state1]))
-                if pair.state2 not in undistuinguishables:
-                    to_return_set.add(frozenset([pair.state2]))
-            else:
-                to_return_set.add(frozenset(pair))
-        return to_return_set
+                undistuinguishables[pair.state1].add(pair.state2)
+                undistuinguishables[pair.state2].add(pair.state1)
+        return {frozenset(ec) for ec in undistuinguishables.values()}
 
     def mark_final_and_non_final_pairs(
         self, table: Dict[FrozenSet[str], TablePair]
@@ -289,6 +1069,7 @@ class MinimizedAutomata(Automata):
         """
         Marks all table pairs that have a combination of final and
         non-final states
+        Kept for compatibility, with TablePair
         """
         for table_pair in table.values():
             if (
@@ -303,30 +1084,171 @@ class MinimizedAutomata(Automata):
         """
         The table filling algorithm, as seen in class
         Or at least the closest I could get
+        States are numbered once (Undefined included), the table is a
+        bytearray with pair (i, j), i < j, at j * (j - 1) / 2 + i, and
+        only the pairs something depends on get a dependecy array
         """
-        # pylint: disable=attribute-defined-outside-init
-        self.program_function = self.total_function()
-        # all the possible pairs, including Undefined
-        table_pairs = combinations(self.states.union({"Undefined"}), 2)
-        # the table is a dictionary with pair: TablePair, with
-        # the pair being a frozenset (order doesn't matter, and is hashable)
-        table = {frozenset(pair): TablePair(*pair) for pair in table_pairs}
-        self.mark_final_and_non_final_pairs(table)
+        names, delta = self.interned_total_function()
+        n_states = len(names)
+        final_states = self.final_states
+        final = bytes(name in final_states for name in names)
+        distinguishable = bytearray(n_states * (n_states - 1) // 2)
+        dependicies: Dict[int, array] = {}
+        for j in range(n_states):
+            base = j * (j - 1) // 2
+            for i in range(j):
+                if final[i] != final[j]:
+                    distinguishable[base + i] = 1
         # searches the table
-        for table_pair in table.values():
-            for c in self.alphabet:
-                result_state1 = self.program_function[table_pair.state1, c]
-                result_state2 = self.program_function[table_pair.state2, c]
-                # if they go to the same state, skip letter
-                if result_state1 == result_state2:
+        for j in range(n_states):
+            base = j * (j - 1) // 2
+            for i in range(j):
+                index = base + i
+                if distinguishable[index]:
                     continue
-                results_set = frozenset([result_state1, result_state2])
-                # if the result is distinguishable, recursively
-                # mark the dependecies and the pair itself
-                if table[results_set].distinguishable:
-                    self.mark_as_distinguishable(table_pair)
-                # otherwise, add pair to result dependecy list
-                else:
-                    table[results_set].dependicies.add(table_pair)
-        states = self.create_undistinguishable_sets(table)
-        return states
+                for next_states in delta:
+                    a = next_states[i]
+                    b = next_states[j]
+                    # if they go to the same state, skip letter
+                    if a == b:
+                        continue
+                    if a < b:
+                        result = b * (b - 1) // 2 + a
+                    else:
+                        result = a * (a - 1) // 2 + b
+                    # if the result is distinguishable, mark the
+                    # dependecies and the pair itself
+                    if distinguishable[result]:
+                        self.mark_index_as_distinguishable(
+                            index, distinguishable, dependicies
+                        )
+                        break
+                    # otherwise, add pair to result dependecy list
+                    dependicies.setdefault(result, array("i")).append(index)
+        classes = set()
+        assigned = bytearray(n_states)
+        for i in range(n_states):
+            if assigned[i]:
+                continue
+            ec = [i]
+            for j in range(i + 1, n_states):
+                if not assigned[j] and not distinguishable[
+                    j * (j - 1) // 2 + i
+                ]:
+                    assigned[j] = 1
+                    ec.append(j)
+            classes.add(frozenset(names[state] for state in ec))
+        return classes
+
+    @staticmethod
+    def mark_index_as_distinguishable(
+        index: int, distinguishable: bytearray, dependicies: Dict[int, array]
+    ) -> None:
+        """
+        mark_as_distinguishable over the interned table, dependecies
+        are dropped as soon as they are followed
+        """
+        distinguishable[index] = 1
+        worklist = [index]
+        while worklist:
+            for dep in dependicies.pop(worklist.pop(), ()):
+                if not distinguishable[dep]:
+                    distinguishable[dep] = 1
+                    worklist.append(dep)
+
+    def packed_table_filling_algorithm(self) -> Set[FrozenSet[str]]:
+        """
+        The table filling algorithm with a bit per pair, and only
+        the pairs that need it
+        States are grouped by their finality and the finality of each
+        of their next states, pairs from different groups are told
+        apart by a word of at most one element, so they are never
+        stored nor visited. States are numbered group after group,
+        each group has a triangular bit array, pair (i, j), i < j,
+        being bit base[j] + i
+        Dependecies are arrays drained with a worklist, as in
+        table_filling_algorithm
+        """
+        names, delta = self.interned_total_function()
+        n_states = len(names)
+        final_states = self.final_states
+        final = [name in final_states for name in names]
+        # the group of each state, kept in name order inside of it
+        key = [
+            (final[state], [final[d[state]] for d in delta])
+            for state in range(n_states)
+        ]
+        order = sorted(range(n_states), key=lambda state: key[state])
+        number = array("i", [0]) * n_states
+        for new, old in enumerate(order):
+            number[old] = new
+        names = [names[old] for old in order]
+        delta = [
+            array("i", [number[next_states[old]] for old in order])
+            for next_states in delta
+        ]
+        # the first state of the group of each state, and where its
+        # row starts minus that first state, so a pair is base[j] + i
+        group = array("i", [0]) * n_states
+        base = array("q", [0]) * n_states
+        size = first = 0
+        for j in range(n_states):
+            if key[order[j]] != key[order[first]]:
+                size += (j - first) * (j - first - 1) // 2
+                first = j
+            group[j] = first
+            base[j] = size + (j - first) * (j - first - 1) // 2 - first
+        size += (n_states - first) * (n_states - first - 1) // 2
+        table = bytearray((size + 7) // 8)
+        dependicies: Dict[int, array] = {}
+        mark = self.mark_bit_as_distinguishable
+        for j in range(n_states):
+            base_j = base[j]
+            next_j = [next_states[j] for next_states in delta]
+            for i in range(group[j], j):
+                index = base_j + i
+                if table[index >> 3] >> (index & 7) & 1:
+                    continue
+                for next_states, b in zip(delta, next_j):
+                    a = next_states[i]
+                    if a == b:
+                        continue
+                    if group[a] != group[b]:
+                        mark(index, table, dependicies)
+                        break
+                    result = base[b] + a if a < b else base[a] + b
+                    if table[result >> 3] >> (result & 7) & 1:
+                        mark(index, table, dependicies)
+                        break
+                    dependicies.setdefault(result, array("q")).append(index)
+        classes = set()
+        assigned = bytearray(n_states)
+        for j in range(n_states):
+            if assigned[j]:
+                continue
+            ec = [j]
+            for i in range(j + 1, n_states):
+                if group[i] != group[j]:
+                    break
+                index = base[i] + j
+                if assigned[i] or table[index >> 3] >> (index & 7) & 1:
+                    continue
+                assigned[i] = 1
+                ec.append(i)
+            classes.add(frozenset(names[state] for state in ec))
+        return classes
+
+    @staticmethod
+    def mark_bit_as_distinguishable(
+        index: int, table: bytearray, dependicies: Dict[int, array]
+    ) -> None:
+        """
+        mark_index_as_distinguishable over a bit table
+        """
+        table[index >> 3] |= 1 << (index & 7)
+        worklist = [index]
+        while worklist:
+            for dep in dependicies.pop(worklist.pop(), ()):
+                if not table[dep >> 3] >> (dep & 7) & 1:
+                    table[dep >> 3] |= 1 << (dep & 7)
+                    worklist.append(dep)
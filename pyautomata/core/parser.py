@@ -4,10 +4,13 @@ And two concrete instances, WordFileParser and
 AutomataParser
 """
 import abc
+import io
+import mmap
 import re
-from typing import Dict, List, Tuple, Union, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union, Set
 
-from more_itertools import grouper
+_PAIR_PATTERN = re.compile(r"\w*,\w*")
+_TRANSITION_PATTERN = re.compile(r"\((\w+),(\w+)\)=(\w+)")
 
 
 class Parser(abc.ABC):
@@ -32,29 +35,86 @@ class WordFileParser(Parser):
         The constructor, either a file_name or a content must be provided
         If both are provided, file_name is used
         If none are provided, ValueError is raised
+        The file is only read when needed
         """
         if file_name:
-            with open(file_name, encoding="utf-8") as f:
-                self.content = f.read()
+            self.file_name: Optional[str] = file_name
+            self._content: Optional[str] = None
         elif content:
-            self.content = content
+            self.file_name = None
+            self._content = content
         else:
             raise ValueError(
                 "Either file_name or content must be provided"
                 "(file_name is prioritized)"
             )
 
+    @property
+    def content(self) -> str:
+        """
+        Returns the input string, reading the whole file if needed
+        """
+        if self._content is None:
+            with open(self.file_name, encoding="utf-8") as f:
+                self._content = f.read()
+        return self._content
+
+    @content.setter
+    def content(self, s: str) -> None:
+        """
+        Changes the input string for the program
+        """
+        self.file_name = None
+        self._content = s
+
     def parse(self) -> List[Tuple[str, str]]:
         """
         Parse the contents and return a list of tuples
         With all the words
         """
-        results = re.findall(r"\w*,\w*", self.content)
-        to_return: List[Tuple[str, str]] = []
-        for w in results:
-            splitted: List[str] = w.split(",")
-            to_return.append((splitted[0], splitted[1]))
-        return to_return
+        return list(self.iter_parse())
+
+    def iter_parse(self) -> Iterator[Tuple[str, str]]:
+        """
+        Parse the contents lazily, yielding one pair at a time
+        A file is memory-mapped and read line by line,
+        so it's never loaded whole
+        """
+        return (pair for _, pair in self.iter_parse_lines())
+
+    def iter_parse_lines(self) -> Iterator[Tuple[int, Tuple[str, str]]]:
+        """
+        The same as iter_parse, yielding each pair
+        with the number of the line it's on, starting at 1
+        """
+        if self.file_name is None:
+            yield from self._iter_lines(self.content.split("\n"))
+            return
+        with open(self.file_name, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files can't be mapped, and have no pairs
+                return
+            with mapped:
+                lines = (
+                    line.decode("utf-8")
+                    for line in iter(mapped.readline, b"")
+                )
+                yield from self._iter_lines(lines)
+
+    @staticmethod
+    def _iter_lines(
+        lines: Iterable[str],
+    ) -> Iterator[Tuple[int, Tuple[str, str]]]:
+        """
+        Yields the pairs of each line with its number
+        """
+        for line_number, line in enumerate(lines, 1):
+            # a pair never spans lines, \w doesn't match them
+            for match in _PAIR_PATTERN.finditer(line):
+                word1, word2 = match.group().split(",")
+                yield line_number, (word1, word2)
 
 
 class AutomataParser(Parser):
@@ -67,12 +127,14 @@ class AutomataParser(Parser):
         The constructor, either a file_name or a content must be provided
         If both are provided, file_name is used
         If none are provided, ValueError is raised
+        The file is only read when parsed, line by line
         """
         if file_name:
-            with open(file_name, encoding="utf-8") as f:
-                self.content = f.read()
+            self.file_name: Optional[str] = file_name
+            self._content: Optional[str] = None
         elif content:
-            self.content = content
+            self.file_name = None
+            self._content = content
         else:
             raise ValueError(
                 "Either file_name or content must be provided"
@@ -82,8 +144,11 @@ class AutomataParser(Parser):
     @property
     def content(self) -> str:
         """
-        Returns the input string
+        Returns the input string, reading the whole file if needed
         """
+        if self._content is None:
+            with open(self.file_name, encoding="utf-8") as f:
+                self._content = f.read()
         return self._content
 
     @content.setter
@@ -91,6 +156,7 @@ class AutomataParser(Parser):
         """
         Changes the input string for the program
         """
+        self.file_name = None
         self._content = s
 
     @staticmethod
@@ -121,14 +187,10 @@ class AutomataParser(Parser):
         Parses the program function
         returns a dictionary that waits for a tuple as a key (state, word)
         """
-        program_function_results = re.findall(
-            r"(?<=\()\w+,\w+(?=\)=)|(?<==)\w+", program_function
-        )
-        grouped = grouper(program_function_results, 2)
-        return_dict = {}
-        for group in grouped:
-            state, transition_word = tuple(group[0].split(","))
-            return_dict.update({(state, transition_word): group[1]})
+        return_dict: Dict[Tuple[str, str], str] = {}
+        transitions = _TRANSITION_PATTERN.findall(program_function)
+        for state, transition_word, result_state in transitions:
+            return_dict[(state, transition_word)] = result_state
         return return_dict
 
     def parse(
@@ -137,12 +199,29 @@ class AutomataParser(Parser):
         """
         Run the whole parsing
         Returns 2 dictionaries: (description, program function)
+        The input is read one line at a time, each transition
+        going straight into the program function
+        """
+        if self.file_name is None:
+            return self.parse_lines(io.StringIO(self.content))
+        with open(self.file_name, encoding="utf-8") as f:
+            return self.parse_lines(f)
+
+    def parse_lines(
+        self, lines: Iterable[str]
+    ) -> Tuple[Dict[str, Union[str, Set[str]]], Dict[Tuple[str, str], str]]:
         """
-        split_string = self.content.split("\n")
-        initial_description = split_string[0]
-        program_function = "".join(split_string[2:])
-        description_dict = self.description_parse(initial_description)
-        program_dict = self.program_function_parse(program_function)
+        Parses the description line, skips the Prog line,
+        and parses every other line as transitions
+        """
+        lines = iter(lines)
+        description_dict = self.description_parse(next(lines, ""))
+        next(lines, None)
+        program_dict: Dict[Tuple[str, str], str] = {}
+        findall = _TRANSITION_PATTERN.findall
+        for line in lines:
+            for state, transition_word, result_state in findall(line):
+                program_dict[(state, transition_word)] = result_state
         return description_dict, program_dict
 
 
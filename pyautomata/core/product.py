@@ -0,0 +1,216 @@
+"""
+The Product module contains the ProductAutomata class.
+It combines automata (intersection, union, difference, complement)
+without building the whole product: a product state is only made
+when some input reaches it, and kept for the next words.
+"""
+from array import array
+from collections import deque
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from pyautomata.core.compiled import (  # pylint: disable=import-error
+    UNDEFINED,
+    CompiledAutomata,
+)
+from pyautomata.core.tokenizer import Tokenizer  # pylint: disable=import-error
+
+# a transition of the product not followed yet
+UNKNOWN = -2
+
+# for each operation, when a product state is final, from the
+# finality of each operand state, and when it's dead, from the
+# operand states (UNDEFINED for an undefined transition),
+# a dead state is never final again whatever the input
+OPERATIONS: Dict[
+    str,
+    Tuple[
+        Callable[[Sequence[bool]], bool],
+        Callable[[Sequence[int]], bool],
+    ],
+] = {
+    "intersection": (
+        all,
+        lambda states: UNDEFINED in states,
+    ),
+    "union": (
+        any,
+        lambda states: all(s == UNDEFINED for s in states),
+    ),
+    "difference": (
+        lambda finals: finals[0] and not finals[1],
+        lambda states: states[0] == UNDEFINED,
+    ),
+    "complement": (
+        lambda finals: not finals[0],
+        lambda states: False,
+    ),
+}
+
+
+class ProductAutomata:
+    """
+    The class that runs the product of Automata lazily
+    The operands are compiled when the product is made, later
+    changes to them aren't seen by it
+    The alphabet is the union of the operands alphabets, a symbol
+    that an operand doesn't have is an undefined transition for it
+    """
+
+    def __init__(self, operands: Sequence, operation: str) -> None:
+        """
+        To initialize a ProductAutomata, pass the Automata (two, or
+        one for "complement") and the operation, "intersection",
+        "union", "difference" or "complement"
+        Usually made through Automata.intersection and the like
+        Will raise ValueError for any other operation
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(
+                f"Unknown operation {operation}, "
+                f"expected one of {', '.join(OPERATIONS)}"
+            )
+        if len(operands) != (1 if operation == "complement" else 2):
+            raise ValueError(f"Wrong number of automata for {operation}")
+        self.operation = operation
+        self._is_final, self._is_dead = OPERATIONS[operation]
+        self.name = "_".join([operation] + [a.name for a in operands])
+        self._compiled: List[CompiledAutomata] = [
+            a.compiled or a.compile() for a in operands
+        ]
+        self.alphabet = sorted(
+            set().union(*(a.alphabet for a in operands)).difference({""})
+        )
+        self.tokenizer = Tokenizer(self.alphabet)
+        self.symbol_index = {s: i for i, s in enumerate(self.alphabet)}
+        # for each operand, its own index of each symbol of the product
+        self._operand_symbols = [
+            [compiled.symbol_index.get(s, UNDEFINED) for s in self.alphabet]
+            for compiled in self._compiled
+        ]
+        # the product states made so far, and what's known of them
+        self._states: List[Tuple[int, ...]] = []
+        self._state_index: Dict[Tuple[int, ...], int] = {}
+        self._final = bytearray()
+        self._dead = bytearray()
+        self._table = array("i")
+        self.initial_state = self._intern(
+            tuple(compiled.initial_state for compiled in self._compiled)
+        )
+
+    def __len__(self) -> int:
+        """
+        Returns how many product states were made so far
+        """
+        return len(self._states)
+
+    def _intern(self, states: Tuple[int, ...]) -> int:
+        """
+        Returns the number of the product state, making it if needed
+        """
+        index = self._state_index.get(states)
+        if index is not None:
+            return index
+        index = len(self._states)
+        self._states.append(states)
+        self._state_index[states] = index
+        self._final.append(
+            self._is_final(
+                [
+                    state != UNDEFINED and compiled.is_final(state)
+                    for compiled, state in zip(self._compiled, states)
+                ]
+            )
+        )
+        self._dead.append(self._is_dead(states))
+        self._table.extend(array("i", [UNKNOWN]) * len(self.alphabet))
+        return index
+
+    def next_state(self, state: int, symbol: int) -> int:
+        """
+        Follows a transition of the product, making
+        the product state it leads to the first time
+        """
+        position = state * len(self.alphabet) + symbol
+        result = self._table[position]
+        if result != UNKNOWN:
+            return result
+        next_states = []
+        for compiled, operand_state, symbols in zip(
+            self._compiled, self._states[state], self._operand_symbols
+        ):
+            operand_symbol = symbols[symbol]
+            if operand_state == UNDEFINED or operand_symbol == UNDEFINED:
+                next_states.append(UNDEFINED)
+            else:
+                n_symbols = len(compiled.symbols)
+                next_states.append(
+                    compiled.table[operand_state * n_symbols + operand_symbol]
+                )
+        result = self._intern(tuple(next_states))
+        self._table[position] = result
+        return result
+
+    def accepts(self, word: str) -> bool:
+        """
+        Tells if the word is part of the language of the product,
+        tokenizing it only once for all the operands
+        Will raise ValueError if there's an element
+        that isn't part of the alphabet
+        """
+        return self.accepts_elements(self.tokenizer.tokenize(word))
+
+    def accepts_elements(self, elements: Sequence[str]) -> bool:
+        """
+        The same as accepts, for an already broken word
+        """
+        try:
+            symbols = [self.symbol_index[elem] for elem in elements]
+        except KeyError as ke:
+            raise ValueError("Word contains non-alphabet characters") from ke
+        state = self.initial_state
+        for symbol in symbols:
+            # nothing from a dead state is ever accepted
+            if self._dead[state]:
+                return False
+            state = self.next_state(state, symbol)
+        return bool(self._final[state])
+
+    def materialize(
+        self, minimize: bool = True, naming: str = "concatenate"
+    ):
+        """
+        Builds every reachable product state, returning the product
+        as a MinimizedAutomata, minimized unless minimize is False
+        States are named p0, p1, ... in breadth-first order,
+        dead states are left out, as undefined transitions
+        """
+        # pylint: disable=import-outside-toplevel
+        from pyautomata.core.minimization import MinimizedAutomata
+
+        names = {self.initial_state: "p0"}
+        order = deque([self.initial_state])
+        program_function: Dict[Tuple[str, str], str] = {}
+        while order:
+            state = order.popleft()
+            for symbol, c in enumerate(self.alphabet):
+                result = self.next_state(state, symbol)
+                if self._dead[result]:
+                    continue
+                if result not in names:
+                    names[result] = f"p{len(names)}"
+                    order.append(result)
+                program_function[(names[state], c)] = names[result]
+        automata = MinimizedAutomata(
+            program_function,
+            naming=naming,
+            name=self.name,
+            states=set(names.values()),
+            alphabet=set(self.alphabet),
+            initial_state="p0",
+            final_states={
+                name for state, name in names.items() if self._final[state]
+            },
+        )
+        if minimize:
+            automata.minimize()
+        return automata
@@ -0,0 +1,115 @@
+"""
+The Runner module contains the AutomataRunner class.
+A runner checks a word given in chunks, keeping only the
+current state and what's left of a partial element between them.
+"""
+from typing import Optional
+
+from pyautomata.core.compiled import (  # pylint: disable=import-error
+    CompiledAutomata,
+)
+
+
+class AutomataRunner:
+    """
+    The class that runs an Automata over input fed in chunks
+    Memory doesn't grow with the input, at most an element
+    split between chunks is held until the next one
+    """
+
+    def __init__(self, compiled: CompiledAutomata) -> None:
+        """
+        To initialize a runner, pass the compiled Automata
+        Usually made through Automata.runner()
+        """
+        self._compiled = compiled
+        self._state = compiled.initial_state
+        self._pending = ""
+
+    def reset(self) -> None:
+        """
+        Goes back to the initial state, dropping any partial element
+        """
+        self._state = self._compiled.initial_state
+        self._pending = ""
+
+    @property
+    def state(self) -> Optional[str]:
+        """
+        Returns the current state, None if a transition was undefined
+        A partial element waiting for the next chunk isn't applied yet
+        """
+        if self._state < 0:
+            return None
+        return self._compiled.states[self._state]
+
+    @property
+    def pending(self) -> str:
+        """
+        Returns the input held back, an element that may still
+        be continued by the next chunk
+        """
+        return self._pending
+
+    @property
+    def is_accepting(self) -> bool:
+        """
+        Tells if the input fed so far is part of the language,
+        as if it ended now
+        Will raise ValueError if the held back input
+        isn't made of alphabet elements
+        """
+        compiled = self._compiled
+        if self._state < 0:
+            return False
+        state = self._state
+        n_symbols = len(compiled.symbols)
+        for symbol in compiled.encode(compiled.break_word(self._pending)):
+            state = compiled.table[state * n_symbols + symbol]
+            if state < 0:
+                return False
+        return compiled.is_final(state)
+
+    def feed(self, chunk: str) -> None:
+        """
+        Runs the Automata over the next chunk of input
+        Once a transition is undefined the rest of the input is ignored
+        Will raise ValueError if there's an element that isn't part
+        of the alphabet, the runner must be reset after that
+        """
+        if self._state < 0:
+            return
+        compiled = self._compiled
+        tokenizer = compiled.tokenizer
+        table = compiled.table
+        n_symbols = len(compiled.symbols)
+        symbol_index = compiled.symbol_index
+        state = self._state
+        if tokenizer.single_character:
+            try:
+                for elem in chunk:
+                    state = table[state * n_symbols + symbol_index[elem]]
+                    if state < 0:
+                        break
+            except KeyError as ke:
+                raise ValueError(
+                    "Word contains non-alphabet characters"
+                ) from ke
+            self._state = state
+            return
+        buffer = self._pending + chunk
+        position = 0
+        # from here on, there's enough input to know the longest match
+        decidable = len(buffer) - tokenizer.max_length
+        while position <= decidable:
+            match = tokenizer.pattern.match(buffer, position)
+            if match is None:
+                raise ValueError("Word contains non-alphabet characters")
+            state = table[state * n_symbols + symbol_index[match.group()]]
+            if state < 0:
+                self._state = state
+                self._pending = ""
+                return
+            position = match.end()
+        self._state = state
+        self._pending = buffer[position:]
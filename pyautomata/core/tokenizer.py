@@ -0,0 +1,50 @@
+"""
+The Tokenizer module contains the Tokenizer class.
+It breaks words into alphabet elements, always taking
+the longest element that matches at each position.
+"""
+import re
+from typing import Iterable, List
+
+
+class Tokenizer:
+    """
+    The class that breaks words into the elements of an alphabet
+    Built once per alphabet, tokenizing is a single pass over the word
+    """
+
+    def __init__(self, alphabet: Iterable[str]) -> None:
+        """
+        To initialize a Tokenizer, pass the alphabet elements
+        Empty elements are ignored, they can't be matched
+        """
+        # longest first, so the regex alternation prefers the longest match
+        symbols = sorted(
+            {s for s in alphabet if s}, key=lambda s: (-len(s), s)
+        )
+        self.symbols = frozenset(symbols)
+        self.max_length = len(symbols[0]) if symbols else 0
+        self.single_character = self.max_length <= 1
+        self.pattern = re.compile("|".join(re.escape(s) for s in symbols))
+
+    def tokenize(self, word: str) -> List[str]:
+        """
+        Breaks a word into it's alphabet elements
+        Will raise ValueError if there's an element
+        that isn't part of the alphabet
+        """
+        if self.single_character:
+            if not self.symbols.issuperset(word):
+                raise ValueError("Word contains non-alphabet characters")
+            return list(word)
+        tokens = []
+        position = 0
+        for match in self.pattern.finditer(word):
+            # finditer skips what doesn't match, a gap is a foreign element
+            if match.start() != position:
+                break
+            tokens.append(match.group())
+            position = match.end()
+        if position != len(word):
+            raise ValueError("Word contains non-alphabet characters")
+        return tokens
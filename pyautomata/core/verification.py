@@ -0,0 +1,361 @@
+"""
+The Verification module checks words and word pairs against an Automata.
+Input is consumed as it comes, so it can be streamed
+straight from WordFileParser.iter_parse, and can be spread
+over a pool of processes that share one transition table.
+"""
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from multiprocessing import shared_memory
+from typing import (
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    TypeVar,
+)
+
+from pyautomata.core.compiled import (  # pylint: disable=import-error
+    CompiledAutomata,
+)
+from pyautomata.core.instrumentation import (  # pylint: disable=import-error
+    Instrumentation,
+)
+
+# how many pairs (or words) each task sent to a worker carries
+CHUNK_SIZE = 4096
+
+# how many tasks each worker may have queued, bounds the memory
+# used when the input is much larger than what the workers keep up with
+TASKS_PER_WORKER = 2
+
+# the automata each worker process checks against, set by _init_worker
+_worker_automata: Optional[CompiledAutomata] = None
+_worker_memory: Optional[shared_memory.SharedMemory] = None
+
+T = TypeVar("T")
+
+# the results of a chunk, with how many words and symbols were checked
+Checked = Tuple[List[Optional[bool]], int, int]
+
+
+def accepted_pairs(
+    automata, pairs: Iterable[Tuple[str, str]]
+) -> Iterator[Tuple[str, str]]:
+    """
+    Yields the pairs that have both words accepted by the automata
+    Will raise ValueError if a word contains non-alphabet characters
+    """
+    for word1, word2 in pairs:
+        if automata.accepts(word1) and automata.accepts(word2):
+            yield (word1, word2)
+
+
+def write_accepted_pairs(
+    automata, pairs: Iterable[Tuple[str, str]], output: TextIO
+) -> int:
+    """
+    Writes the accepted pairs to output as soon as they are checked,
+    in the word file format
+    Returns how many pairs were written
+    """
+    written = 0
+    for word1, word2 in accepted_pairs(automata, pairs):
+        output.write(f"{word1},{word2}\n")
+        written += 1
+    return written
+
+
+def _chunked(pairs: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    Splits the pairs (or words) in lists of at most size items
+    """
+    iterator = iter(pairs)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+def _compiled_of(automata) -> CompiledAutomata:
+    """
+    Returns the compiled table of the automata, compiling it if needed
+    An already CompiledAutomata is returned as it is
+    """
+    if isinstance(automata, CompiledAutomata):
+        return automata
+    return automata.compiled or automata.compile()
+
+
+def _word_checker(
+    compiled: CompiledAutomata,
+) -> Callable[[str], Tuple[bool, int]]:
+    """
+    Returns a function telling if a word is accepted
+    and how many symbols it has, breaking it only once
+    """
+    accepts_elements = compiled.accepts_elements
+    if compiled.tokenizer.single_character:
+
+        def check(word: str) -> Tuple[bool, int]:
+            return accepts_elements(word), len(word)
+
+        return check
+    tokenize = compiled.tokenizer.tokenize
+
+    def check_elements(word: str) -> Tuple[bool, int]:
+        elements = tokenize(word)
+        return accepts_elements(elements), len(elements)
+
+    return check_elements
+
+
+def _check_chunk(
+    compiled: CompiledAutomata, chunk: List[Tuple[str, str]]
+) -> Checked:
+    """
+    Tells, for each pair, if both words are accepted,
+    None if a word checked has non-alphabet characters
+    The second word isn't checked when the first is rejected
+    """
+    check = _word_checker(compiled)
+    results: List[Optional[bool]] = []
+    words = symbols = 0
+    for word1, word2 in chunk:
+        try:
+            accepted, length = check(word1)
+            words += 1
+            symbols += length
+            if accepted:
+                accepted, length = check(word2)
+                words += 1
+                symbols += length
+            results.append(accepted)
+        except ValueError:
+            results.append(None)
+    return results, words, symbols
+
+
+def _check_words_chunk(
+    compiled: CompiledAutomata, chunk: List[str]
+) -> Checked:
+    """
+    Tells, for each word, if it's accepted,
+    None if it has non-alphabet characters
+    """
+    check = _word_checker(compiled)
+    results: List[Optional[bool]] = []
+    words = symbols = 0
+    for word in chunk:
+        try:
+            accepted, length = check(word)
+            words += 1
+            symbols += length
+            results.append(accepted)
+        except ValueError:
+            results.append(None)
+    return results, words, symbols
+
+
+def _share_tables(compiled: CompiledAutomata) -> shared_memory.SharedMemory:
+    """
+    Copies the transition table, followed by the final state
+    bitmap, to a new block of shared memory
+    """
+    with memoryview(compiled.table) as table, table.cast("B") as table_bytes:
+        table_size = table_bytes.nbytes
+        final_size = len(compiled.final_states)
+        memory = shared_memory.SharedMemory(
+            create=True, size=max(1, table_size + final_size)
+        )
+        memory.buf[:table_size] = table_bytes
+        memory.buf[table_size : table_size + final_size] = bytes(
+            compiled.final_states
+        )
+    return memory
+
+
+def _init_worker(
+    memory_name: str,
+    table_size: int,
+    final_size: int,
+    n_states: int,
+    symbols: List[str],
+    initial_state: int,
+) -> None:
+    """
+    Attaches the worker to the shared transition table
+    Workers only decide acceptance, so state names aren't sent to them
+    """
+    # pylint: disable=global-statement
+    global _worker_automata, _worker_memory
+    _worker_memory = shared_memory.SharedMemory(name=memory_name)
+    buffer = _worker_memory.buf
+    _worker_automata = CompiledAutomata(
+        "",
+        range(n_states),
+        symbols,
+        initial_state,
+        buffer[table_size : table_size + final_size],
+        buffer[:table_size].cast("i"),
+    )
+
+
+def _worker_check_chunk(chunk: List[Tuple[str, str]]) -> Checked:
+    """
+    Checks a chunk of pairs against the worker's automata
+    """
+    return _check_chunk(_worker_automata, chunk)
+
+
+def _worker_check_words_chunk(chunk: List[str]) -> Checked:
+    """
+    Checks a chunk of words against the worker's automata
+    """
+    return _check_words_chunk(_worker_automata, chunk)
+
+
+def _iter_checked(
+    automata,
+    items: Iterable[T],
+    check: Callable[[CompiledAutomata, List[T]], Checked],
+    worker_check: Callable[[List[T]], Checked],
+    workers: Optional[int],
+    chunk_size: int,
+    instrumentation: Optional[Instrumentation],
+) -> Iterator[Tuple[T, Optional[bool]]]:
+    """
+    Yields each item with its result, in the same order as the items
+    Serially with check, or over a pool running worker_check,
+    with at most TASKS_PER_WORKER chunks per worker in flight
+    The instrumentation, if any, gets the counts of each chunk
+    """
+    compiled = _compiled_of(automata)
+    if instrumentation is None:
+        instrumentation = getattr(automata, "instrumentation", None)
+
+    def done(
+        chunk: List[T], checked: Checked
+    ) -> Iterator[Tuple[T, Optional[bool]]]:
+        results, words, symbols = checked
+        if instrumentation is not None:
+            instrumentation.words_checked(words, symbols)
+        return zip(chunk, results)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for chunk in _chunked(items, chunk_size):
+            yield from done(chunk, check(compiled, chunk))
+        return
+    memory = _share_tables(compiled)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(
+                memory.name,
+                len(compiled.table) * compiled.table.itemsize,
+                len(compiled.final_states),
+                len(compiled.states),
+                list(compiled.symbols),
+                compiled.initial_state,
+            ),
+        ) as executor:
+            pending: Deque[Tuple[List[T], Future]] = deque()
+            for chunk in _chunked(items, chunk_size):
+                pending.append((chunk, executor.submit(worker_check, chunk)))
+                if len(pending) >= workers * TASKS_PER_WORKER:
+                    chunk, future = pending.popleft()
+                    yield from done(chunk, future.result())
+            while pending:
+                chunk, future = pending.popleft()
+                yield from done(chunk, future.result())
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def iter_verify_pairs(
+    automata,
+    pairs: Iterable[Tuple[str, str]],
+    workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    instrumentation: Optional[Instrumentation] = None,
+) -> Iterator[Tuple[Tuple[str, str], Optional[bool]]]:
+    """
+    Yields each pair with whether both words are accepted,
+    as soon as its chunk is checked, in the same order as the pairs
+    A pair with a word that has non-alphabet characters comes
+    with None, the pairs after it are still checked
+    See verify_pairs for workers
+    """
+    return _iter_checked(
+        automata,
+        pairs,
+        _check_chunk,
+        _worker_check_chunk,
+        workers,
+        chunk_size,
+        instrumentation,
+    )
+
+
+def iter_check_words(
+    automata,
+    words: Iterable[str],
+    workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    instrumentation: Optional[Instrumentation] = None,
+) -> Iterator[Tuple[str, Optional[bool]]]:
+    """
+    Yields each word with whether it's accepted,
+    as soon as its chunk is checked, in the same order as the words
+    A word that has non-alphabet characters comes with None,
+    the words after it are still checked
+    See verify_pairs for workers
+    """
+    return _iter_checked(
+        automata,
+        words,
+        _check_words_chunk,
+        _worker_check_words_chunk,
+        workers,
+        chunk_size,
+        instrumentation,
+    )
+
+
+def verify_pairs(
+    automata,
+    pairs: Iterable[Tuple[str, str]],
+    workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    instrumentation: Optional[Instrumentation] = None,
+) -> List[bool]:
+    """
+    Tells, for each pair, if both words are accepted by the automata,
+    in the same order as the pairs
+    The pairs are split in chunks over a pool of workers processes
+    (one per CPU if workers is None), which read the compiled
+    transition table from shared memory instead of each getting a copy
+    The words checked are reported to the instrumentation, the
+    automata's own if none is given
+    Will raise ValueError if a word contains non-alphabet characters
+    """
+    results = []
+    for (word1, word2), accepted in iter_verify_pairs(
+        automata, pairs, workers, chunk_size, instrumentation
+    ):
+        if accepted is None:
+            raise ValueError(
+                f"Word contains non-alphabet characters: {word1},{word2}"
+            )
+        results.append(accepted)
+    return results
@@ -6,6 +6,11 @@ from typing import List, Optional, Tuple, Union
 import PySimpleGUI as sg
 from more_itertools import grouper
 import pyautomata  # pylint: disable=import-error
+from pyautomata.gui import jobs  # pylint: disable=import-error
+from pyautomata.gui.pages import PairPages  # pylint: disable=import-error
+
+
+PROGRESS_BAR_MAX = 1000
 
 
 class AutomataGUI:
@@ -45,15 +50,34 @@ class AutomataGUI:
                 ),
                 sg.Submit(key="-WORD-FILE-SUBMIT-", disabled=True),
             ],
+            [
+                sg.ProgressBar(
+                    PROGRESS_BAR_MAX,
+                    orientation="h",
+                    size=(30, 16),
+                    key="-PROGRESS-BAR-",
+                ),
+                sg.Text("", size=(30, 1), key="-STATUS-"),
+                sg.Button("Cancel", key="-CANCEL-", disabled=True),
+            ],
             [sg.CloseButton("Close")],
         ]
         self._window: sg.Window = sg.Window("Pyautomata", layout)
         self._aut: Optional[pyautomata.Automata] = None
+        self._cache = pyautomata.MinimizationCache()
+        self._job: Optional[jobs.Job] = None
+        self._pages = PairPages()
+        self._pairs_window: Optional[sg.Window] = None
 
     def close(self):
         """
         Closes the window (and then deletes it for safety)
+        A running job is cancelled
         """
+        if self._job is not None:
+            self._job.cancel()
+        if self._pairs_window is not None:
+            self._pairs_window.close()
         self.window.close()
         del self._window
 
@@ -78,66 +102,169 @@ class AutomataGUI:
         """
         return self._aut
 
+    @property
+    def busy(self) -> bool:
+        """
+        Tells if a background job is running
+        """
+        return self._job is not None and self._job.running
+
+    def _start_job(self, task, *args) -> None:
+        """
+        Runs the task on a worker thread, disabling the submit
+        buttons until it posts that it's done
+        """
+        self.window["-AUTOMATA-SUBMIT-"].update(disabled=True)
+        self.window["-WORD-FILE-SUBMIT-"].update(disabled=True)
+        self.window["-CANCEL-"].update(disabled=False)
+        self.window["-PROGRESS-BAR-"].update(0)
+        self._job = jobs.Job(self.window.write_event_value)
+        self._job.start(task, *args)
+
+    def _end_job(self, status: str) -> None:
+        """
+        Enables the buttons back once the job posted it's done
+        """
+        self._job = None
+        self.window["-STATUS-"].update(status)
+        self.window["-CANCEL-"].update(disabled=True)
+        self.window["-AUTOMATA-SUBMIT-"].update(disabled=False)
+        self.window["-WORD-FILE-SUBMIT-"].update(disabled=self._aut is None)
+
+    def update_progress(self, progress: Tuple[float, str]) -> None:
+        """
+        Moves the progress bar, from a PROGRESS_EVENT
+        """
+        fraction, message = progress
+        self.window["-PROGRESS-BAR-"].update(
+            int(fraction * PROGRESS_BAR_MAX)
+        )
+        self.window["-STATUS-"].update(message)
+
+    def cancel_job(self) -> None:
+        """
+        Asks the running job to stop, it posts JOB_CANCELLED_EVENT
+        """
+        if self._job is not None:
+            self._job.cancel()
+            self.window["-STATUS-"].update("Cancelling")
+
+    def job_cancelled(self) -> None:
+        """
+        Handles the JOB_CANCELLED_EVENT
+        """
+        self.window["-PROGRESS-BAR-"].update(0)
+        self._end_job("Cancelled")
+
+    def job_failed(self, message: str) -> None:
+        """
+        Handles the JOB_FAILED_EVENT
+        """
+        self.window["-PROGRESS-BAR-"].update(0)
+        self._end_job("Failed")
+        sg.popup_error(message)
+
     def create_automata(self, file: str) -> None:
         """
-        Creates the automata via the Parser
+        Creates the automata via the Parser, on a worker thread
+        automata_created is called when it's done
+        """
+        self._start_job(jobs.load_automata, file, self._cache)
+
+    def automata_created(self, automata: pyautomata.Automata) -> None:
+        """
+        Handles the AUTOMATA_DONE_EVENT
         Updates the text and buttons on screen
         """
-        try:
-            p = pyautomata.AutomataParser(file_name=file)
-            description, function_program = p.parse()
-            automata = pyautomata.MinimizedAutomata(
-                function_program, **description
-            )
-            automata.minimize()
-            self._aut = automata
-            self.window["-AUTOMATA-LOADED-"].update(
-                f"{automata.name} (Loaded)"
-            )
-            self.window["-WORD-BUT-"].update(disabled=False)
-            self.window["-WORD-FILE-SUBMIT-"].update(disabled=False)
-            self.window["-WORD-FILE-BROWSER-"].update(disabled=False)
-        except KeyError as _:
-            sg.popup_error("The file was incorrectly formatted.")
+        self._aut = automata
+        self._end_job("Loaded")
+        self.window["-AUTOMATA-LOADED-"].update(f"{automata.name} (Loaded)")
+        self.window["-WORD-BUT-"].update(disabled=False)
+        self.window["-WORD-FILE-SUBMIT-"].update(disabled=False)
+        self.window["-WORD-FILE-BROWSER-"].update(disabled=False)
 
-    @staticmethod
-    def create_pair_result_window(pairs: List[Tuple[str, str]]) -> None:
+    def create_pair_result_window(self) -> sg.Window:
         """
-        Creates a window to display the accepted pairs
+        Creates a window to display the accepted pairs, one page
+        at a time, it's filled in while the pairs are checked
         """
-        pair_string = ""
-        for word1, word2 in pairs:
-            pair_string += f"{word1}, {word2}\n"
         layout = [
             [sg.Text("Accepted pairs:")],
-            [sg.Text(pair_string)],
+            [
+                sg.Table(
+                    values=[],
+                    headings=["Word 1", "Word 2"],
+                    num_rows=20,
+                    col_widths=[20, 20],
+                    auto_size_columns=False,
+                    key="-PAIRS-TABLE-",
+                )
+            ],
+            [
+                sg.Button("<", key="-PAIRS-PREVIOUS-"),
+                sg.Text(self._pages.describe(), size=(30, 1), key="-PAGE-"),
+                sg.Button(">", key="-PAIRS-NEXT-"),
+            ],
             [sg.Button("Ok")],
         ]
-        window = sg.Window("Pyautomata", layout)
-        while True:
-            event, _ = window.read()
-            if event in (sg.WIN_CLOSED, "Ok"):
-                break
-        window.close()
+        return sg.Window("Pyautomata", layout, finalize=True)
+
+    def _show_page(self) -> None:
+        """
+        Puts the current page of pairs in the result table
+        """
+        self._pairs_window["-PAIRS-TABLE-"].update(values=self._pages.rows())
+        self._pairs_window["-PAGE-"].update(self._pages.describe())
+
+    def pair_result_event(self, window: sg.Window, event: str) -> None:
+        """
+        Handles an event of the result window, closing it
+        cancels the checking if it's still running
+        """
+        if window is not self._pairs_window:
+            return
+        if event in (sg.WIN_CLOSED, "Ok"):
+            if self.busy:
+                self.cancel_job()
+            window.close()
+            self._pairs_window = None
+            return
+        if event == "-PAIRS-NEXT-":
+            self._pages.next()
+        elif event == "-PAIRS-PREVIOUS-":
+            self._pages.previous()
+        self._show_page()
 
     def test_word_pairs(self, file: str) -> None:
         """
         Given the file
-        Creates the pairs, then test them
-        Opens up a new window with the results
+        Opens up a new window for the results,
+        then tests the pairs on a worker thread
         """
-        try:
-            wfp = pyautomata.WordFileParser(file_name=file)
-            result_pairs = []
-            for word1, word2 in wfp.parse():
-                if (
-                    self.automata.check_word(word1)[0]
-                    and self.automata.check_word(word2)[0]
-                ):
-                    result_pairs.append((word1, word2))
-            self.create_pair_result_window(result_pairs)
-        except ValueError as ve:
-            sg.popup_error(ve)
+        if self._pairs_window is not None:
+            self._pairs_window.close()
+        self._pages = PairPages()
+        self._pairs_window = self.create_pair_result_window()
+        self._start_job(jobs.check_pairs, self.automata, file)
+
+    def pairs_found(self, pairs: List[Tuple[str, str]]) -> None:
+        """
+        Handles the PAIRS_FOUND_EVENT
+        Only the page shown is redrawn, and only if it changed
+        """
+        changed = self._pages.extend(pairs)
+        if self._pairs_window is None:
+            return
+        if changed:
+            self._show_page()
+        else:
+            self._pairs_window["-PAGE-"].update(self._pages.describe())
+
+    def pairs_checked(self, accepted: int) -> None:
+        """
+        Handles the PAIRS_DONE_EVENT
+        """
+        self._end_job(f"{accepted} pairs accepted")
 
     @staticmethod
     def create_result_path_string(result_path: Union[str, List[str]]) -> str:
@@ -0,0 +1,194 @@
+"""
+The background jobs of the GUI.
+They run on a worker thread and only talk to the window through
+the post function they get (window.write_event_value), so the
+event loop keeps running while files are parsed, minimized and checked.
+"""
+import os
+import threading
+from itertools import islice
+from typing import Callable, Optional, Tuple
+
+from pyautomata.core.cache import (  # pylint: disable=import-error
+    MinimizationCache,
+)
+from pyautomata.core.instrumentation import (  # pylint: disable=import-error
+    Instrumentation,
+)
+from pyautomata.core.parser import (  # pylint: disable=import-error
+    AutomataParser,
+    WordFileParser,
+)
+from pyautomata.core.verification import (  # pylint: disable=import-error
+    accepted_pairs,
+)
+
+# the events posted to the window, with the value each one carries
+PROGRESS_EVENT = "-PROGRESS-"  # (fraction done, message)
+AUTOMATA_DONE_EVENT = "-AUTOMATA-DONE-"  # the MinimizedAutomata
+PAIRS_FOUND_EVENT = "-PAIRS-FOUND-"  # a list of accepted pairs
+PAIRS_DONE_EVENT = "-PAIRS-DONE-"  # how many pairs were accepted
+JOB_FAILED_EVENT = "-JOB-FAILED-"  # the error message
+JOB_CANCELLED_EVENT = "-JOB-CANCELLED-"  # None
+
+# how many pairs are checked between progress events
+PROGRESS_EVERY = 4096
+
+# the steps MinimizedAutomata.minimize reports, to scale its progress
+MINIMIZATION_PHASES = 5
+
+FORMAT_ERROR = "The file was incorrectly formatted."
+
+
+class Cancelled(Exception):
+    """
+    Raised inside a job when it was cancelled, to stop it
+    """
+
+
+class Job:
+    """
+    A task running on its own thread, posting its progress
+    and its end to the window
+    Cancelling only sets a flag, the task stops at its next check
+    """
+
+    def __init__(self, post: Callable[[str, object], None]) -> None:
+        """
+        To initialize a Job, pass the function that posts events,
+        usually window.write_event_value
+        """
+        self.post = post
+        self._cancelled = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, task: Callable[..., None], *args) -> None:
+        """
+        Runs task(job, *args) on a new thread
+        """
+        self._thread = threading.Thread(
+            target=self._run, args=(task, args), daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, task: Callable[..., None], args: tuple) -> None:
+        try:
+            task(self, *args)
+        except Cancelled:
+            self.post(JOB_CANCELLED_EVENT, None)
+        except (KeyError, IndexError):
+            self.post(JOB_FAILED_EVENT, FORMAT_ERROR)
+        except (ValueError, OSError) as e:
+            self.post(JOB_FAILED_EVENT, str(e))
+        # anything else is a bug, but the window still has to
+        # hear the job ended, or it waits for it forever
+        except Exception as e:  # pylint: disable=broad-except
+            self.post(JOB_FAILED_EVENT, f"Unexpected error: {e!r}")
+
+    @property
+    def running(self) -> bool:
+        """
+        Tells if the task hasn't finished yet
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """
+        Waits for the task to finish
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def cancel(self) -> None:
+        """
+        Asks the task to stop
+        """
+        self._cancelled.set()
+
+    def check_cancelled(self) -> None:
+        """
+        Raises Cancelled if the job was cancelled
+        """
+        if self._cancelled.is_set():
+            raise Cancelled()
+
+    def progress(self, fraction: float, message: str) -> None:
+        """
+        Posts how much of the task is done, from 0 to 1
+        """
+        self.post(PROGRESS_EVENT, (min(fraction, 1.0), message))
+
+
+class _MinimizationProgress(Instrumentation):
+    """
+    Reports each minimization step as progress,
+    and stops the minimization if the job was cancelled
+    """
+
+    def __init__(self, job: Job, start: float, end: float) -> None:
+        self.job = job
+        self.start = start
+        self.end = end
+        self.done = 0
+
+    def phase(
+        self,
+        name: str,
+        seconds: float,
+        before: Tuple[int, int],
+        after: Tuple[int, int],
+    ) -> None:
+        self.done += 1
+        self.job.check_cancelled()
+        fraction = self.done / MINIMIZATION_PHASES
+        self.job.progress(
+            self.start + (self.end - self.start) * fraction,
+            f"Minimizing ({name} done)",
+        )
+
+
+def load_automata(job: Job, file: str, cache: MinimizationCache) -> None:
+    """
+    Parses, minimizes and compiles the automata in the file,
+    posting it with AUTOMATA_DONE_EVENT
+    """
+    job.progress(0.0, "Parsing")
+    description, program_function = AutomataParser(file_name=file).parse()
+    job.check_cancelled()
+    job.progress(0.2, "Minimizing")
+    automata = cache.minimize(
+        description,
+        program_function,
+        instrumentation=_MinimizationProgress(job, 0.2, 0.9),
+    )
+    job.check_cancelled()
+    job.progress(0.9, "Compiling")
+    automata.compile()
+    job.progress(1.0, "Loaded")
+    job.post(AUTOMATA_DONE_EVENT, automata)
+
+
+def check_pairs(job: Job, automata, file: str) -> None:
+    """
+    Checks every pair of the file, PROGRESS_EVERY pairs at a time,
+    posting the accepted ones of each batch with PAIRS_FOUND_EVENT
+    and how many were accepted in total with PAIRS_DONE_EVENT
+    """
+    # the progress is estimated from the bytes of the file read so far
+    size = os.path.getsize(file) or 1
+    pairs = WordFileParser(file_name=file).iter_parse()
+    job.progress(0.0, "Checking pairs")
+    read = checked = accepted = 0
+    chunk = list(islice(pairs, PROGRESS_EVERY))
+    while chunk:
+        job.check_cancelled()
+        found = list(accepted_pairs(automata, chunk))
+        if found:
+            job.post(PAIRS_FOUND_EVENT, found)
+        accepted += len(found)
+        checked += len(chunk)
+        read += sum(len(word1) + len(word2) + 2 for word1, word2 in chunk)
+        job.progress(read / size, f"{checked} pairs checked")
+        chunk = list(islice(pairs, PROGRESS_EVERY))
+    job.progress(1.0, f"{accepted} pairs accepted")
+    job.post(PAIRS_DONE_EVENT, accepted)
@@ -0,0 +1,73 @@
+"""
+The Pages module contains the PairPages class.
+It holds the accepted pairs for the result window, which
+only ever shows one page of them, so the table stays small.
+"""
+from typing import Iterable, List, Tuple
+
+PAGE_SIZE = 100
+
+
+class PairPages:
+    """
+    The accepted pairs, split in pages of page_size rows
+    Pairs can keep being added while a page is shown
+    """
+
+    def __init__(self, page_size: int = PAGE_SIZE) -> None:
+        self.page_size = page_size
+        self.pairs: List[Tuple[str, str]] = []
+        self.page = 0
+
+    @property
+    def page_count(self) -> int:
+        """
+        Returns how many pages there are, at least one
+        """
+        return max(1, -(-len(self.pairs) // self.page_size))
+
+    def extend(self, pairs: Iterable[Tuple[str, str]]) -> bool:
+        """
+        Adds pairs at the end
+        Returns True if the rows of the current page changed
+        """
+        was_full = len(self.pairs) >= (self.page + 1) * self.page_size
+        self.pairs.extend(pairs)
+        return not was_full
+
+    def rows(self) -> List[List[str]]:
+        """
+        Returns the rows of the current page
+        """
+        start = self.page * self.page_size
+        return [
+            [word1, word2]
+            for word1, word2 in self.pairs[start : start + self.page_size]
+        ]
+
+    def go_to(self, page: int) -> None:
+        """
+        Moves to the page, clamped to the existing ones
+        """
+        self.page = min(max(page, 0), self.page_count - 1)
+
+    def next(self) -> None:
+        """
+        Moves to the next page, if there's one
+        """
+        self.go_to(self.page + 1)
+
+    def previous(self) -> None:
+        """
+        Moves to the previous page, if there's one
+        """
+        self.go_to(self.page - 1)
+
+    def describe(self) -> str:
+        """
+        Returns the page position, to be shown under the table
+        """
+        return (
+            f"Page {self.page + 1} of {self.page_count} "
+            f"({len(self.pairs)} pairs)"
+        )
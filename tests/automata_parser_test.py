@@ -51,3 +51,14 @@ class TestAutomataParser:
         assert self.function_dict[("q2", "b")] == "q2"
         assert self.function_dict[("q3", "a")] == "q3"
         assert self.function_dict[("q3", "b")] == "q2"
+
+    def test_parse_file(self, tmp_path):
+        path = tmp_path / "automata.txt"
+        path.write_text(self.p.content, encoding="utf-8")
+        p = AutomataParser(file_name=str(path))
+        assert p.parse() == (self.description_dict, self.function_dict)
+
+    def test_several_transitions_in_a_line(self):
+        assert AutomataParser.program_function_parse(
+            "(q0,a)=q1(q1,ab)=q0"
+        ) == {("q0", "a"): "q1", ("q1", "ab"): "q0"}
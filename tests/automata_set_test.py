@@ -0,0 +1,86 @@
+# pylint: disable=all
+import pytest
+
+from helpers import accepts, all_words, random_automata
+from pyautomata import Automata, AutomataSet
+
+
+def accepts_elements(compiled, elements):
+    # an element outside the member's alphabet is undefined for it
+    try:
+        return compiled.accepts_elements(elements)
+    except ValueError:
+        return False
+
+
+class TestAutomataSet:
+    def setup_method(self):
+        self.members = [
+            random_automata(seed, density=0.7) for seed in range(20)
+        ]
+        self.set = AutomataSet(self.members)
+
+    def test_matches_members(self):
+        for word in all_words(("a", "b"), 5):
+            assert list(self.set.accepts(word)) == [
+                accepts(member, word) for member in self.members
+            ]
+
+    def test_accepting(self):
+        for word in all_words(("a", "b"), 3):
+            assert self.set.accepting(word) == [
+                member for member in self.members if accepts(member, word)
+            ]
+
+    def test_different_alphabets(self):
+        members = [
+            random_automata(1, alphabet=("a", "b"), density=0.7),
+            random_automata(2, alphabet=("b", "c"), density=0.7),
+            random_automata(3, alphabet=("ab", "c"), density=0.7),
+        ]
+        automata_set = AutomataSet(members)
+        assert automata_set.alphabet == ["a", "ab", "b", "c"]
+        for word in all_words(("a", "b", "c"), 4):
+            elements = automata_set.tokenizer.tokenize(word)
+            assert list(automata_set.accepts_elements(elements)) == [
+                accepts_elements(member.compiled, elements)
+                for member in members
+            ]
+
+    def test_compiled_members(self):
+        compiled = [member.compile() for member in self.members]
+        automata_set = AutomataSet(compiled)
+        for word in all_words(("a", "b"), 4):
+            assert list(automata_set.accepts(word)) == list(
+                self.set.accepts(word)
+            )
+
+    def test_every_member_dead(self):
+        dead = Automata(
+            {("q0", "a"): "q1"},
+            name="D",
+            states={"q0", "q1"},
+            alphabet={"a", "b"},
+            initial_state="q0",
+            final_states={"q1"},
+        )
+        automata_set = AutomataSet([dead, dead])
+        assert list(automata_set.accepts("a")) == [True, True]
+        assert list(automata_set.accepts("b" + "a" * 1000)) == [False, False]
+
+    def test_non_alphabet(self):
+        with pytest.raises(ValueError):
+            self.set.accepts("abz")
+        with pytest.raises(ValueError):
+            # even past the point every member is dead
+            AutomataSet([random_automata(0, density=0.7)]).accepts_elements(
+                ["b"] * 50 + ["z"]
+            )
+
+    def test_empty(self):
+        automata_set = AutomataSet([])
+        assert len(automata_set) == 0
+        assert automata_set.accepting("") == []
+
+    def test_len(self):
+        assert len(self.set) == 20
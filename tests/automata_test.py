@@ -1,4 +1,6 @@
 # pylint: disable=all
+import pytest
+
 from pyautomata import Automata
 
 
@@ -73,3 +75,27 @@ class TestAutomata:
             self.aut.check_word("aaa")[1]
             == "Program ended with undefined state at state q1 with element a."
         )
+
+    def test_accepts(self):
+        for word in ["baaaa", "a", "aabbb", "abab", "", "ab", "aaa"]:
+            assert self.aut.accepts(word) == self.aut.check_word(word)[0]
+
+    def test_accepts_compiled(self):
+        self.aut.compile()
+        for word in ["baaaa", "a", "aabbb", "abab", "", "ab", "aaa"]:
+            assert self.aut.accepts(word) == self.aut.check_word(word)[0]
+
+    def test_accepts_non_alphabet(self):
+        with pytest.raises(ValueError):
+            self.aut.accepts("aac")
+        self.aut.compile()
+        with pytest.raises(ValueError):
+            self.aut.accepts("aac")
+
+    def test_trace(self):
+        path = ["q0", "b", "q2", "a", "q3", "a", "q3", "a", "q3", "a", "q3"]
+        assert self.aut.trace("baaaa") == path
+        assert self.aut.trace("aaa") == ["q0", "a", "q1"]
+        self.aut.compile()
+        assert self.aut.trace("baaaa") == path
+        assert self.aut.trace("aaa") == ["q0", "a", "q1"]
@@ -0,0 +1,107 @@
+# pylint: disable=all
+import os
+
+from pyautomata import MinimizationCache, MinimizedAutomata
+
+
+def automata_description():
+    description = {
+        "name": "AUTÔMATO",
+        "states": {"q0", "q1", "q2", "q3", "q4", "q5", "q6", "q7"},
+        "alphabet": {"a", "b"},
+        "initial_state": "q0",
+        "final_states": {"q2"},
+    }
+    program_function = {
+        ("q0", "a"): "q1",
+        ("q0", "b"): "q5",
+        ("q1", "a"): "q6",
+        ("q1", "b"): "q2",
+        ("q2", "a"): "q0",
+        ("q2", "b"): "q2",
+        ("q3", "a"): "q2",
+        ("q4", "a"): "q7",
+        ("q4", "b"): "q5",
+        ("q5", "a"): "q2",
+        ("q5", "b"): "q6",
+        ("q6", "b"): "q4",
+        ("q7", "a"): "q6",
+        ("q7", "b"): "q2",
+    }
+    return description, program_function
+
+
+class TestMinimizationCache:
+    def setup_method(self):
+        self.description, self.program_function = automata_description()
+
+    def test_miss_then_hit(self, tmp_path):
+        cache = MinimizationCache(str(tmp_path))
+        first = cache.minimize(*automata_description())
+        second = cache.minimize(*automata_description())
+        expected = MinimizedAutomata(self.program_function, **self.description)
+        expected.minimize()
+        for aut in (first, second):
+            assert aut.program_function == expected.program_function
+            assert aut.states == expected.states
+            assert aut.final_states == expected.final_states
+            assert aut.initial_state == expected.initial_state
+        assert cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "entries": 1,
+            "bytes": os.path.getsize(next(tmp_path.iterdir())),
+        }
+
+    def test_key_ignores_order(self):
+        key = MinimizationCache.key(self.description, self.program_function)
+        reordered = dict(reversed(list(self.program_function.items())))
+        assert MinimizationCache.key(self.description, reordered) == key
+        self.program_function[("q6", "a")] = "q6"
+        assert (
+            MinimizationCache.key(self.description, self.program_function)
+            != key
+        )
+        assert (
+            MinimizationCache.key(
+                self.description, reordered, algorithm="table_filling"
+            )
+            != key
+        )
+
+    def test_short_naming(self, tmp_path):
+        assert MinimizationCache.key(
+            self.description, self.program_function, naming="short"
+        ) != MinimizationCache.key(self.description, self.program_function)
+        cache = MinimizationCache(str(tmp_path))
+        first = cache.minimize(*automata_description(), naming="short")
+        second = cache.minimize(*automata_description(), naming="short")
+        assert cache.hits == 1
+        assert second.naming == "short"
+        assert second.states == first.states
+        assert second.merged_states() == first.merged_states()
+
+    def test_eviction(self, tmp_path):
+        cache = MinimizationCache(str(tmp_path))
+        cache.minimize(*automata_description())
+        size = cache.stats()["bytes"]
+        cache.max_bytes = size + size // 2
+        description, program_function = automata_description()
+        program_function[("q6", "a")] = "q6"
+        cache.minimize(description, program_function)
+        assert cache.stats()["entries"] == 1
+        cache.minimize(*automata_description())
+        assert cache.misses == 3
+
+    def test_corrupted_entry(self, tmp_path):
+        cache = MinimizationCache(str(tmp_path))
+        cache.minimize(*automata_description())
+        next(tmp_path.iterdir()).write_text("{")
+        cache.minimize(*automata_description())
+        assert cache.hits == 0
+
+    def test_clear(self, tmp_path):
+        cache = MinimizationCache(str(tmp_path))
+        cache.minimize(*automata_description())
+        cache.clear()
+        assert cache.stats()["entries"] == 0
@@ -0,0 +1,122 @@
+# pylint: disable=all
+import pytest
+
+from pyautomata import AutomataParser, MinimizedAutomata
+from pyautomata.cli import main
+
+AUTOMATA = """M=({q0,q1,q2,q3,q4},{a,b},Prog,q0,{q1,q3})
+Prog
+(q0,a)=q1
+(q0,b)=q2
+(q1,b)=q2
+(q2,a)=q3
+(q2,b)=q2
+(q3,a)=q3
+(q3,b)=q2
+(q4,a)=q0
+"""
+
+
+class TestCli:
+    def setup_method(self):
+        self.words = ["a", "ab", "baaaa", "", "bb"]
+
+    @pytest.fixture
+    def automata_file(self, tmp_path):
+        path = tmp_path / "automata.txt"
+        path.write_text(AUTOMATA, encoding="utf-8")
+        return str(path)
+
+    def test_minimize(self, automata_file, tmp_path, capsys):
+        output = tmp_path / "minimized.txt"
+        assert main(["-q", "minimize", automata_file, "-o", str(output)]) == 0
+        description, program_function = AutomataParser(
+            content=AUTOMATA
+        ).parse()
+        expected = MinimizedAutomata(program_function, **description)
+        expected.minimize()
+        result = AutomataParser(file_name=str(output)).parse()
+        assert result[0]["states"] == expected.states
+        assert result[1] == expected.program_function
+        assert capsys.readouterr().err == ""
+
+    def test_minimize_to_stdout_with_stats(self, automata_file, capsys):
+        assert main(["minimize", automata_file]) == 0
+        captured = capsys.readouterr()
+        assert captured.out.startswith("M=(")
+        assert "unify_states" in captured.err
+        assert "minimized to" in captured.err
+
+    def test_minimize_cached_with_stats(
+        self, automata_file, tmp_path, capsys, monkeypatch
+    ):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        assert main(["minimize", automata_file, "--cache"]) == 0
+        # a miss minimizes, so its phases are reported
+        assert "unify_states" in capsys.readouterr().err
+        assert main(["minimize", automata_file, "--cache"]) == 0
+        captured = capsys.readouterr()
+        assert captured.out.startswith("M=(")
+        assert "unify_states" not in captured.err
+
+    @pytest.mark.parametrize("workers", ["1", "2"])
+    def test_check(self, automata_file, tmp_path, capsys, workers):
+        words = tmp_path / "words.txt"
+        words.write_text("\n".join(self.words) + "\n", encoding="utf-8")
+        argv = ["check", automata_file, str(words), "--workers", workers]
+        assert main(argv + ["--chunk-size", "2"]) == 0
+        captured = capsys.readouterr()
+        assert captured.out.splitlines() == [
+            "a\taccepted",
+            "ab\trejected",
+            "baaaa\taccepted",
+            "\trejected",
+            "bb\trejected",
+        ]
+        assert "checked 5 words, 2 accepted, 10 symbols" in captured.err
+
+    def test_check_stdin_compiled(
+        self, automata_file, tmp_path, capsys, monkeypatch
+    ):
+        compiled = tmp_path / "automata.bin"
+        main(["-q", "minimize", automata_file, "--compiled", str(compiled)])
+        capsys.readouterr()
+        words = tmp_path / "words.txt"
+        words.write_text("\n".join(self.words) + "\n", encoding="utf-8")
+        with open(words, encoding="utf-8") as stdin:
+            monkeypatch.setattr("sys.stdin", stdin)
+            argv = ["-q", "check", str(compiled), "--accepted-only"]
+            assert main(argv) == 0
+        assert capsys.readouterr().out == "a\taccepted\nbaaaa\taccepted\n"
+
+    def test_pairs(self, automata_file, tmp_path, capsys):
+        pairs = tmp_path / "pairs.txt"
+        pairs.write_text("a,baaaa\na,ab\nba,a\n", encoding="utf-8")
+        assert main(["pairs", automata_file, str(pairs)]) == 0
+        captured = capsys.readouterr()
+        assert captured.out == "a,baaaa\nba,a\n"
+        assert (
+            "verified 3 pairs, 2 accepted, 6 words of 12 symbols checked"
+            in captured.err
+        )
+
+    @pytest.mark.parametrize("workers", ["1", "2"])
+    def test_non_alphabet_word(self, automata_file, tmp_path, capsys, workers):
+        words = tmp_path / "words.txt"
+        words.write_text("a\nc\nbaaaa\n", encoding="utf-8")
+        argv = ["check", automata_file, str(words), "--workers", workers]
+        assert main(argv) == 0
+        captured = capsys.readouterr()
+        assert captured.out.splitlines() == ["a\taccepted", "baaaa\taccepted"]
+        assert "line 2: word contains non-alphabet characters" in captured.err
+        assert "checked 2 words, 2 accepted" in captured.err
+
+    def test_non_alphabet_pair(self, automata_file, tmp_path, capsys):
+        pairs = tmp_path / "pairs.txt"
+        pairs.write_text("a,baaaa\n\na,c\nba,a\n", encoding="utf-8")
+        argv = ["pairs", automata_file, str(pairs), "--chunk-size", "2"]
+        assert main(argv) == 0
+        captured = capsys.readouterr()
+        assert captured.out == "a,baaaa\nba,a\n"
+        assert "line 3: word contains non-alphabet characters" in captured.err
+        assert "verified 2 pairs, 2 accepted" in captured.err
@@ -0,0 +1,144 @@
+# pylint: disable=all
+import random
+
+import pytest
+
+from pyautomata import Automata, load_compiled
+
+
+class TestCompiledAutomata:
+    def setup_method(self):
+        self.info = {
+            "name": "AUTÔMATO",
+            "states": {"q0", "q1", "q2", "q3"},
+            "alphabet": {"a", "b"},
+            "initial_state": "q0",
+            "final_states": {"q1", "q3"},
+        }
+        self.program_function = {
+            ("q0", "a"): "q1",
+            ("q0", "b"): "q2",
+            ("q1", "b"): "q2",
+            ("q2", "a"): "q3",
+            ("q2", "b"): "q2",
+            ("q3", "a"): "q3",
+            ("q3", "b"): "q2",
+        }
+        self.aut = Automata(self.program_function, **self.info)
+        self.compiled = self.aut.compile()
+
+    def test_interning(self):
+        assert self.compiled.states == ["q0", "q1", "q2", "q3"]
+        assert self.compiled.symbols == ["a", "b"]
+        assert self.compiled.initial_state == 0
+        assert [self.compiled.is_final(i) for i in range(4)] == [
+            False,
+            True,
+            False,
+            True,
+        ]
+
+    def test_table(self):
+        for (state, c), result_state in self.program_function.items():
+            i = self.compiled.states.index(state)
+            j = self.compiled.symbols.index(c)
+            assert self.compiled.states[self.compiled.table[i * 2 + j]] == (
+                result_state
+            )
+        assert self.compiled.table[1 * 2 + 0] == -1
+
+    def test_same_results_as_dict(self):
+        words = ["baaaa", "a", "aabbb", "abab", "", "ab", "aaa", "baabaaa"]
+        plain = Automata(self.program_function, **self.info)
+        for word in words:
+            assert self.aut.check_word(word) == plain.check_word(word)
+
+    def test_check_word_reject_undefined(self):
+        assert (
+            self.aut.check_word("aaa")[1]
+            == "Program ended with undefined state at state q1 with element a."
+        )
+
+    def test_check_elements_non_alphabet(self):
+        with pytest.raises(ValueError):
+            self.compiled.check_word("abc")
+        # even past the undefined transition
+        with pytest.raises(ValueError):
+            self.compiled.check_elements(["a", "a", "c"])
+        assert self.compiled.check_elements(["b", "a"]) == (
+            True,
+            ["q0", "b", "q2", "a", "q3"],
+        )
+
+    def test_trace(self):
+        assert self.compiled.trace("ba") == ["q0", "b", "q2", "a", "q3"]
+        # stops at the undefined transition
+        assert self.compiled.trace("aab") == ["q0", "a", "q1"]
+        with pytest.raises(ValueError):
+            self.compiled.trace("ac")
+
+    def test_reassign_discards_compiled(self):
+        assert self.aut.compiled is self.compiled
+        self.aut.final_states = {"q2"}
+        assert self.aut.compiled is None
+        assert self.aut.check_word("ab")[0]
+
+    def test_check_words(self):
+        words = ["baaaa", "a", "aabbb", "abab", "", "ab", "aaa", "baabaaa"]
+        results = self.aut.check_words(words)
+        assert results.tolist() == [self.aut.check_word(w)[0] for w in words]
+
+    def test_check_words_random(self):
+        rng = random.Random(7)
+        words = [
+            "".join(rng.choice("ab") for _ in range(rng.randrange(12)))
+            for _ in range(500)
+        ]
+        results = self.aut.check_words(words)
+        assert results.tolist() == [self.aut.check_word(w)[0] for w in words]
+
+    def test_check_words_multi_character(self):
+        aut = Automata(
+            {("q0", "ab"): "q1", ("q1", "a"): "q0"},
+            name="M",
+            states={"q0", "q1"},
+            alphabet={"a", "ab"},
+            initial_state="q0",
+            final_states={"q1"},
+        )
+        words = ["ab", "abaab", "aab", "", "aba"]
+        assert aut.check_words(words).tolist() == [
+            True,
+            True,
+            False,
+            False,
+            False,
+        ]
+
+    def test_check_words_non_alphabet(self):
+        with pytest.raises(ValueError):
+            self.aut.check_words(["ab", "abc"])
+
+    def test_save_and_load(self, tmp_path):
+        path = str(tmp_path / "automata.dfa")
+        self.aut.save_compiled(path)
+        loaded = load_compiled(path)
+        assert loaded.name == "AUTÔMATO"
+        assert list(loaded.states) == ["q0", "q1", "q2", "q3"]
+        assert loaded.symbols == ["a", "b"]
+        words = ["baaaa", "a", "aabbb", "abab", "", "ab", "aaa", "baabaaa"]
+        for word in words:
+            assert loaded.check_word(word) == self.aut.check_word(word)
+            assert loaded.accepts(word) == self.aut.accepts(word)
+        assert loaded.check_words(words).tolist() == [
+            self.aut.accepts(w) for w in words
+        ]
+
+    def test_load_not_compiled_file(self, tmp_path):
+        path = tmp_path / "automata.txt"
+        path.write_text("AUTÔMATO=({q0},{a},Prog,q0,{q0})\nProg\n")
+        with pytest.raises(ValueError):
+            load_compiled(str(path))
+        path.write_text("")
+        with pytest.raises(ValueError):
+            load_compiled(str(path))
@@ -0,0 +1,117 @@
+# pylint: disable=all
+import itertools
+
+from helpers import copy_info, random_description
+from pyautomata import Automata, MinimizedAutomata, equivalent
+
+
+def shortest_difference(a, b, max_length=8):
+    for length in range(max_length + 1):
+        for word in itertools.product("ab", repeat=length):
+            word = "".join(word)
+            if a.accepts(word) != b.accepts(word):
+                return word
+    return None
+
+
+class TestEquivalent:
+    def test_minimized_is_equivalent(self):
+        for seed in range(30):
+            program_function, info = random_description(seed)
+            original = Automata(dict(program_function), **copy_info(info))
+            minimized = MinimizedAutomata(
+                dict(program_function), **copy_info(info)
+            )
+            minimized.minimize()
+            assert equivalent(original, minimized) == (True, None)
+            assert equivalent(minimized, original) == (True, None)
+
+    def test_shortest_counterexample(self):
+        different = 0
+        for seed in range(60):
+            program_function, info = random_description(seed)
+            a = Automata(program_function, **info)
+            program_function, info = random_description(seed + 1000)
+            b = Automata(program_function, **info)
+            result, word = equivalent(a, b)
+            expected = shortest_difference(a, b)
+            if expected is None:
+                assert result
+                continue
+            different += 1
+            assert not result
+            assert len(word) == len(expected)
+            assert a.compiled.accepts_elements(
+                word
+            ) != b.compiled.accepts_elements(word)
+        assert different > 0
+
+    def test_undefined_is_a_sink(self):
+        info = {
+            "name": "M",
+            "states": {"q0", "q1", "q2"},
+            "alphabet": {"a", "b"},
+            "initial_state": "q0",
+            "final_states": {"q1"},
+        }
+        partial = Automata({("q0", "a"): "q1"}, **copy_info(info))
+        # the same language, with an explicit non-final sink
+        total = Automata(
+            {
+                ("q0", "a"): "q1",
+                ("q0", "b"): "q2",
+                ("q1", "a"): "q2",
+                ("q1", "b"): "q2",
+                ("q2", "a"): "q2",
+                ("q2", "b"): "q2",
+            },
+            **copy_info(info),
+        )
+        assert equivalent(partial, total) == (True, None)
+        total.final_states = {"q1", "q2"}
+        assert equivalent(partial, total) == (False, ["b"])
+
+    def test_empty_word(self):
+        info = {
+            "name": "M",
+            "states": {"q0"},
+            "alphabet": {"a"},
+            "initial_state": "q0",
+            "final_states": {"q0"},
+        }
+        a = Automata({("q0", "a"): "q0"}, **copy_info(info))
+        info["final_states"] = set()
+        b = Automata({("q0", "a"): "q0"}, **copy_info(info))
+        assert equivalent(a, b) == (False, [])
+
+    def test_different_alphabets(self):
+        info = {
+            "name": "M",
+            "states": {"q0", "q1"},
+            "alphabet": {"a"},
+            "initial_state": "q0",
+            "final_states": {"q1"},
+        }
+        a = Automata({("q0", "a"): "q1"}, **copy_info(info))
+        info["alphabet"] = {"a", "b"}
+        b = Automata({("q0", "a"): "q1"}, **copy_info(info))
+        assert equivalent(a, b) == (True, None)
+        b.program_function = {("q0", "a"): "q1", ("q0", "b"): "q1"}
+        assert equivalent(a, b) == (False, ["b"])
+
+    def test_multi_character_elements(self):
+        info = {
+            "name": "M",
+            "states": {"q0", "q1", "q2"},
+            "alphabet": {"a", "ab", "b"},
+            "initial_state": "q0",
+            "final_states": {"q2"},
+        }
+        # only the elements a then b, which as a string is the element ab
+        a = Automata({("q0", "a"): "q1", ("q1", "b"): "q2"}, **info)
+        b = Automata({}, **copy_info(info))
+        result, word = equivalent(a, b)
+        assert (result, word) == (False, ["a", "b"])
+        assert a.compiled.accepts_elements(word)
+        assert not b.compiled.accepts_elements(word)
+        assert not a.accepts("".join(word))
@@ -0,0 +1,49 @@
+# pylint: disable=all
+import itertools
+import random
+
+from pyautomata import Automata
+
+
+def random_description(
+    seed, n_states=6, alphabet=("a", "b"), density=0.8, final=0.4, name="R"
+):
+    rng = random.Random(seed)
+    states = {f"q{i}" for i in range(n_states)}
+    program_function = {
+        (f"q{i}", c): f"q{rng.randrange(n_states)}"
+        for i in range(n_states)
+        for c in alphabet
+        if rng.random() < density
+    }
+    info = {
+        "name": name,
+        "states": states,
+        "alphabet": set(alphabet),
+        "initial_state": "q0",
+        "final_states": {s for s in states if rng.random() < final},
+    }
+    return program_function, info
+
+
+def random_automata(seed, **kwargs):
+    program_function, info = random_description(seed, **kwargs)
+    return Automata(program_function, **info)
+
+
+def copy_info(info):
+    return {k: set(v) if isinstance(v, set) else v for k, v in info.items()}
+
+
+def all_words(alphabet, max_length=6):
+    for length in range(max_length + 1):
+        for word in itertools.product(sorted(alphabet), repeat=length):
+            yield "".join(word)
+
+
+def accepts(automata, word):
+    # a word with a symbol outside the alphabet is rejected
+    try:
+        return automata.accepts(word)
+    except ValueError:
+        return False
@@ -0,0 +1,51 @@
+# pylint: disable=all
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pyautomata
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# importing the core takes about 40ms, a few times that
+# leaves room for slower machines without hiding a heavy import
+IMPORT_BUDGET_US = 150_000
+HEAVY_MODULES = ("PySimpleGUI", "tkinter", "numpy", "pyautomata.gui")
+
+
+def run_python(*args):
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+class TestImports:
+    @pytest.mark.parametrize("module", ["pyautomata", "pyautomata.core"])
+    def test_core_does_not_import_gui(self, module):
+        result = run_python(
+            "-c",
+            f"import sys, {module}; print(sorted(m for m in "
+            f"{HEAVY_MODULES!r} if m in sys.modules))",
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_import_time(self):
+        result = run_python(
+            "-X", "importtime", "-c", "import pyautomata.core"
+        )
+        cumulative = {}
+        for line in result.stderr.splitlines():
+            _, _, timings = line.partition("import time:")
+            fields = [field.strip() for field in timings.split("|")]
+            if len(fields) == 3 and fields[1].isdigit():
+                cumulative[fields[2]] = int(fields[1])
+        assert cumulative["pyautomata.core"] < IMPORT_BUDGET_US
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            pyautomata.NotAThing
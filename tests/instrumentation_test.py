@@ -0,0 +1,127 @@
+# pylint: disable=all
+import pytest
+
+from pyautomata import Automata, MetricsCollector, MinimizedAutomata
+from pyautomata.core.verification import iter_check_words, verify_pairs
+
+
+def make_info(**extra):
+    return dict(
+        name="M",
+        states={"q0", "q1", "q2", "q3", "q4"},
+        alphabet={"a", "b"},
+        initial_state="q0",
+        final_states={"q1", "q2"},
+        **extra,
+    )
+
+
+PROGRAM_FUNCTION = {
+    ("q0", "a"): "q1",
+    ("q0", "b"): "q2",
+    ("q1", "a"): "q1",
+    ("q2", "a"): "q2",
+    ("q3", "a"): "q0",
+    ("q1", "b"): "q4",
+    ("q4", "a"): "q4",
+}
+
+
+class TestMetricsCollector:
+    def setup_method(self):
+        self.metrics = MetricsCollector()
+
+    def test_minimization_phases(self):
+        aut = MinimizedAutomata(
+            dict(PROGRAM_FUNCTION), **make_info(instrumentation=self.metrics)
+        )
+        aut.minimize()
+        phases = self.metrics.snapshot()["phases"]
+        assert set(phases) == {
+            "unreacheable_states",
+            "remove_unreacheable",
+            "unify_states",
+            "useless_states",
+            "remove_useless",
+        }
+        assert all(p["calls"] == 1 for p in phases.values())
+        assert all(p["seconds"] >= 0 for p in phases.values())
+        # the unreachable q3 goes away in the first removal
+        assert phases["remove_unreacheable"]["states_before"] == 5
+        assert phases["remove_unreacheable"]["states_after"] == 4
+        assert phases["unify_states"]["states_before"] == 4
+        # the last removal is of the useless q4
+        assert phases["remove_useless"]["states_before"] == 3
+        assert phases["remove_useless"]["states_after"] == len(aut.states)
+        assert phases["remove_useless"]["transitions_after"] == len(
+            aut.program_function
+        )
+
+    def test_same_result_without_instrumentation(self):
+        plain = MinimizedAutomata(dict(PROGRAM_FUNCTION), **make_info())
+        plain.minimize()
+        measured = MinimizedAutomata(
+            dict(PROGRAM_FUNCTION), **make_info(instrumentation=self.metrics)
+        )
+        measured.minimize()
+        assert plain.states == measured.states
+        assert plain.program_function == measured.program_function
+
+    @pytest.mark.parametrize("compile", [False, True])
+    def test_words_checked(self, compile):
+        aut = Automata(
+            dict(PROGRAM_FUNCTION), **make_info(instrumentation=self.metrics)
+        )
+        if compile:
+            aut.compile()
+        assert aut.check_word("aa")[0]
+        assert not aut.accepts("ab")
+        assert aut.check_words(["a", "ba", ""]).tolist() == [
+            True,
+            True,
+            False,
+        ]
+        snapshot = self.metrics.snapshot()
+        assert snapshot["words"] == 5
+        assert snapshot["symbols"] == 7
+
+    def test_check_words_multi_character(self):
+        aut = Automata(
+            {("q0", "ab"): "q1", ("q1", "a"): "q0"},
+            name="M",
+            states={"q0", "q1"},
+            alphabet={"a", "ab"},
+            initial_state="q0",
+            final_states={"q1"},
+            instrumentation=self.metrics,
+        )
+        aut.check_words(["ab", "abaab", "aab"])
+        snapshot = self.metrics.snapshot()
+        assert snapshot["words"] == 3
+        assert snapshot["symbols"] == 6
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_verification(self, workers):
+        aut = Automata(
+            dict(PROGRAM_FUNCTION), **make_info(instrumentation=self.metrics)
+        )
+        words = ["a", "ab", "c", "ba"]
+        list(iter_check_words(aut, words, workers, chunk_size=2))
+        assert self.metrics.snapshot()["words"] == 3
+        assert self.metrics.snapshot()["symbols"] == 5
+        self.metrics.reset()
+        # the second word isn't checked when the first is rejected
+        pairs = [("a", "ba"), ("ab", "a")]
+        verify_pairs(aut.compile(), pairs, workers, 1, self.metrics)
+        assert self.metrics.snapshot()["words"] == 3
+        assert self.metrics.snapshot()["symbols"] == 5
+
+    def test_reset(self):
+        self.metrics.words_checked(2, 10)
+        self.metrics.phase("unify_states", 0.5, (4, 8), (2, 4))
+        self.metrics.reset()
+        assert self.metrics.snapshot() == {
+            "phases": {},
+            "words": 0,
+            "symbols": 0,
+        }
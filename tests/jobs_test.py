@@ -0,0 +1,114 @@
+# pylint: disable=all
+import pytest
+
+from pyautomata import MinimizationCache
+from pyautomata.gui import jobs
+
+AUTOMATA = """M=({q0,q1,q2,q3},{a,b},Prog,q0,{q1,q3})
+Prog
+(q0,a)=q1
+(q0,b)=q2
+(q1,b)=q2
+(q2,a)=q3
+(q2,b)=q2
+(q3,a)=q3
+(q3,b)=q2
+"""
+
+
+class TestJobs:
+    def setup_method(self):
+        self.events = []
+
+    def post(self, event, value):
+        self.events.append((event, value))
+
+    def run(self, task, *args, cancel=False):
+        job = jobs.Job(self.post)
+        if cancel:
+            job.cancel()
+        job.start(task, *args)
+        job.join(10)
+        assert not job.running
+        return self.events[-1]
+
+    @pytest.fixture
+    def automata_file(self, tmp_path):
+        path = tmp_path / "automata.txt"
+        path.write_text(AUTOMATA, encoding="utf-8")
+        return str(path)
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return MinimizationCache(str(tmp_path / "cache"))
+
+    def load(self, automata_file, cache):
+        event, automata = self.run(jobs.load_automata, automata_file, cache)
+        assert event == jobs.AUTOMATA_DONE_EVENT
+        return automata
+
+    def test_load_automata(self, automata_file, cache):
+        automata = self.load(automata_file, cache)
+        assert automata.compiled is not None
+        assert automata.instrumentation is None
+        progress = [v for e, v in self.events if e == jobs.PROGRESS_EVENT]
+        fractions = [fraction for fraction, _ in progress]
+        assert fractions == sorted(fractions)
+        assert fractions[-1] == 1.0
+        # one event per minimization step
+        assert sum("Minimizing (" in m for _, m in progress) == 5
+
+    def test_load_malformed(self, tmp_path, cache):
+        path = tmp_path / "bad.txt"
+        path.write_text("not an automata\n", encoding="utf-8")
+        assert self.run(jobs.load_automata, str(path), cache) == (
+            jobs.JOB_FAILED_EVENT,
+            jobs.FORMAT_ERROR,
+        )
+
+    def test_unexpected_error(self):
+        def task(job):
+            raise TypeError("bug")
+
+        event, message = self.run(task)
+        assert event == jobs.JOB_FAILED_EVENT
+        assert "TypeError" in message
+
+    def test_cancel_load(self, automata_file, cache):
+        assert self.run(
+            jobs.load_automata, automata_file, cache, cancel=True
+        ) == (jobs.JOB_CANCELLED_EVENT, None)
+
+    def test_check_pairs(self, automata_file, cache, tmp_path, monkeypatch):
+        automata = self.load(automata_file, cache)
+        path = tmp_path / "pairs.txt"
+        path.write_text("a,baaaa\na,ab\nba,a\n" * 5, encoding="utf-8")
+        monkeypatch.setattr(jobs, "PROGRESS_EVERY", 4)
+        self.events.clear()
+        assert self.run(jobs.check_pairs, automata, str(path)) == (
+            jobs.PAIRS_DONE_EVENT,
+            10,
+        )
+        found = [v for e, v in self.events if e == jobs.PAIRS_FOUND_EVENT]
+        # batches of 4 pairs, the last with the 3 left over
+        assert len(found) == 4
+        assert sum(found, []) == [("a", "baaaa"), ("ba", "a")] * 5
+        assert sum(e == jobs.PROGRESS_EVENT for e, _ in self.events) == 6
+
+    def test_check_pairs_non_alphabet(self, automata_file, cache, tmp_path):
+        automata = self.load(automata_file, cache)
+        path = tmp_path / "pairs.txt"
+        path.write_text("a,c\n", encoding="utf-8")
+        event, _ = self.run(jobs.check_pairs, automata, str(path))
+        assert event == jobs.JOB_FAILED_EVENT
+
+    def test_cancel_check_pairs(
+        self, automata_file, cache, tmp_path, monkeypatch
+    ):
+        automata = self.load(automata_file, cache)
+        path = tmp_path / "pairs.txt"
+        path.write_text("a,baaaa\n" * 10, encoding="utf-8")
+        monkeypatch.setattr(jobs, "PROGRESS_EVERY", 2)
+        assert self.run(
+            jobs.check_pairs, automata, str(path), cancel=True
+        ) == (jobs.JOB_CANCELLED_EVENT, None)
@@ -1,5 +1,15 @@
 # pylint: disable-all
-from pyautomata import MinimizedAutomata
+import random
+
+import pytest
+
+from helpers import copy_info, random_description
+from pyautomata import MinimizedAutomata, equivalent
+from pyautomata.core import minimization
+from pyautomata.core.minimization import TablePair
+
+# bigger than the helper's default, with fewer final states
+RANDOM = {"n_states": 12, "final": 0.3}
 
 
 class TestMinimizedAutomata:
@@ -50,6 +60,26 @@ class TestMinimizedAutomata:
             ("q7", "b"): "q2",
         }
 
+    def test_remove_states_in_place(self):
+        program_function = self.aut.program_function
+        self.aut.remove_states({"q3", "q6"})
+        assert self.aut.program_function is program_function
+        assert ("q5", "b") not in program_function
+        assert ("q3", "a") not in program_function
+        assert "q6" not in self.aut.states
+
+    def test_reverse_transitions(self):
+        reverse = self.aut.reverse_transitions()
+        assert sorted(reverse["q2"]) == ["q1", "q2", "q3", "q5", "q7"]
+        assert "q3" not in reverse
+
+    def test_useless_states(self):
+        assert self.aut.useless_states() == set()
+        self.aut.program_function[("q8", "a")] = "q9"
+        self.aut.program_function[("q9", "a")] = "q8"
+        self.aut.states.update({"q8", "q9"})
+        assert self.aut.useless_states() == {"q8", "q9"}
+
     def test_hopcroft_alogrithm(self):
         # this does not test removal of unreachable states
         # hence the inclusion of q3
@@ -99,3 +129,320 @@ class TestMinimizedAutomata:
             ("q5", "b"): "q6",
             ("q6", "b"): "q0q4",
         }
+
+    def test_short_naming(self):
+        aut = MinimizedAutomata(
+            self.program_function, naming="short", **self.info
+        )
+        aut.minimize()
+        assert aut.program_function == {
+            ("m0", "a"): "m1",
+            ("m0", "b"): "m3",
+            ("m1", "a"): "m4",
+            ("m1", "b"): "m2",
+            ("m2", "a"): "m0",
+            ("m2", "b"): "m2",
+            ("m3", "a"): "m2",
+            ("m3", "b"): "m4",
+            ("m4", "b"): "m0",
+        }
+        assert aut.initial_state == "m0"
+        assert aut.final_states == {"m2"}
+        assert aut.merged_states() == {
+            "m0": ["q0", "q4"],
+            "m1": ["q1", "q7"],
+            "m2": ["q2"],
+            "m3": ["q5"],
+            "m4": ["q6"],
+        }
+
+    def test_merged_states(self):
+        assert self.aut.merged_states() == {}
+        self.aut.minimize()
+        merged = self.aut.merged_states()
+        assert set(merged) == self.aut.states
+        assert merged["q0q4"] == ["q0", "q4"]
+
+    def test_merged_states_across_minimizations(self):
+        aut = MinimizedAutomata(
+            self.program_function, naming="short", **self.info
+        )
+        aut.minimize()
+        aut.naming = "concatenate"
+        aut.minimize()
+        assert aut.merged_states()["m0"] == ["q0", "q4"]
+
+    def test_unknown_naming(self):
+        with pytest.raises(ValueError):
+            MinimizedAutomata(
+                self.program_function, naming="long", **self.info
+            )
+
+    def test_hopcroft_algorithm_includes_undefined(self):
+        sets = self.aut.hopcroft_algorithm()
+        assert frozenset({"Undefined"}) in sets
+        assert frozenset({"q0", "q4"}) in sets
+
+    def test_unknown_algorithm(self):
+        with pytest.raises(ValueError):
+            self.aut.minimize(algorithm="brzozowski")
+
+    def test_class_of_three_states(self):
+        program_function = {
+            ("q0", "a"): "q1",
+            ("q1", "a"): "q2",
+            ("q2", "a"): "q3",
+            ("q3", "a"): "q3",
+        }
+        info = {
+            "name": "M",
+            "states": {"q0", "q1", "q2", "q3"},
+            "alphabet": {"a"},
+            "initial_state": "q0",
+            "final_states": {"q1", "q2", "q3"},
+        }
+        for algorithm in ("hopcroft", "table_filling"):
+            aut = MinimizedAutomata(dict(program_function), **copy_info(info))
+            aut.minimize(algorithm=algorithm)
+            assert aut.program_function == {
+                ("q0", "a"): "q1q2q3",
+                ("q1q2q3", "a"): "q1q2q3",
+            }
+
+    def test_hopcroft_matches_table_filling(self):
+        for seed in range(40):
+            program_function, info = random_description(seed, **RANDOM)
+            hopcroft = MinimizedAutomata(
+                dict(program_function), **copy_info(info)
+            )
+            table_filling = MinimizedAutomata(
+                dict(program_function), **copy_info(info)
+            )
+            assert (
+                hopcroft.hopcroft_algorithm()
+                == table_filling.table_filling_algorithm()
+            )
+
+    def test_minimize_matches_table_filling(self):
+        for seed in range(40):
+            program_function, info = random_description(
+                seed, density=0.6, **RANDOM
+            )
+            hopcroft = MinimizedAutomata(
+                dict(program_function), **copy_info(info)
+            )
+            table_filling = MinimizedAutomata(
+                dict(program_function), **copy_info(info)
+            )
+            hopcroft.minimize(algorithm="hopcroft")
+            table_filling.minimize(algorithm="table_filling")
+            assert hopcroft.program_function == table_filling.program_function
+            assert hopcroft.states == table_filling.states
+            assert hopcroft.final_states == table_filling.final_states
+            assert hopcroft.initial_state == table_filling.initial_state
+
+
+class TestPackedTableFilling:
+    def test_matches_hopcroft(self):
+        for seed in range(40):
+            program_function, info = random_description(
+                seed, n_states=15, final=0.3
+            )
+            aut = MinimizedAutomata(program_function, **info)
+            assert (
+                aut.packed_table_filling_algorithm()
+                == aut.hopcroft_algorithm()
+            )
+
+    def test_minimize(self):
+        program_function, info = random_description(5, density=0.6, **RANDOM)
+        packed = MinimizedAutomata(dict(program_function), **copy_info(info))
+        hopcroft = MinimizedAutomata(dict(program_function), **copy_info(info))
+        packed.minimize(algorithm="packed_table_filling")
+        hopcroft.minimize()
+        assert packed.program_function == hopcroft.program_function
+
+    def test_table_pair_is_compact(self):
+        pair = TablePair("q0", "q1")
+        assert not hasattr(pair, "__dict__")
+        assert pair._dependicies is None
+        pair.dependicies.add(TablePair("q1", "q2"))
+        MinimizedAutomata.mark_as_distinguishable(pair)
+        assert pair._dependicies is None
+
+    def test_long_dependency_chain(self):
+        pairs = [TablePair(f"p{i}", f"r{i}") for i in range(5000)]
+        for pair, dependent in zip(pairs, pairs[1:]):
+            pair.dependicies.add(dependent)
+        MinimizedAutomata.mark_as_distinguishable(pairs[0])
+        assert all(pair.distinguishable for pair in pairs)
+
+
+class TestIncrementalEdits:
+    @pytest.fixture(autouse=True)
+    def always_incremental(self, monkeypatch):
+        # these automata are small enough that every edit
+        # would otherwise touch too many states
+        monkeypatch.setattr(minimization, "INCREMENTAL_SHARE", 1.0)
+
+    def setup_method(self):
+        self.program_function = {
+            ("q0", "a"): "q1",
+            ("q0", "b"): "q2",
+            ("q1", "a"): "q3",
+            ("q2", "a"): "q3",
+        }
+        self.info = {
+            "name": "E",
+            "states": {"q0", "q1", "q2", "q3"},
+            "alphabet": {"a", "b"},
+            "initial_state": "q0",
+            "final_states": {"q3"},
+        }
+        self.aut = MinimizedAutomata(self.program_function, **self.info)
+        self.aut.minimize()
+
+    def reference(self, aut):
+        fresh = MinimizedAutomata(
+            dict(aut.program_function),
+            name=aut.name,
+            states=set(aut.states),
+            alphabet=set(aut.alphabet),
+            initial_state=aut.initial_state,
+            final_states=set(aut.final_states),
+        )
+        fresh.minimize()
+        return fresh
+
+    def assert_minimal(self, aut, edit):
+        before = self.reference(aut)
+        edit(before)
+        expected = self.reference(before)
+        edit(aut)
+        assert len(aut.states) == len(expected.states)
+        assert len(aut.program_function) == len(expected.program_function)
+        if expected.states:
+            assert equivalent(aut, expected)[0]
+
+    def test_add_transition_merges(self):
+        self.aut.add_transition("q1q2", "b", "q3")
+        assert self.aut.states == {"q0", "q1q2", "q3"}
+        assert self.aut.accepts("ab")
+        self.aut.add_transition("q0", "a", "q3")
+        assert self.aut.states == {"q0", "q1q2", "q3"}
+        # q0 now reads a and b into q3, like q1q2 does
+        self.aut.add_transition("q0", "b", "q3")
+        assert self.aut.states == {"q1q2", "q3"}
+        assert self.aut.initial_state == "q1q2"
+        assert self.aut.merged_states()["q1q2"] == ["q0", "q1", "q2"]
+
+    def test_remove_transition_splits(self):
+        self.aut.remove_transition("q1q2", "a")
+        # nothing is accepted anymore
+        assert self.aut.states == set()
+        assert self.aut.program_function == {}
+
+    def test_set_final(self):
+        self.aut.set_final("q0")
+        assert self.aut.accepts("")
+        assert self.aut.accepts("aa")
+        self.aut.set_final("q0", False)
+        assert not self.aut.accepts("")
+        assert self.aut.states == {"q0", "q1q2", "q3"}
+
+    def test_unreachable_states_removed(self):
+        self.aut.add_transition("q0", "a", "q3")
+        self.aut.add_transition("q0", "b", "q3")
+        assert self.aut.states == {"q0", "q3"}
+        assert set(self.aut.merged_states()) == {"q0", "q3"}
+
+    def test_merged_states(self):
+        self.aut.add_transition("q3", "a", "q3")
+        self.aut.set_final("q1q2")
+        # every state but q0 now accepts a*
+        # an edited state equivalent to an unchanged one takes its name
+        assert self.aut.merged_states() == {
+            "q0": ["q0"],
+            "q3": ["q1", "q2", "q3"],
+        }
+
+    def test_short_naming(self):
+        aut = MinimizedAutomata(
+            self.program_function, naming="short", **self.info
+        )
+        aut.minimize()
+        assert aut.states == {"m0", "m1", "m2"}
+        aut.add_transition("m2", "a", "m1")
+        aut.set_final("m1")
+        # m1 and m2 are now one state
+        assert aut.states == {"m0", "m1"}
+        assert aut.merged_states()["m1"] == ["q1", "q2", "q3"]
+
+    def test_large_edit_minimizes(self, monkeypatch):
+        monkeypatch.setattr(minimization, "INCREMENTAL_SHARE", 0.0)
+        self.aut.add_transition("q3", "a", "q3")
+        self.aut.set_final("q1q2")
+        # named the way minimize names it
+        assert self.aut.states == {"q0", "q1q2q3"}
+        assert self.aut._incremental is None
+
+    def test_compiled_is_refreshed(self):
+        self.aut.compile()
+        self.aut.set_final("q0")
+        assert self.aut.compiled is None
+        assert self.aut.accepts("")
+
+    def test_unknown_edits(self):
+        with pytest.raises(ValueError):
+            self.aut.add_transition("q9", "a", "q0")
+        with pytest.raises(ValueError):
+            self.aut.add_transition("q0", "c", "q0")
+        with pytest.raises(ValueError):
+            self.aut.remove_transition("q3", "a")
+        with pytest.raises(ValueError):
+            self.aut.set_final("q9")
+
+    def test_not_minimal_minimizes(self):
+        aut = MinimizedAutomata(self.program_function, **self.info)
+        aut.add_transition("q3", "a", "q3")
+        assert aut.states == {"q0", "q1q2", "q3"}
+
+    def test_reassigned_definition_minimizes(self):
+        self.aut.final_states = {"q3", "q0"}
+        self.aut.add_transition("q3", "b", "q3")
+        assert self.aut.states == {"q0", "q1q2", "q3"}
+        assert self.aut.accepts("")
+
+    def test_random_edits(self):
+        for seed in range(60):
+            rng = random.Random(seed)
+            program_function, info = random_description(
+                seed, density=0.7, **RANDOM
+            )
+            aut = MinimizedAutomata(program_function, **info)
+            aut.minimize()
+            for _ in range(15):
+                if not aut.states:
+                    break
+                states = sorted(aut.states)
+                state = rng.choice(states)
+                c = rng.choice(sorted(aut.alphabet))
+                kind = rng.random()
+                if kind < 0.5:
+                    target = rng.choice(states)
+
+                    def edit(a):
+                        a.add_transition(state, c, target)
+
+                elif kind < 0.75 and (state, c) in aut.program_function:
+
+                    def edit(a):
+                        a.remove_transition(state, c)
+
+                else:
+                    final = state not in aut.final_states
+
+                    def edit(a):
+                        a.set_final(state, final)
+
+                self.assert_minimal(aut, edit)
@@ -0,0 +1,39 @@
+# pylint: disable=all
+from pyautomata.gui.pages import PairPages
+
+
+class TestPairPages:
+    def setup_method(self):
+        self.pages = PairPages(page_size=3)
+        self.pairs = [(f"a{i}", f"b{i}") for i in range(7)]
+
+    def test_empty(self):
+        assert self.pages.page_count == 1
+        assert self.pages.rows() == []
+        assert self.pages.describe() == "Page 1 of 1 (0 pairs)"
+
+    def test_rows_of_the_current_page(self):
+        self.pages.extend(self.pairs)
+        assert self.pages.page_count == 3
+        assert self.pages.rows() == [["a0", "b0"], ["a1", "b1"], ["a2", "b2"]]
+        self.pages.next()
+        self.pages.next()
+        assert self.pages.rows() == [["a6", "b6"]]
+        assert self.pages.describe() == "Page 3 of 3 (7 pairs)"
+
+    def test_moves_are_clamped(self):
+        self.pages.extend(self.pairs)
+        self.pages.previous()
+        assert self.pages.page == 0
+        self.pages.go_to(10)
+        assert self.pages.page == 2
+
+    def test_extend_tells_if_the_page_changed(self):
+        assert self.pages.extend(self.pairs[:2])
+        # fills the first page
+        assert self.pages.extend(self.pairs[2:4])
+        # the first page was already full
+        assert not self.pages.extend(self.pairs[4:])
+        self.pages.go_to(2)
+        assert self.pages.extend([("x", "y")])
+        assert self.pages.rows() == [["a6", "b6"], ["x", "y"]]
@@ -0,0 +1,89 @@
+# pylint: disable=all
+import pytest
+
+from helpers import accepts, all_words, random_automata
+from pyautomata import Automata, MinimizedAutomata, ProductAutomata
+
+
+EXPECTED = {
+    "intersection": lambda a, b: a and b,
+    "union": lambda a, b: a or b,
+    "difference": lambda a, b: a and not b,
+}
+
+
+class TestProductAutomata:
+    def setup_method(self):
+        self.a = random_automata(1, name="A")
+        self.b = random_automata(2, name="B")
+
+    @pytest.mark.parametrize("operation", sorted(EXPECTED))
+    def test_operations(self, operation):
+        for seed in range(10):
+            a = random_automata(seed, name="A")
+            b = random_automata(seed + 100, name="B")
+            product = getattr(a, operation)(b)
+            for word in all_words({"a", "b"}):
+                assert product.accepts(word) == EXPECTED[operation](
+                    a.accepts(word), b.accepts(word)
+                )
+
+    def test_complement(self):
+        complement = self.a.complement()
+        for word in all_words({"a", "b"}):
+            assert complement.accepts(word) != self.a.accepts(word)
+
+    def test_different_alphabets(self):
+        b = random_automata(3, alphabet=("b", "c"), name="B")
+        union = self.a.union(b)
+        for word in all_words({"a", "b", "c"}, max_length=4):
+            assert union.accepts(word) == (
+                accepts(self.a, word) or accepts(b, word)
+            )
+        with pytest.raises(ValueError):
+            union.accepts("d")
+
+    def test_states_made_lazily(self):
+        product = self.a.intersection(self.b)
+        assert len(product) == 1
+        product.accepts("a")
+        assert len(product) <= 2
+        made = len(product)
+        product.accepts("a")
+        assert len(product) == made
+
+    def test_dead_state_stops_early(self):
+        a = Automata(
+            {("q0", "a"): "q0"},
+            name="A",
+            states={"q0"},
+            alphabet={"a", "b"},
+            initial_state="q0",
+            final_states={"q0"},
+        )
+        product = a.intersection(a)
+        assert not product.accepts("b" + "a" * 1000)
+        # the initial state and the dead one
+        assert len(product) == 2
+
+    @pytest.mark.parametrize("operation", sorted(EXPECTED))
+    def test_materialize(self, operation):
+        product = getattr(self.a, operation)(self.b)
+        for minimize in (False, True):
+            materialized = product.materialize(minimize=minimize)
+            assert isinstance(materialized, MinimizedAutomata)
+            for word in all_words({"a", "b"}):
+                assert accepts(materialized, word) == product.accepts(word)
+
+    def test_materialize_names(self):
+        materialized = self.a.union(self.b).materialize(minimize=False)
+        assert materialized.initial_state == "p0"
+        assert materialized.states == {
+            f"p{i}" for i in range(len(materialized.states))
+        }
+
+    def test_unknown_operation(self):
+        with pytest.raises(ValueError):
+            ProductAutomata([self.a, self.b], "xor")
+        with pytest.raises(ValueError):
+            ProductAutomata([self.a], "union")
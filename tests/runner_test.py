@@ -0,0 +1,87 @@
+# pylint: disable=all
+import random
+
+import pytest
+
+from pyautomata import Automata
+
+
+class TestAutomataRunner:
+    def setup_method(self):
+        self.aut = Automata(
+            {
+                ("q0", "a"): "q1",
+                ("q0", "ab"): "q2",
+                ("q1", "b"): "q0",
+                ("q2", "a"): "q2",
+                ("q2", "ab"): "q0",
+                ("q2", "b"): "q1",
+            },
+            name="M",
+            states={"q0", "q1", "q2"},
+            alphabet={"a", "ab", "b"},
+            initial_state="q0",
+            final_states={"q2"},
+        )
+
+    def feed_in_chunks(self, word, sizes):
+        runner = self.aut.runner()
+        position = 0
+        for size in sizes:
+            runner.feed(word[position : position + size])
+            position += size
+        runner.feed(word[position:])
+        return runner
+
+    def test_matches_check_word(self):
+        rng = random.Random(11)
+        for _ in range(300):
+            word = "".join(rng.choice("ab") for _ in range(rng.randrange(10)))
+            sizes = [rng.randrange(4) for _ in range(rng.randrange(5))]
+            runner = self.feed_in_chunks(word, sizes)
+            assert runner.is_accepting == self.aut.accepts(word)
+
+    def test_element_split_between_chunks(self):
+        runner = self.aut.runner()
+        runner.feed("a")
+        assert runner.state == "q0"
+        assert runner.pending == "a"
+        runner.feed("b")
+        assert runner.pending == ""
+        assert runner.state == "q2"
+        assert runner.is_accepting
+        runner.feed("a")
+        assert runner.pending == "a"
+        assert runner.is_accepting
+
+    def test_undefined_and_reset(self):
+        runner = self.aut.runner()
+        runner.feed("aaaa")
+        assert runner.state is None
+        assert not runner.is_accepting
+        runner.reset()
+        assert runner.state == "q0"
+        runner.feed("ab")
+        assert runner.is_accepting
+
+    def test_non_alphabet(self):
+        runner = self.aut.runner()
+        with pytest.raises(ValueError):
+            runner.feed("abcab")
+
+    def test_single_character(self):
+        aut = Automata(
+            {("q0", "a"): "q1", ("q1", "a"): "q0"},
+            name="M",
+            states={"q0", "q1"},
+            alphabet={"a"},
+            initial_state="q0",
+            final_states={"q1"},
+        )
+        runner = aut.runner()
+        for _ in range(5):
+            runner.feed("a")
+        assert runner.is_accepting
+        assert runner.pending == ""
+        with pytest.raises(ValueError):
+            runner.feed("ab")
@@ -0,0 +1,47 @@
+# pylint: disable=all
+import pytest
+
+from pyautomata import Automata
+from pyautomata.core.tokenizer import Tokenizer
+
+
+class TestTokenizer:
+    def test_single_character(self):
+        t = Tokenizer({"a", "b"})
+        assert t.single_character
+        assert t.tokenize("abba") == ["a", "b", "b", "a"]
+        assert t.tokenize("") == []
+        with pytest.raises(ValueError):
+            t.tokenize("abc")
+
+    def test_longest_match(self):
+        t = Tokenizer({"a", "ab", "b"})
+        assert not t.single_character
+        assert t.tokenize("aab") == ["a", "ab"]
+        assert t.tokenize("abba") == ["ab", "b", "a"]
+
+    def test_escaped_symbols(self):
+        t = Tokenizer({"a.", "*"})
+        assert t.tokenize("a.*a.") == ["a.", "*", "a."]
+        with pytest.raises(ValueError):
+            t.tokenize("ab")
+
+    def test_non_alphabet_gap(self):
+        t = Tokenizer({"ab", "c"})
+        with pytest.raises(ValueError):
+            t.tokenize("abxc")
+        with pytest.raises(ValueError):
+            t.tokenize("abca")
+
+    def test_automata_rebuilds_on_new_alphabet(self):
+        aut = Automata(
+            {},
+            name="M",
+            states={"q0"},
+            alphabet={"a"},
+            initial_state="q0",
+            final_states=set(),
+        )
+        assert aut.break_word("aa") == ["a", "a"]
+        aut.alphabet = {"a", "aa"}
+        assert aut.break_word("aa") == ["aa"]
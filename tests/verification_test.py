@@ -0,0 +1,100 @@
+# pylint: disable=all
+import io
+import random
+
+import pytest
+
+from pyautomata import Automata, WordFileParser
+from pyautomata.core.verification import (
+    accepted_pairs,
+    iter_check_words,
+    iter_verify_pairs,
+    verify_pairs,
+    write_accepted_pairs,
+)
+
+
+class TestVerification:
+    def setup_method(self):
+        self.aut = Automata(
+            {
+                ("q0", "a"): "q1",
+                ("q0", "b"): "q2",
+                ("q1", "b"): "q2",
+                ("q2", "a"): "q3",
+                ("q2", "b"): "q2",
+                ("q3", "a"): "q3",
+                ("q3", "b"): "q2",
+            },
+            name="AUTÔMATO",
+            states={"q0", "q1", "q2", "q3"},
+            alphabet={"a", "b"},
+            initial_state="q0",
+            final_states={"q1", "q3"},
+        )
+        self.pairs = [("a", "baaaa"), ("a", "ab"), ("aab", "a"), ("ba", "a")]
+
+    def test_accepted_pairs(self):
+        assert list(accepted_pairs(self.aut, self.pairs)) == [
+            ("a", "baaaa"),
+            ("ba", "a"),
+        ]
+
+    def test_accepted_pairs_is_lazy(self):
+        def pairs():
+            yield ("a", "a")
+            raise AssertionError("consumed too far")
+
+        assert next(accepted_pairs(self.aut, pairs())) == ("a", "a")
+
+    def test_write_accepted_pairs(self, tmp_path):
+        path = tmp_path / "pairs.txt"
+        path.write_text("a,baaaa\na,ab\nba,a\n", encoding="utf-8")
+        output = io.StringIO()
+        wfp = WordFileParser(file_name=str(path))
+        assert write_accepted_pairs(self.aut, wfp.iter_parse(), output) == 2
+        assert output.getvalue() == "a,baaaa\nba,a\n"
+
+    def test_non_alphabet_word(self):
+        with pytest.raises(ValueError):
+            list(accepted_pairs(self.aut, [("c", "a")]))
+
+    def test_verify_pairs_non_alphabet(self):
+        with pytest.raises(ValueError):
+            verify_pairs(self.aut, [("a", "a"), ("c", "a")], workers=1)
+        pairs = [("a", "a"), ("a", "c"), ("ba", "a")]
+        assert list(iter_verify_pairs(self.aut, pairs, workers=1)) == [
+            (("a", "a"), True),
+            (("a", "c"), None),
+            (("ba", "a"), True),
+        ]
+        words = ["a", "c", "ab"]
+        assert list(iter_check_words(self.aut, words, workers=1)) == [
+            ("a", True),
+            ("c", None),
+            ("ab", False),
+        ]
+
+    def test_verify_pairs_serial(self):
+        assert verify_pairs(self.aut, self.pairs, workers=1) == [
+            True,
+            False,
+            False,
+            True,
+        ]
+
+    def test_verify_pairs_parallel(self):
+        rng = random.Random(3)
+        words = [
+            "".join(rng.choice("ab") for _ in range(rng.randrange(8)))
+            for _ in range(200)
+        ]
+        pairs = list(zip(words, reversed(words)))
+        expected = [
+            self.aut.check_word(w1)[0] and self.aut.check_word(w2)[0]
+            for w1, w2 in pairs
+        ]
+        assert (
+            verify_pairs(self.aut, iter(pairs), workers=2, chunk_size=7)
+            == expected
+        )
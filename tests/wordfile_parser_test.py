@@ -35,3 +35,31 @@ class TestWordFileParser():
             WordFileParser(file_name=None)
         with pytest.raises(ValueError):
             WordFileParser(content=None)
+
+    def test_iter_parse_content(self):
+        assert list(self.p.iter_parse()) == self.word_pairs
+
+    def test_iter_parse_file(self, tmp_path):
+        path = tmp_path / "words.txt"
+        path.write_text(self.content, encoding="utf-8")
+        p = WordFileParser(file_name=str(path))
+        pairs = p.iter_parse()
+        assert next(pairs) == self.word_pairs[0]
+        assert list(pairs) == self.word_pairs[1:]
+        assert p.parse() == self.word_pairs
+
+    def test_iter_parse_empty_file(self, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.write_text("", encoding="utf-8")
+        assert list(WordFileParser(file_name=str(path)).iter_parse()) == []
+
+    def test_iter_parse_lines(self, tmp_path):
+        content = "a,b\n\nc,d e,f\n"
+        expected = [(1, ("a", "b")), (3, ("c", "d")), (3, ("e", "f"))]
+        assert list(WordFileParser(content=content).iter_parse_lines()) == (
+            expected
+        )
+        path = tmp_path / "words.txt"
+        path.write_text(content, encoding="utf-8")
+        p = WordFileParser(file_name=str(path))
+        assert list(p.iter_parse_lines()) == expected